@@ -1,19 +1,27 @@
 # ai/create_ai_prompt.py
-import json
 from eda_core.utils.logger_utils import setup_logger
+from ai.prompt_budget import PROMPT_TOKEN_BUDGET, build_table_prompt, estimate_tokens
 
 logger = setup_logger("create_ai_prompt")
 
-def create_ai_prompt(profile_data: list[dict], tone: str = "neutral") -> str:
+def create_ai_prompt(profile_data: list[dict], tone: str = "neutral", table_summary: dict | None = None,
+                     token_budget: int = PROMPT_TOKEN_BUDGET) -> str:
     """
     📘 Function: create_ai_prompt
 
     Description:
         Converts profiling results into a natural language prompt for LLMs.
+        Column profiles are encoded as a compact CSV table (rounded floats,
+        no plot/hash/bulk fields) instead of indented JSON. If the prompt
+        would exceed `token_budget`, the most anomalous columns are kept
+        (see ai.prompt_budget.build_table_prompt; for map-reduce over very
+        wide tables use generate_ai_insight.prepare_table_prompt).
 
     Parameters:
         profile_data (list[dict]): Output from column_report()
         tone (str): Optional tone ('neutral', 'casual', 'executive', etc.)
+        table_summary (dict | None): Output from table_summary()
+        token_budget (int): Maximum estimated prompt tokens.
 
     Returns:
         str: The full prompt ready to send to LLM
@@ -21,36 +29,9 @@ def create_ai_prompt(profile_data: list[dict], tone: str = "neutral") -> str:
     logger.info("🧠 Entering create_ai_prompt()")
 
     try:
-        # print('======================================')
-        # print('======================================')
-        # print(f'profile_data : {profile_data}')
-        # print('======================================')
-        
-        profile_json = json.dumps(profile_data, indent=2)
-        
-        # print('======================================')
-        # print(f'profile_json : {profile_json}')
-        # print('======================================')
-        # print('======================================')
-
-        prompt = f"""
-You are a smart data analyst AI assistant.
-
-Tone: {tone}
-
-The user uploaded a dataset, and the following is the profiling summary for each column.
-Your job is to:
-1. Give 3–5 short but deep insights about this data
-2. Mention if there's anything odd, missing, or worth investigating
-3. Suggest next steps for the user (e.g. visualization, cleaning, validation)
-
-Output should be plain English, easy to understand, and structured.
-
-DATA PROFILE JSON:
-{profile_json}
-        """.strip()
-
-        logger.info("✅ Prompt successfully created")
+        prompt = build_table_prompt(table_summary, profile_data, token_budget=token_budget, tone=tone)
+
+        logger.info(f"✅ Prompt successfully created (~{estimate_tokens(prompt)} tokens)")
         return prompt
 
     except Exception as e:
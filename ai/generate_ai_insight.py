@@ -1,28 +1,17 @@
 # ai/generate_ai_insight.py
-# import json
-# import pandas as pd
-from eda_core.io.load_excel import load_excel
-from eda_core.validation.validate_schema import validate_schema
-from eda_core.transform.infer_dtypes import infer_dtypes
-from eda_core.profile.column_report import column_report
-from ai.llm_client import query_model  # to be created
-from eda_core.utils.logger_utils import setup_logger
+import json
+from concurrent.futures import ThreadPoolExecutor
 from ai.create_ai_prompt import create_ai_prompt
-
-import time
-
-
-
-logger = setup_logger("generate_ai_insight")
-
-
-# ai/generate_ai_insight.py
-
-from ai.llm_client import query_model
+from ai.llm_client import StreamMetrics, is_error_response, query_model, query_model_stream
+from ai.prompt_budget import PROMPT_TOKEN_BUDGET, build_map_prompts, build_reduce_prompt, estimate_tokens
+from ai.rate_limiter import TokenBucket
+from eda_core.io.save_output import get_insight_stream_path
+from eda_core.utils.instrument import bind
 from eda_core.utils.logger_utils import setup_logger
 
 logger = setup_logger("generate_ai_insight")
 
+
 def generate_ai_insight(prompt: str, model: str = "ollama") -> dict:
     """
     ✨ Generates insights using the provided AI prompt.
@@ -51,48 +40,306 @@ def generate_ai_insight(prompt: str, model: str = "ollama") -> dict:
         }
 
 
-# ai/generate_ai_insight.py or a new module like ai/annotator.py
+def generate_ai_insight_stream(prompt: str, model: str = "ollama", original_filename: str = "",
+                               metrics: StreamMetrics | None = None, limiter=None):
+    """
+    📘 Function: generate_ai_insight_stream
+
+    Description:
+        Streaming variant of generate_ai_insight(): yields the insight text
+        chunk by chunk as the model produces it, so the caller can show it
+        right away. Each chunk is also appended (and flushed) to
+        outputs/<name>/insights/insight_stream_<timestamp>_<name>.md, so a
+        partial insight is on disk even if the run is interrupted.
+        Time to first token and tokens/sec are logged and stored in `metrics`.
 
+    Parameters:
+        prompt (str): The input prompt for the AI model.
+        model (str): Which AI model to use (default is 'ollama').
+        original_filename (str): Source name used for the insights folder.
+        metrics (StreamMetrics | None): Receives timing, the output path
+            (metrics.path) and any error (metrics.error).
+        limiter (TokenBucket | SharedTokenBucket | None): Rate limiter to
+            acquire before the request (e.g. one shared by batch workers).
 
+    Yields:
+        str: Insight text chunks.
 
-def annotate_profile(column_profiles: list[dict], model: str = "ollama") -> list[dict]:
+    Usage Example:
+        metrics = StreamMetrics()
+        for chunk in generate_ai_insight_stream(prompt, original_filename="blahblah", metrics=metrics):
+            print(chunk, end="", flush=True)
+        print(metrics.as_dict())
     """
-    🧠 annotate_profile()
+    logger.info("🚀 Streaming insight from prompt")
+    metrics = metrics if metrics is not None else StreamMetrics()
+    metrics.path = get_insight_stream_path(original_filename)
 
-    Enhances each column profile with an AI-generated insight.
+    try:
+        if limiter is not None:
+            limiter.acquire()
+        with open(metrics.path, "w", encoding="utf-8") as f:
+            for chunk in query_model_stream(prompt, model=model, metrics=metrics):
+                f.write(chunk)
+                f.flush()
+                yield chunk
+        logger.info(f"✅ Streamed insight saved to {metrics.path} "
+                    f"(ttft={metrics.as_dict()['ttft_s']}s, {metrics.as_dict()['tokens_per_sec']} tokens/s)")
+
+    except Exception as e:
+        logger.error(f"❌ Failed in generate_ai_insight_stream: {e}")
+        metrics.error = str(e)
+
+
+def _map_findings(prompt: str, model: str, limiter: TokenBucket | None) -> str | None:
+    """One map call; None if it failed (so error text is never summarized as findings)."""
+    try:
+        if limiter is not None:
+            limiter.acquire()
+        response = query_model(prompt=prompt, model=model)
+    except Exception as e:
+        logger.error(f"❌ Map call failed: {e}")
+        return None
+    if is_error_response(response):
+        logger.error(f"❌ Map call failed: {str(response).strip() or 'empty response'}")
+        return None
+    return response
+
+
+def prepare_table_prompt(
+    table_summary: dict | None,
+    column_profiles: list[dict],
+    model: str = "ollama",
+    token_budget: int = PROMPT_TOKEN_BUDGET,
+    strategy: str = "map_reduce",
+    tone: str = "neutral",
+    limiter=None,
+    max_workers: int = 1,
+) -> str:
+    """
+    📘 Function: prepare_table_prompt
+
+    Description:
+        Returns the prompt for the table-level insight, keeping it within
+        `token_budget`. Tables that fit are sent as one compact prompt. For
+        wider tables:
+            strategy="prioritize" – keep the most anomalous columns only.
+            strategy="map_reduce" – ask the model for findings per group of
+                columns (map calls are made here, through the LLM cache,
+                from `max_workers` threads paced by `limiter`), then return
+                a final prompt summarizing those findings. Groups whose map
+                call fails are left out; if every call fails, the
+                "prioritize" prompt is returned instead.
 
     Parameters:
-        column_profiles (list[dict]): The list of column profiling results.
-        model (str): Which LLM model to use: 'ollama', 'openai', etc.
+        table_summary (dict | None): Output from table_summary()
+        column_profiles (list[dict]): Output from column_report()
+        model (str): Which AI model to use for the map calls.
+        token_budget (int): Maximum estimated tokens per prompt.
+        strategy (str): 'map_reduce' or 'prioritize'.
+        tone (str): Optional tone ('neutral', 'casual', 'executive', etc.)
+        limiter (TokenBucket | SharedTokenBucket | None): Rate limiter for
+            the map calls (e.g. the one shared with annotate_profile()).
+        max_workers (int): Maximum number of concurrent map calls.
 
     Returns:
-        list[dict]: Updated column profiles with 'ai_insight' field added.
+        str: The prompt to send for the final insight.
     """
-    annotated = []
+    if strategy not in ("map_reduce", "prioritize"):
+        raise ValueError("Unsupported strategy. Use 'map_reduce' or 'prioritize'.")
+
+    prompt = create_ai_prompt(column_profiles, tone=tone, table_summary=table_summary,
+                              token_budget=10 ** 9)
+    if estimate_tokens(prompt) <= token_budget:
+        return prompt
+    if strategy == "prioritize":
+        return create_ai_prompt(column_profiles, tone=tone, table_summary=table_summary,
+                                token_budget=token_budget)
+
+    map_prompts = build_map_prompts(column_profiles, token_budget)
+    logger.info(f"🗺️ Table too wide for one prompt: map step over {len(map_prompts)} column groups "
+                f"(workers={max_workers})")
+    task = lambda p: _map_findings(p, model, limiter)
+    if max_workers <= 1:
+        results = [task(p) for p in map_prompts]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(bind(task), map_prompts))
+
+    findings = [text for text in results if text is not None]
+    if not findings:
+        logger.warning("⚠️ Every map call failed, falling back to the prioritized prompt")
+        return create_ai_prompt(column_profiles, tone=tone, table_summary=table_summary,
+                                token_budget=token_budget)
+    if len(findings) < len(results):
+        logger.warning(f"⚠️ {len(results) - len(findings)} of {len(results)} map calls failed; "
+                       "their column groups are left out of the summary")
+
+    reduce_prompt = build_reduce_prompt(table_summary, findings, tone=tone)
+    if estimate_tokens(reduce_prompt) > token_budget:
+        logger.warning(f"⚠️ Reduce prompt (~{estimate_tokens(reduce_prompt)} tokens) exceeds the budget")
+    return reduce_prompt
+
+
+# ai/generate_ai_insight.py or a new module like ai/annotator.py
+
+
 
-    for col in column_profiles:
-        col_name = col.get("column", "Unknown")
-        try:
-            prompt = f"""
+# Plot data (bin counts are noise to the model) and any earlier insight,
+# so a retried column gets the same prompt (and cache key) as the first try
+_PROMPT_EXCLUDED = {"plot_spec", "ai_insight"}
+
+
+def _prompt_view(col: dict) -> dict:
+    """The profile without plot data or a previous insight."""
+    return {k: v for k, v in col.items() if k not in _PROMPT_EXCLUDED}
+
+
+def _column_prompt(col: dict) -> str:
+    return f"""
 You are a data analyst. Here's a column profile:
 
-{col}
+{_prompt_view(col)}
 
 Provide an insight, observation, or suggestion about this column.
 Focus on its usefulness, data quality, patterns, or issues you observe.
-            """.strip()
+    """.strip()
+
+
+def _batch_prompt(cols: list[dict]) -> str:
+    profiles = "\n\n".join(f"Column {c.get('column', 'Unknown')!r}:\n{_prompt_view(c)}" for c in cols)
+    return f"""
+You are a data analyst. Here are the profiles of {len(cols)} columns:
+
+{profiles}
+
+For each column, provide an insight, observation, or suggestion.
+Focus on its usefulness, data quality, patterns, or issues you observe.
+
+Answer ONLY with a JSON object mapping each column name to its insight text, e.g.
+{{"column_a": "insight...", "column_b": "insight..."}}
+    """.strip()
+
+
+def _parse_batch_response(response: str) -> dict:
+    """Extracts the {column: insight} JSON object from a batch response."""
+    start, end = response.find("{"), response.rfind("}")
+    if start == -1 or end <= start:
+        raise ValueError("No JSON object found in batch response")
+    parsed = json.loads(response[start:end + 1])
+    if not isinstance(parsed, dict):
+        raise ValueError("Batch response is not a JSON object")
+    return {str(k): str(v).strip() for k, v in parsed.items()}
+
+
+def _annotate_one(col: dict, model: str, limiter: TokenBucket | None, cache=True) -> dict:
+    """Annotates a single column; failures are recorded on the column only."""
+    col_name = col.get("column", "Unknown")
+    try:
+        if limiter is not None:
+            limiter.acquire()
+        response = query_model(prompt=_column_prompt(col), model=model, cache=cache)
+        col["ai_insight"] = response.strip()
+        print(f"📝 Insight generated for column: {col_name}")
+
+    except Exception as e:
+        print(f"⚠️ Failed to annotate column: {col_name} → {e}")
+        col["ai_insight"] = f"[Error] {str(e)}"
+
+    return col
+
+
+def _annotate_batch(cols: list[dict], model: str, limiter: TokenBucket | None, cache=True) -> list[dict]:
+    """
+    Annotates several columns with one request. Columns missing from the
+    model's answer (or the whole batch, if the answer cannot be parsed) are
+    retried one by one, so a bad batch never fails its columns outright.
+    """
+    names = [str(c.get("column", "Unknown")) for c in cols]
+    insights = {}
+    try:
+        if limiter is not None:
+            limiter.acquire()
+        response = query_model(prompt=_batch_prompt(cols), model=model, cache=cache)
+        insights = _parse_batch_response(response)
+    except Exception as e:
+        logger.warning(f"⚠️ Batch annotation failed for {names}, falling back to per-column → {e}")
+
+    for col, name in zip(cols, names):
+        if insights.get(name):
+            col["ai_insight"] = insights[name]
+            print(f"📝 Insight generated for column: {name}")
+        else:
+            _annotate_one(col, model, limiter, cache)
+
+    return cols
+
+
+def annotate_profile(
+    column_profiles: list[dict],
+    model: str = "ollama",
+    max_workers: int = 1,
+    requests_per_second: float | None = 2.0,
+    burst: int = 1,
+    batch_size: int = 1,
+    skip_annotated: bool = False,
+    limiter=None,
+    cache=True,
+) -> list[dict]:
+    """
+    🧠 annotate_profile()
+
+    Enhances each column profile with an AI-generated insight.
+
+    Requests are sent from a thread pool of `max_workers` and paced by a
+    token bucket (`requests_per_second`, bursts of up to `burst`) instead of
+    a fixed sleep. With batch_size > 1, that many column profiles are packed
+    into one prompt to cut round trips. A failure only affects its own
+    column(s), which get an "[Error] ..." insight.
+
+    With skip_annotated=True, columns that already carry a usable
+    'ai_insight' (e.g. reused by incremental profiling) are left untouched;
+    empty, "[Error] ..." and backend fallback insights (is_error_response)
+    are retried.
+
+    Parameters:
+        column_profiles (list[dict]): The list of column profiling results.
+        model (str): Which LLM model to use: 'ollama', 'openai', etc.
+        max_workers (int): Maximum number of concurrent requests.
+        requests_per_second (float | None): Rate limit; None disables it.
+        burst (int): Token-bucket capacity (requests allowed back to back).
+        batch_size (int): Number of columns per request.
+        skip_annotated (bool): Keep existing non-error insights.
+        limiter (TokenBucket | SharedTokenBucket | None): Existing rate
+            limiter to use instead of creating one from requests_per_second
+            (e.g. one shared by all batch workers).
+        cache (LLMCache | bool | None): LLM response cache, as in
+            query_model(): True = default cache, False/None = no caching.
+
+    Returns:
+        list[dict]: Updated column profiles with 'ai_insight' field added,
+        in the original order.
+    """
+    pending = column_profiles
+    if skip_annotated:
+        pending = [col for col in column_profiles if is_error_response(col.get("ai_insight"))]
+    logger.info(f"🧠 Annotating {len(pending)} columns (workers={max_workers}, batch_size={batch_size})")
 
-            response = query_model(prompt=prompt, model=model)
-            col["ai_insight"] = response.strip()
-            annotated.append(col)
-            print(f"📝 Insight generated for column: {col_name}")
+    if limiter is None and requests_per_second:
+        limiter = TokenBucket(requests_per_second, burst)
 
-            # Add optional delay to avoid overload (especially with OpenAI)
-            time.sleep(0.5)
+    if batch_size > 1:
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        task = lambda cols: _annotate_batch(cols, model, limiter, cache)
+    else:
+        batches = pending
+        task = lambda col: _annotate_one(col, model, limiter, cache)
 
-        except Exception as e:
-            print(f"⚠️ Failed to annotate column: {col_name} → {e}")
-            col["ai_insight"] = f"[Error] {str(e)}"
-            annotated.append(col)
+    if max_workers <= 1:
+        for batch in batches:
+            task(batch)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(bind(task), batches))
 
-    return annotated
+    return list(column_profiles)
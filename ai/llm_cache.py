@@ -0,0 +1,167 @@
+# ai/llm_cache.py
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from eda_core.utils.logger_utils import setup_logger
+
+logger = setup_logger("llm_cache")
+
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", os.path.join("outputs", ".cache", "llm_cache.sqlite"))
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", 30 * 24 * 3600))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", 10_000))
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapses whitespace so formatting-only prompt changes hit the same entry."""
+    return " ".join(prompt.split())
+
+
+def make_cache_key(backend: str, model_name: str, prompt: str) -> str:
+    """SHA-256 over backend, model name and normalized prompt."""
+    payload = "\x1f".join([backend, model_name, normalize_prompt(prompt)])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    💾 LLMCache – content-addressed on-disk cache for LLM responses.
+
+    Entries live in a SQLite file keyed by make_cache_key(). Entries older
+    than `ttl_seconds` are treated as misses and removed. When the cache holds
+    more than `max_entries` rows or `max_bytes` of response text, the least
+    recently used entries are evicted. Hit/miss counters are kept per instance.
+
+    The database is opened (and closed) per operation, so one cache can be
+    shared across threads and (through the same file) across processes.
+
+    Parameters:
+        path (str): SQLite file location.
+        ttl_seconds (float | None): Entry lifetime; None = never expire.
+        max_entries (int): Maximum number of cached responses.
+        max_bytes (int): Maximum total size of cached responses.
+    """
+
+    def __init__(
+        self,
+        path: str = LLM_CACHE_PATH,
+        ttl_seconds: float | None = LLM_CACHE_TTL,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+        max_bytes: int = LLM_CACHE_MAX_BYTES,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    backend TEXT,
+                    model TEXT,
+                    response TEXT,
+                    size INTEGER,
+                    created_at REAL,
+                    last_access REAL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_access ON llm_cache(last_access)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # Use as `with closing(self._connect()) as conn, conn:` – the connection's
+        # own context manager only commits or rolls back, it does not close it
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, key: str) -> str | None:
+        now = time.time()
+        with self._lock, closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is not None and self.ttl_seconds is not None and now - row[1] > self.ttl_seconds:
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            conn.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, response: str, backend: str = "", model: str = "") -> None:
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        with self._lock, closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, backend, model, response, size, now, now),
+            )
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+
+        evicted = 0
+        rows = conn.execute("SELECT key, size FROM llm_cache ORDER BY last_access ASC").fetchall()
+        for key, size in rows:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            count -= 1
+            total -= size
+            evicted += 1
+
+        self.evictions += evicted
+        logger.info(f"🧹 Evicted {evicted} LRU cache entries")
+
+    def clear(self) -> None:
+        with self._lock, closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM llm_cache")
+
+    def stats(self) -> dict:
+        with closing(self._connect()) as conn:
+            count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": count,
+            "bytes": total,
+        }
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> LLMCache | None:
+    """
+    Returns the process-wide cache used by query_model(), created on first
+    use. Set LLM_CACHE=off to disable caching.
+    """
+    global _default_cache
+    if os.getenv("LLM_CACHE", "on").lower() in ("off", "0", "false", "no"):
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = LLMCache()
+        return _default_cache
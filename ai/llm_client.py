@@ -1,28 +1,249 @@
 # ai/llm_client.py
 
-from ai.models.ollama_client import call_ollama
-from ai.models.openai_client import call_openai
-# from ai.models.gemini_client import call_gemini
-# from ai.models.groq_client import call_groq
+import importlib
+import threading
+import time
+from ai.llm_cache import LLMCache, get_default_cache, make_cache_key
+from eda_core.utils.logger_utils import setup_logger
+from eda_core.utils.instrument import annotate, instrument
 
-def query_model(prompt: str, model: str = "ollama") -> str:
+logger = setup_logger("llm_client")
+
+# Backend name -> factory, or "module:attribute" of a factory imported on
+# first use, so the CLI only pays for the SDKs it actually calls. A backend
+# is any object with a `model_name` attribute and a generate(prompt) -> str
+# method (see ai/models/http_backend.py for a pooled HTTP base class).
+_BACKEND_FACTORIES = {
+    "ollama": "ai.models.ollama_client:get_default_backend",
+    "openai": "ai.models.openai_client:get_default_backend",
+    # "gemini": "ai.models.gemini_client:get_default_backend",
+    # "groq": "ai.models.groq_client:get_default_backend",
+}
+_backends = {}
+_backends_lock = threading.Lock()
+
+# Sentinel texts the backends return instead of raising; never cached
+_ERROR_RESPONSES = {"[Ollama Error]", "AI response could not be retrieved."}
+
+# Legacy function names, resolved lazily by __getattr__ below
+_LEGACY_FUNCTIONS = {
+    "call_ollama": "ai.models.ollama_client",
+    "call_openai": "ai.models.openai_client",
+}
+
+
+def register_backend(name: str, factory, error_response: str | None = None) -> None:
+    """
+    📘 Function: register_backend
+
+    Description:
+        Registers (or replaces) an LLM backend under `name`, making it
+        available to query_model(prompt, model=name) without editing
+        query_model. The factory is called once, on first use; the instance
+        is reused for every later call so its connection pool is shared.
+
+    Parameters:
+        name (str): Backend name used as `model=` in query_model().
+        factory (callable | str): Zero-argument callable returning the
+            backend, or a "module:attribute" path to one (imported lazily).
+        error_response (str | None): Text the backend returns on failure
+            instead of raising; such responses are never cached.
+    """
+    with _backends_lock:
+        _BACKEND_FACTORIES[name] = factory
+        old = _backends.pop(name, None)
+    if old is not None and hasattr(old, "close"):
+        old.close()
+    if error_response:
+        _ERROR_RESPONSES.add(error_response)
+
+
+def is_error_response(text) -> bool:
+    """
+    True if `text` is not a usable answer: empty, an "[Error] ..." insight
+    recorded by annotate_profile(), or a backend's fallback error text
+    (see register_backend(error_response=...)).
+    """
+    text = str(text or "").strip()
+    return not text or text.startswith("[Error]") or text in _ERROR_RESPONSES
+
+
+def available_backends() -> list[str]:
+    return sorted(_BACKEND_FACTORIES)
+
+
+def get_backend(name: str):
+    """Returns the shared backend instance for `name`, creating it on first use."""
+    backend = _backends.get(name)
+    if backend is not None:
+        return backend
+
+    with _backends_lock:
+        if name not in _backends:
+            if name not in _BACKEND_FACTORIES:
+                raise ValueError(f"Unsupported model: {name}")
+            factory = _BACKEND_FACTORIES[name]
+            if isinstance(factory, str):
+                module_name, attr = factory.split(":")
+                factory = getattr(importlib.import_module(module_name), attr)
+            _backends[name] = factory()
+        return _backends[name]
+
+
+def _call_backend(prompt: str, model: str) -> str:
+    return get_backend(model).generate(prompt)
+
+
+def _model_name(model: str) -> str:
+    if model not in _BACKEND_FACTORIES:
+        return model
+    return get_backend(model).model_name
+
+
+def __getattr__(name: str):
+    """Lazy access to backend functions, e.g. `from ai.llm_client import call_ollama`."""
+    if name in _LEGACY_FUNCTIONS:
+        return getattr(importlib.import_module(_LEGACY_FUNCTIONS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@instrument(aggregate=True)
+def query_model(prompt: str, model: str = "ollama", cache: LLMCache | None | bool = True) -> str:
     """
     🧠 query_model – Selects and uses the correct model backend.
 
+    Responses are served from the on-disk LLM cache when the same
+    (backend, model name, normalized prompt) was answered before, so reruns
+    on unchanged data make no network calls.
+
     Parameters:
         prompt (str): Prompt to send.
-        model (str): One of ["ollama", "openai"]
+        model (str): A registered backend, e.g. "ollama" or "openai"
+            (see register_backend()).
+        cache (LLMCache | bool | None): Cache to use. True = default cache,
+            False/None = bypass caching.
 
     Returns:
         str: AI-generated response text.
     """
-    if model == "ollama":
-        return call_ollama(prompt)
-    elif model == "openai":
-        return call_openai(prompt)
-    # elif model == "gemini":
-    #     return call_gemini(prompt)
-    # elif model == "groq":
-    #     return call_groq(prompt)
-    else:
-        raise ValueError(f"Unsupported model: {model}")
+    annotate(model=model, prompt_chars=len(prompt))
+    if cache is True:
+        cache = get_default_cache()
+    if not cache:
+        return _call_backend(prompt, model)
+
+    model_name = _model_name(model)
+    key = make_cache_key(model, model_name, prompt)
+    cached = cache.get(key)
+    annotate(cached=cached is not None)
+    if cached is not None:
+        return cached
+
+    response = _call_backend(prompt, model)
+    if not is_error_response(response):
+        cache.set(key, response, backend=model, model=model_name)
+    return response
+
+
+class StreamMetrics:
+    """
+    ⏱️ StreamMetrics – timing for one streamed LLM call.
+
+    Filled in by query_model_stream() while the response is consumed:
+    time to first token (ttft), total time, number of chunks and
+    chunks per second. Ollama and OpenAI send about one token per chunk,
+    so chunks/sec is reported as tokens/sec.
+    """
+
+    def __init__(self):
+        self.started = None
+        self.ttft = None
+        self.elapsed = None
+        self.tokens = 0
+        self.chars = 0
+        self.cached = False
+        self.error = None
+        self.path = None
+
+    @property
+    def tokens_per_sec(self) -> float | None:
+        if not self.elapsed or self.ttft is None or self.elapsed <= self.ttft:
+            return None
+        # Generation rate after the first token arrived
+        return (self.tokens - 1) / (self.elapsed - self.ttft) if self.tokens > 1 else None
+
+    def as_dict(self) -> dict:
+        return {
+            "ttft_s": round(self.ttft, 3) if self.ttft is not None else None,
+            "elapsed_s": round(self.elapsed, 3) if self.elapsed is not None else None,
+            "tokens": self.tokens,
+            "chars": self.chars,
+            "tokens_per_sec": round(self.tokens_per_sec, 1) if self.tokens_per_sec else None,
+            "cached": self.cached,
+            "error": self.error,
+        }
+
+
+@instrument
+def query_model_stream(prompt: str, model: str = "ollama", cache: LLMCache | None | bool = True,
+                       metrics: StreamMetrics | None = None):
+    """
+    🧠 query_model_stream – Like query_model(), but yields the response in
+    chunks as the backend produces them.
+
+    A cache hit is yielded as one chunk. A fully received response is
+    stored in the cache, so a later query_model() call with the same prompt
+    is served from it. Backends without a stream() method fall back to one
+    generate() call.
+
+    Parameters:
+        prompt (str): Prompt to send.
+        model (str): A registered backend (see register_backend()).
+        cache (LLMCache | bool | None): Cache to use. True = default cache,
+            False/None = bypass caching.
+        metrics (StreamMetrics | None): Filled in with ttft and tokens/sec.
+
+    Yields:
+        str: Response text chunks.
+    """
+    metrics = metrics if metrics is not None else StreamMetrics()
+    metrics.started = time.perf_counter()
+    annotate(model=model, prompt_chars=len(prompt))
+
+    if cache is True:
+        cache = get_default_cache()
+    key = None
+    if cache:
+        model_name = _model_name(model)
+        key = make_cache_key(model, model_name, prompt)
+        cached = cache.get(key)
+        if cached is not None:
+            metrics.cached = True
+            metrics.ttft = metrics.elapsed = time.perf_counter() - metrics.started
+            metrics.tokens, metrics.chars = 1, len(cached)
+            annotate(cached=True)
+            yield cached
+            return
+
+    backend = get_backend(model)
+    chunks = backend.stream(prompt) if hasattr(backend, "stream") else iter([backend.generate(prompt)])
+    parts = []
+    try:
+        for chunk in chunks:
+            if metrics.ttft is None:
+                metrics.ttft = time.perf_counter() - metrics.started
+            metrics.tokens += 1
+            metrics.chars += len(chunk)
+            parts.append(chunk)
+            yield chunk
+    except Exception as e:
+        metrics.error = str(e)
+        raise
+    finally:
+        metrics.elapsed = time.perf_counter() - metrics.started
+        annotate(**metrics.as_dict())
+        logger.info(f"⏱️ {model}: {metrics.as_dict()}")
+
+    response = "".join(parts)
+    if key and not is_error_response(response):
+        cache.set(key, response, backend=model, model=_model_name(model))
@@ -0,0 +1,359 @@
+# ai/models/fake_server.py
+"""
+Deterministic local stand-in for an LLM server, for offline load tests.
+
+Speaks the Ollama API (POST /api/generate, streaming and not) and the
+OpenAI chat API (POST /v1/chat/completions, streaming via SSE and not).
+The answer to a prompt is always the same text (derived from the prompt
+and the seed). Latency, token rate and injected errors are configurable,
+so annotation concurrency, retries and caching can be exercised without
+a real model.
+
+Usage:
+    with FakeLLMServer(latency=0.05, tokens_per_sec=200) as server:
+        register_fake_backend(server, name="fake")
+        query_model("Describe this column", model="fake")
+
+    # Or standalone, then point OLLAMA_URL (or OPENAI_BASE_URL=<url>/v1) at it:
+    python -m ai.models.fake_server --port 11434 --latency 0.2 --error-rate 0.05
+"""
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from eda_core.utils.logger_utils import get_logger
+
+logger = get_logger("fake_server")
+
+_WORDS = (
+    "the column shows a stable distribution with few missing values and no obvious "
+    "outliers consider checking the tail skew validating the range against business "
+    "rules and plotting values over time to spot drift or data entry issues"
+).split()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so client connection pools are exercised
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        fake = self.server.fake
+        if self.path == "/stats":
+            self._send_json(200, fake.stats())
+        elif self.path == "/api/tags":
+            self._send_json(200, {"models": [{"name": fake.model}]})
+        elif self.path == "/v1/models":
+            self._send_json(200, {"object": "list", "data": [{"id": fake.model, "object": "model"}]})
+        else:
+            self._send_json(404, {"error": f"unknown path {self.path}"})
+
+    def do_POST(self) -> None:
+        fake = self.server.fake
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": "invalid JSON body"})
+            return
+
+        if self.path == "/api/generate":
+            api, prompt = "ollama", str(body.get("prompt", ""))
+        elif self.path in ("/v1/chat/completions", "/chat/completions"):
+            api = "openai"
+            prompt = "\n".join(str(m.get("content", "")) for m in body.get("messages", []))
+        else:
+            self._send_json(404, {"error": f"unknown path {self.path}"})
+            return
+
+        fake._begin(api, self.client_address)
+        try:
+            model = body.get("model") or fake.model
+            if fake._should_fail(prompt):
+                time.sleep(fake.latency)
+                self._send_error(api, fake.error_status)
+            elif body.get("stream"):
+                self._stream(api, model, fake.tokens_for(prompt))
+            else:
+                tokens = fake.tokens_for(prompt)
+                time.sleep(fake.latency + fake._generation_time(len(tokens)))
+                self._send_json(200, _complete_payload(api, model, "".join(tokens), len(prompt)))
+        except (BrokenPipeError, ConnectionResetError):
+            # Client gave up (timeout or abandoned stream)
+            self.close_connection = True
+        finally:
+            fake._end()
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_error(self, api: str, status: int) -> None:
+        message = f"injected error ({status})"
+        if api == "openai":
+            self._send_json(status, {"error": {"message": message, "type": "server_error", "code": status}})
+        else:
+            self._send_json(status, {"error": message})
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def _stream(self, api: str, model: str, tokens: list[str]) -> None:
+        fake = self.server.fake
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream" if api == "openai" else "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        time.sleep(fake.latency)
+        for i, token in enumerate(tokens):
+            if i:
+                time.sleep(fake._generation_time(1))
+            self._write_chunk(_stream_event(api, model, token, done=False))
+        self._write_chunk(_stream_event(api, model, "", done=True, n_tokens=len(tokens)))
+        if api == "openai":
+            self._write_chunk(b"data: [DONE]\n\n")
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+def _complete_payload(api: str, model: str, text: str, prompt_chars: int) -> dict:
+    n_tokens = len(text.split())
+    if api == "ollama":
+        return {"model": model, "created_at": _now(), "response": text, "done": True,
+                "eval_count": n_tokens}
+    return {
+        "id": "chatcmpl-fake",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": prompt_chars // 4, "completion_tokens": n_tokens,
+                  "total_tokens": prompt_chars // 4 + n_tokens},
+    }
+
+
+def _stream_event(api: str, model: str, token: str, done: bool, n_tokens: int = 0) -> bytes:
+    if api == "ollama":
+        event = {"model": model, "created_at": _now(), "response": token, "done": done}
+        if done:
+            event["eval_count"] = n_tokens
+        return (json.dumps(event) + "\n").encode("utf-8")
+    delta = {} if done else {"content": token}
+    event = {
+        "id": "chatcmpl-fake",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": "stop" if done else None}],
+    }
+    return f"data: {json.dumps(event)}\n\n".encode("utf-8")
+
+
+def _now() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+class FakeLLMServer:
+    """
+    📘 Class: FakeLLMServer
+
+    Description:
+        Threaded HTTP server answering Ollama and OpenAI-style requests with
+        deterministic text. Each request waits `latency` seconds (time to
+        first token) and then produces `tokens` tokens at `tokens_per_sec`
+        (streamed one per chunk, or all at once when not streaming).
+
+        Errors are injected per prompt attempt: attempt k of a prompt fails
+        if a hash of (seed, prompt, k) falls below `error_rate`, so which
+        requests fail does not depend on thread timing, and a retried
+        prompt can succeed. `fail_first` makes the first N attempts of every
+        prompt fail (for testing retries).
+
+        A `responder` can supply the text for some prompts (e.g. a JSON
+        answer for batch prompts); it is streamed and timed like any other.
+
+        stats() reports request counts, injected errors, the peak number of
+        requests in flight and the number of client connections seen.
+
+    Parameters:
+        host (str): Interface to bind.
+        port (int): Port; 0 picks a free one (see `url`).
+        latency (float): Seconds before the first token.
+        tokens_per_sec (float): Generation speed; 0 = instant.
+        tokens (int): Tokens per response.
+        error_rate (float): Probability (0–1) that an attempt fails.
+        error_status (int): HTTP status of injected errors (e.g. 500, 429, 503).
+        fail_first (int): Attempts per prompt that always fail.
+        seed (int): Changes response text and which attempts fail.
+        model (str): Model name reported back.
+        responder (callable | None): prompt -> response text, or None for
+            the default generated text.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.05,
+                 tokens_per_sec: float = 200.0, tokens: int = 40, error_rate: float = 0.0,
+                 error_status: int = 500, fail_first: int = 0, seed: int = 0, model: str = "fake-llm",
+                 responder=None):
+        self.host = host
+        self.port = port
+        self.latency = max(0.0, float(latency))
+        self.tokens_per_sec = max(0.0, float(tokens_per_sec))
+        self.tokens = max(1, int(tokens))
+        self.error_rate = min(max(float(error_rate), 0.0), 1.0)
+        self.error_status = int(error_status)
+        self.fail_first = max(0, int(fail_first))
+        self.seed = seed
+        self.model = model
+        self.responder = responder
+        self._httpd = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "FakeLLMServer":
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-llm-server", daemon=True)
+        self._thread.start()
+        logger.info(f"🧪 Fake LLM server listening on {self.url}")
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "FakeLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _digest(self, *parts) -> bytes:
+        return hashlib.sha256("\x00".join(str(p) for p in (self.seed, *parts)).encode("utf-8")).digest()
+
+    def tokens_for(self, prompt: str) -> list[str]:
+        """The response to `prompt`, as tokens (words with trailing spaces)."""
+        text = self.responder(prompt) if self.responder else None
+        if text is not None:
+            return re.findall(r"\s*\S+\s*", text) or [text]
+        rng = random.Random(self._digest("text", prompt))
+        return [rng.choice(_WORDS) + " " for _ in range(self.tokens)]
+
+    def response_for(self, prompt: str) -> str:
+        return "".join(self.tokens_for(prompt))
+
+    def _generation_time(self, n_tokens: int) -> float:
+        return n_tokens / self.tokens_per_sec if self.tokens_per_sec else 0.0
+
+    def _should_fail(self, prompt: str) -> bool:
+        key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        with self._lock:
+            attempt = self._attempts.get(key, 0)
+            self._attempts[key] = attempt + 1
+        if attempt < self.fail_first:
+            fail = True
+        else:
+            fail = int.from_bytes(self._digest("error", prompt, attempt)[:8], "big") / 2**64 < self.error_rate
+        if fail:
+            with self._lock:
+                self._stats["errors"] += 1
+        return fail
+
+    def _begin(self, api: str, client_address) -> None:
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["by_api"][api] = self._stats["by_api"].get(api, 0) + 1
+            self._in_flight += 1
+            self._stats["peak_in_flight"] = max(self._stats["peak_in_flight"], self._in_flight)
+            self._clients.add(client_address)
+
+    def _end(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def reset_stats(self) -> None:
+        """Zeroes the counters and the per-prompt attempt numbers used for error injection."""
+        with self._lock:
+            self._stats = {"requests": 0, "errors": 0, "peak_in_flight": 0, "by_api": {}}
+            self._attempts = {}
+            self._clients = set()
+            self._in_flight = 0
+
+    def stats(self) -> dict:
+        """Counters since start (or reset_stats()); "connections" = distinct client sockets."""
+        with self._lock:
+            return {**self._stats, "by_api": dict(self._stats["by_api"]), "connections": len(self._clients)}
+
+
+def register_fake_backend(server: FakeLLMServer, name: str = "fake", api: str = "ollama",
+                          max_connections: int = 8) -> str:
+    """
+    Registers a backend named `name` that talks to `server` through the
+    real client code (OllamaBackend or OpenAIBackend), so query_model(...,
+    model=name) exercises the same connection pooling, streaming and error
+    handling as against a live service.
+    """
+    from ai.llm_client import register_backend
+
+    if api == "ollama":
+        from ai.models.ollama_client import ERROR_RESPONSE, OllamaBackend
+
+        factory = lambda: OllamaBackend(base_url=server.url, model=server.model,
+                                        max_connections=max_connections)
+    elif api == "openai":
+        from ai.models.openai_client import ERROR_RESPONSE, OpenAIBackend
+
+        factory = lambda: OpenAIBackend(model=server.model, base_url=f"{server.url}/v1",
+                                        api_key="fake", max_connections=max_connections)
+    else:
+        raise ValueError("Unsupported api. Use 'ollama' or 'openai'.")
+
+    register_backend(name, factory, error_response=ERROR_RESPONSE)
+    return name
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Deterministic local LLM stand-in (Ollama + OpenAI APIs)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds before the first token")
+    parser.add_argument("--tokens-per-sec", type=float, default=200.0, help="generation speed (0 = instant)")
+    parser.add_argument("--tokens", type=int, default=40, help="tokens per response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of attempts that fail")
+    parser.add_argument("--error-status", type=int, default=500, help="HTTP status of injected errors")
+    parser.add_argument("--fail-first", type=int, default=0, help="attempts per prompt that always fail")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = FakeLLMServer(args.host, args.port, latency=args.latency, tokens_per_sec=args.tokens_per_sec,
+                           tokens=args.tokens, error_rate=args.error_rate, error_status=args.error_status,
+                           fail_first=args.fail_first, seed=args.seed).start()
+    print(f"Ollama:  OLLAMA_URL={server.url}", flush=True)
+    print(f"OpenAI:  OPENAI_BASE_URL={server.url}/v1", flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
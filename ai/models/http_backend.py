@@ -0,0 +1,78 @@
+# ai/models/http_backend.py
+import threading
+from abc import ABC, abstractmethod
+from eda_core.utils.logger_utils import get_logger
+
+logger = get_logger("http_backend")
+
+
+class HTTPBackend(ABC):
+    """
+    📘 Class: HTTPBackend
+
+    Description:
+        Base class for LLM backends that talk to an HTTP API. Each backend
+        owns one persistent requests.Session whose connection pool is capped
+        at `max_connections`, so repeated calls (e.g. annotating hundreds of
+        columns) reuse keep-alive connections instead of opening a new TCP
+        connection per request. When all pooled connections are busy, further
+        requests wait for a free one rather than opening more.
+
+        Subclasses set `name` and implement generate(prompt) -> str.
+
+    Parameters:
+        base_url (str): API root, e.g. "http://localhost:11434".
+        model (str): Model name sent to the API.
+        timeout (float): Read timeout in seconds.
+        connect_timeout (float): Connect timeout in seconds.
+        max_connections (int): Size of the connection pool.
+    """
+
+    name = "http"
+
+    def __init__(self, base_url: str, model: str, timeout: float = 60.0,
+                 connect_timeout: float = 5.0, max_connections: int = 8):
+        self.base_url = base_url.rstrip("/")
+        self.model_name = model
+        self.timeout = (connect_timeout, timeout)
+        self.max_connections = max(1, int(max_connections))
+        self._session = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        """The pooled session, created on first use."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=1,
+                        pool_maxsize=self.max_connections,
+                        pool_block=True,
+                    )
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._session = session
+                    logger.info(f"🔌 {self.name}: opened session to {self.base_url} "
+                                f"(max {self.max_connections} connections)")
+        return self._session
+
+    def post_json(self, path: str, payload: dict, **kwargs):
+        """POSTs `payload` as JSON to base_url + path and returns the response."""
+        response = self.session.post(f"{self.base_url}{path}", json=payload,
+                                     timeout=self.timeout, **kwargs)
+        response.raise_for_status()
+        return response
+
+    @abstractmethod
+    def generate(self, prompt: str) -> str:
+        """Sends `prompt` and returns the response text."""
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
@@ -8,15 +8,16 @@
 # Provides an interface to communicate with OpenAI's LLM using the latest SDK format (openai>=1.0.0).
 # """
 
+import json
+import threading
 import time
 import logging
 
 from eda_core.utils.logger_utils import get_logger
+from ai.models.http_backend import HTTPBackend
 from dotenv import load_dotenv
 import os
 
-import requests
-
 
 load_dotenv()
 
@@ -25,20 +26,78 @@ logger = get_logger(__name__)
 
 OLLAMA_URL = os.getenv("OLLAMA_URL", "http://localhost:11434")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3:14b")
+OLLAMA_TIMEOUT = float(os.getenv("OLLAMA_TIMEOUT", "60"))
+OLLAMA_MAX_CONNECTIONS = int(os.getenv("OLLAMA_MAX_CONNECTIONS", "8"))
 
-def call_ollama(prompt: str, MODEL = OLLAMA_MODEL ) -> str:
-    logger.info(f"🤖 Entering call_ollama() with model={MODEL}")
-    try:
-        response = requests.post(
-            f"{OLLAMA_URL}/api/generate",
-            json={"model": MODEL, "prompt": prompt, "stream": False},
-            timeout=60
-        )
-        response.raise_for_status()
-        result = response.json()
-        return result.get("response", "[No response text]")
-    except Exception as e:
-        logger.error(f"💥 Failed to query Ollama: {e}")
-        return "[Ollama Error]"
+# Returned instead of raising so callers can keep going; never cached
+ERROR_RESPONSE = "[Ollama Error]"
+
+
+class OllamaBackend(HTTPBackend):
+    """
+    🦙 OllamaBackend – /api/generate over a pooled keep-alive session.
+
+    Usage Example:
+        backend = OllamaBackend(max_connections=4)
+        text = backend.generate("Describe this column ...")
+    """
+
+    name = "ollama"
+
+    def __init__(self, base_url: str = OLLAMA_URL, model: str = OLLAMA_MODEL,
+                 timeout: float = OLLAMA_TIMEOUT, connect_timeout: float = 5.0,
+                 max_connections: int = OLLAMA_MAX_CONNECTIONS):
+        super().__init__(base_url, model, timeout=timeout, connect_timeout=connect_timeout,
+                         max_connections=max_connections)
 
+    def generate(self, prompt: str, model: str | None = None) -> str:
+        model = model or self.model_name
+        logger.info(f"🤖 Entering call_ollama() with model={model}")
+        try:
+            result = self.post_json(
+                "/api/generate",
+                {"model": model, "prompt": prompt, "stream": False},
+            ).json()
+            return result.get("response", "[No response text]")
+        except Exception as e:
+            logger.error(f"💥 Failed to query Ollama: {e}")
+            return ERROR_RESPONSE
 
+    def stream(self, prompt: str, model: str | None = None):
+        """
+        Yields response text chunks as Ollama produces them ("stream": true,
+        one JSON object per line). Errors are raised, not swallowed.
+        """
+        model = model or self.model_name
+        logger.info(f"🤖 Streaming from Ollama with model={model}")
+        with self.post_json(
+            "/api/generate",
+            {"model": model, "prompt": prompt, "stream": True},
+            stream=True,
+        ) as response:
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                event = json.loads(line)
+                if event.get("error"):
+                    raise RuntimeError(f"Ollama error: {event['error']}")
+                # Read through the final "done" event so the connection goes back to the pool
+                if event.get("response"):
+                    yield event["response"]
+
+
+_default_backend = None
+_default_backend_lock = threading.Lock()
+
+
+def get_default_backend() -> OllamaBackend:
+    """The shared OllamaBackend (one connection pool per process)."""
+    global _default_backend
+    with _default_backend_lock:
+        if _default_backend is None:
+            _default_backend = OllamaBackend()
+        return _default_backend
+
+
+def call_ollama(prompt: str, MODEL = OLLAMA_MODEL ) -> str:
+    return get_default_backend().generate(prompt, model=MODEL)
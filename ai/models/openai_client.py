@@ -8,8 +8,8 @@
 # Provides an interface to communicate with OpenAI's LLM using the latest SDK format (openai>=1.0.0).
 # """
 
-from openai import OpenAI
 import os
+import threading
 import time
 from eda_core.utils.logger_utils import get_logger
 from dotenv import load_dotenv
@@ -19,39 +19,144 @@ load_dotenv()
 # Logger setup
 logger = get_logger("llm_client")
 
-# Load your API key securely from environment
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o")
+OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "60"))
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "8"))
+# OpenAI-compatible server to use instead of api.openai.com (e.g. ai/models/fake_server.py)
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or None
 
-def call_openai(prompt: str, model: str = "gpt-4o", max_retries: int = 3) -> str:
+# Returned instead of raising so callers can keep going; never cached
+ERROR_RESPONSE = "AI response could not be retrieved."
+
+
+class OpenAIBackend:
     """
-    Sends a prompt to OpenAI and retrieves the completion.
+    🧠 OpenAIBackend – chat completions through one shared OpenAI client.
 
-    Parameters:
-        prompt (str): The user prompt to send.
-        model (str): The OpenAI model to use (default: "gpt-4o").
-        max_retries (int): Retry limit for API call in case of failure.
+    The SDK client (and its HTTP connection pool, capped at
+    `max_connections`) is created on first use and reused for every call,
+    so importing this module neither loads the SDK nor requires
+    OPENAI_API_KEY.
 
-    Returns:
-        str: Model's response content.
+    Parameters:
+        model (str): Default model name.
+        timeout (float): Request timeout in seconds.
+        max_connections (int): Size of the connection pool.
+        max_retries (int): Attempts per prompt before giving up.
+        base_url (str | None): OpenAI-compatible API root (default: OPENAI_BASE_URL).
+        api_key (str | None): API key (default: OPENAI_API_KEY).
     """
-    logger.info(f"🧠 Entering call_openai() with model={model}")
 
-    for attempt in range(1, max_retries + 1):
+    name = "openai"
+
+    def __init__(self, model: str = OPENAI_MODEL, timeout: float = OPENAI_TIMEOUT,
+                 max_connections: int = OPENAI_MAX_CONNECTIONS, max_retries: int = 3,
+                 base_url: str | None = OPENAI_BASE_URL, api_key: str | None = None):
+        self.model_name = model
+        self.base_url = base_url
+        self.api_key = api_key
+        self.timeout = timeout
+        self.max_connections = max(1, int(max_connections))
+        self.max_retries = max_retries
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._make_client()
+        return self._client
+
+    def _make_client(self):
+        import openai
+
+        options = {"api_key": self.api_key or os.getenv("OPENAI_API_KEY"), "timeout": self.timeout,
+                   "max_retries": 0}
+        if self.base_url:
+            options["base_url"] = self.base_url
         try:
-            response = client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": "You are an expert data analyst."},
-                    {"role": "user", "content": prompt}
-                ]
+            import httpx
+
+            options["http_client"] = openai.DefaultHttpxClient(
+                limits=httpx.Limits(max_connections=self.max_connections,
+                                    max_keepalive_connections=self.max_connections)
             )
+        except (ImportError, AttributeError):
+            logger.info("ℹ️ httpx not importable, using the OpenAI SDK's default connection pool")
+        return openai.OpenAI(**options)
+
+    def generate(self, prompt: str, model: str | None = None, max_retries: int | None = None) -> str:
+        """
+        Sends a prompt to OpenAI and retrieves the completion.
+
+        Parameters:
+            prompt (str): The user prompt to send.
+            model (str): The OpenAI model to use (default: self.model_name).
+            max_retries (int): Retry limit for API call in case of failure.
+
+        Returns:
+            str: Model's response content.
+        """
+        model = model or self.model_name
+        max_retries = max_retries or self.max_retries
+        logger.info(f"🧠 Entering call_openai() with model={model}")
+
+        for attempt in range(1, max_retries + 1):
+            try:
+                response = self.client.chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": "You are an expert data analyst."},
+                        {"role": "user", "content": prompt}
+                    ]
+                )
+
+                result = response.choices[0].message.content
+                logger.info(f"✅ OpenAI response received successfully.")
+                return result
+
+            except Exception as e:
+                logger.error(f"⚠️ OpenAI call failed (attempt {attempt}):\n\n{e}")
+                time.sleep(2 * attempt)  # Exponential backoff
+
+        return ERROR_RESPONSE
+
+    def stream(self, prompt: str, model: str | None = None):
+        """Yields completion text deltas as they arrive (stream=True). Errors are raised."""
+        model = model or self.model_name
+        logger.info(f"🧠 Streaming from OpenAI with model={model}")
+        response = self.client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": "You are an expert data analyst."},
+                {"role": "user", "content": prompt}
+            ],
+            stream=True,
+        )
+        for event in response:
+            if event.choices and event.choices[0].delta.content:
+                yield event.choices[0].delta.content
+
+
+_default_backend = None
+_default_backend_lock = threading.Lock()
+
+
+def get_default_backend() -> OpenAIBackend:
+    """The shared OpenAIBackend (one client and connection pool per process)."""
+    global _default_backend
+    with _default_backend_lock:
+        if _default_backend is None:
+            _default_backend = OpenAIBackend()
+        return _default_backend
+
 
-            result = response.choices[0].message.content
-            logger.info(f"✅ OpenAI response received successfully.")
-            return result
+def get_client():
+    """Returns the shared OpenAI client, creating it on first use."""
+    return get_default_backend().client
 
-        except Exception as e:
-            logger.error(f"⚠️ OpenAI call failed (attempt {attempt}):\n\n{e}")
-            time.sleep(2 * attempt)  # Exponential backoff
 
-    return "AI response could not be retrieved."
+def call_openai(prompt: str, model: str = OPENAI_MODEL, max_retries: int = 3) -> str:
+    return get_default_backend().generate(prompt, model=model, max_retries=max_retries)
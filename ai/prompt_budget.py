@@ -0,0 +1,306 @@
+# ai/prompt_budget.py
+import csv
+import io
+import math
+import os
+from eda_core.utils.logger_utils import setup_logger
+
+logger = setup_logger("prompt_budget")
+
+try:
+    import tiktoken  # optional: exact counts for OpenAI models
+except ImportError:
+    tiktoken = None
+
+PROMPT_TOKEN_BUDGET = int(os.getenv("PROMPT_TOKEN_BUDGET", 6000))
+
+# Columns of the compact profile table, in order. Everything else in a
+# profile (plot_spec, plot paths, hashes, full top-k lists, insights, ...)
+# is left out of the prompt.
+PROMPT_FIELDS = [
+    "column", "dtype", "count", "missing_pct", "unique", "mean", "std",
+    "min", "median", "max", "outlier_count", "top_values", "flags",
+]
+
+_encoder = None
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Token count of `text`: exact with tiktoken (cl100k_base) if installed,
+    otherwise ~4 characters per token, which is close for English and
+    slightly pessimistic for numeric tables.
+    """
+    global _encoder
+    if tiktoken is not None:
+        if _encoder is None:
+            _encoder = tiktoken.get_encoding("cl100k_base")
+        return len(_encoder.encode(text))
+    return math.ceil(len(text) / 4)
+
+
+def _fmt(value, digits: int = 4) -> str:
+    """Short string form: floats rounded to `digits` significant digits."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    if isinstance(value, float):
+        if math.isnan(value):
+            return ""
+        return f"{value:.{digits}g}"
+    return str(value)
+
+
+def anomaly_flags(profile: dict) -> list[str]:
+    """
+    Short tags for what makes a column worth the model's attention
+    (missing data, outliers, constant or ID-like values, skew, errors).
+    """
+    flags = []
+    if "error" in profile:
+        return ["error"]
+    if profile.get("note"):
+        flags.append("unsupported")
+
+    missing_pct = profile.get("missing_pct") or 0.0
+    if profile.get("all_missing"):
+        flags.append("all_missing")
+    elif profile.get("high_missing") or missing_pct > 0.5:
+        flags.append("high_missing")
+    elif missing_pct > 0.05:
+        flags.append("some_missing")
+
+    count = profile.get("count") or 0
+    outliers = profile.get("outlier_count") or 0
+    if count and outliers / count > 0.01:
+        flags.append("outliers")
+
+    unique = profile.get("unique")
+    if unique is not None and count:
+        if unique <= 1:
+            flags.append("constant")
+        elif unique == count:
+            flags.append("all_unique")
+
+    mean, median, std = profile.get("mean"), profile.get("median"), profile.get("std")
+    if all(isinstance(v, (int, float)) and math.isfinite(v) for v in (mean, median, std)) and std > 0:
+        if abs(mean - median) / std > 0.5:
+            flags.append("skewed")
+
+    return flags
+
+
+_FLAG_WEIGHTS = {
+    "error": 5, "all_missing": 4, "high_missing": 3, "constant": 3, "outliers": 2,
+    "skewed": 2, "all_unique": 1, "some_missing": 1, "unsupported": 1,
+}
+
+
+def anomaly_score(profile: dict) -> float:
+    """Higher means more anomalous; used to decide which columns to keep."""
+    return float(sum(_FLAG_WEIGHTS.get(flag, 1) for flag in anomaly_flags(profile)))
+
+
+def _top_values(profile: dict, n: int = 3) -> str:
+    values = profile.get("top_k_values") or []
+    return ";".join(f"{v.get('value')}:{_fmt(v.get('pct', 0.0) * 100, 3)}%" for v in values[:n])
+
+
+def compact_row(profile: dict, digits: int = 4) -> list[str]:
+    """One CSV row (PROMPT_FIELDS order) for a column profile."""
+    row = dict(profile)
+    if isinstance(row.get("missing_pct"), float):
+        # stored as a fraction; percentages read better for the model
+        row["missing_pct"] = row["missing_pct"] * 100
+    row["top_values"] = _top_values(profile)
+    row["flags"] = " ".join(anomaly_flags(profile))
+    return [_fmt(row.get(field), digits) for field in PROMPT_FIELDS]
+
+
+def encode_profiles(column_profiles: list[dict], digits: int = 4) -> str:
+    """
+    📘 Function: encode_profiles
+
+    Description:
+        Encodes column profiles as a compact CSV table (header + one row per
+        column) with floats rounded to `digits` significant digits and bulk
+        fields left out. Typically 5–10× fewer tokens than json.dumps(indent=2).
+
+    Parameters:
+        column_profiles (list[dict]): Output from column_report()
+        digits (int): Significant digits for floats.
+
+    Returns:
+        str: CSV text. missing_pct is in percent.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(PROMPT_FIELDS)
+    for profile in column_profiles:
+        writer.writerow(compact_row(profile, digits))
+    return buffer.getvalue()
+
+
+def encode_summary(table_summary: dict | None) -> str:
+    """One-line table summary (rows, columns, missing %, column types)."""
+    if not table_summary:
+        return ""
+    parts = [
+        f"rows={table_summary.get('row_count', '?')}",
+        f"columns={table_summary.get('column_count', '?')}",
+        f"missing_pct={_fmt(table_summary.get('missing_pct'))}",
+    ]
+    types = table_summary.get("column_types")
+    if isinstance(types, dict):
+        parts.append("types=" + ",".join(f"{k}:{v}" for k, v in types.items()))
+    return " ".join(parts)
+
+
+_INSTRUCTIONS = """
+You are a smart data analyst AI assistant.
+
+Tone: {tone}
+
+The user uploaded a dataset. Below is a table summary and a CSV with one row
+per column profile (missing_pct in percent; flags mark anomalies such as
+high_missing, outliers, constant, all_unique, skewed).
+Your job is to:
+1. Give 3–5 short but deep insights about this data
+2. Mention if there's anything odd, missing, or worth investigating
+3. Suggest next steps for the user (e.g. visualization, cleaning, validation)
+
+Output should be plain English, easy to understand, and structured.
+""".strip()
+
+_MAP_INSTRUCTIONS = """
+You are a smart data analyst AI assistant.
+
+Below is part {part} of {parts} of a dataset's column profiles, as CSV with one
+row per column (missing_pct in percent; flags mark anomalies).
+List the most important findings for these columns only: data quality
+problems, odd distributions, and columns worth investigating. Be concise
+(at most 8 bullet points) and name the columns.
+""".strip()
+
+_REDUCE_INSTRUCTIONS = """
+You are a smart data analyst AI assistant.
+
+Tone: {tone}
+
+A dataset was too wide to review at once, so its columns were reviewed in
+{parts} groups. The findings for each group are below.
+Your job is to:
+1. Give 3–5 short but deep insights about the whole dataset
+2. Mention if there's anything odd, missing, or worth investigating
+3. Suggest next steps for the user (e.g. visualization, cleaning, validation)
+
+Output should be plain English, easy to understand, and structured.
+""".strip()
+
+
+def _render(instructions: str, table_summary: dict | None, table_csv: str, note: str = "") -> str:
+    sections = [instructions]
+    summary = encode_summary(table_summary)
+    if summary:
+        sections.append(f"TABLE SUMMARY:\n{summary}")
+    sections.append(f"COLUMN PROFILES (CSV):\n{table_csv.strip()}")
+    if note:
+        sections.append(note)
+    return "\n\n".join(sections)
+
+
+def build_table_prompt(table_summary: dict | None, column_profiles: list[dict],
+                       token_budget: int = PROMPT_TOKEN_BUDGET, tone: str = "neutral") -> str:
+    """
+    📘 Function: build_table_prompt
+
+    Description:
+        Builds the table-level insight prompt from compactly encoded profiles.
+        If all columns do not fit in `token_budget`, the columns with the
+        highest anomaly score are kept (in their original order) and the
+        prompt lists how many unflagged columns were left out.
+
+    Parameters:
+        table_summary (dict | None): Output from table_summary()
+        column_profiles (list[dict]): Output from column_report()
+        token_budget (int): Maximum estimated prompt tokens.
+        tone (str): Optional tone ('neutral', 'casual', 'executive', etc.)
+
+    Returns:
+        str: The prompt.
+    """
+    instructions = _INSTRUCTIONS.format(tone=tone)
+    prompt = _render(instructions, table_summary, encode_profiles(column_profiles))
+    if estimate_tokens(prompt) <= token_budget:
+        return prompt
+
+    ranked = sorted(range(len(column_profiles)), key=lambda i: -anomaly_score(column_profiles[i]))
+    header = _render(instructions, table_summary, ",".join(PROMPT_FIELDS),
+                     note=f"NOTE: {len(column_profiles)} of {len(column_profiles)} columns omitted.")
+    used = estimate_tokens(header)
+    keep = []
+    for i in ranked:
+        cost = estimate_tokens(",".join(compact_row(column_profiles[i]))) + 1
+        if used + cost > token_budget:
+            break
+        keep.append(i)
+        used += cost
+
+    keep.sort()
+    omitted = len(column_profiles) - len(keep)
+    logger.info(f"✂️ Prompt over budget ({token_budget} tokens): kept {len(keep)} highest-priority "
+                f"columns, omitted {omitted}")
+    note = (f"NOTE: {omitted} of {len(column_profiles)} columns omitted to fit the prompt size; "
+            "the omitted columns had the fewest anomaly flags.")
+    return _render(instructions, table_summary,
+                   encode_profiles([column_profiles[i] for i in keep]), note=note)
+
+
+def split_profiles(column_profiles: list[dict], token_budget: int = PROMPT_TOKEN_BUDGET) -> list[list[dict]]:
+    """Splits profiles into consecutive groups whose map prompts fit the budget."""
+    overhead = estimate_tokens(_MAP_INSTRUCTIONS) + estimate_tokens(",".join(PROMPT_FIELDS)) + 32
+    room = max(token_budget - overhead, 1)
+
+    groups, current, used = [], [], 0
+    for profile in column_profiles:
+        cost = estimate_tokens(",".join(compact_row(profile))) + 1
+        if current and used + cost > room:
+            groups.append(current)
+            current, used = [], 0
+        current.append(profile)
+        used += cost
+    if current:
+        groups.append(current)
+    return groups
+
+
+def build_map_prompts(column_profiles: list[dict], token_budget: int = PROMPT_TOKEN_BUDGET) -> list[str]:
+    """
+    📘 Function: build_map_prompts
+
+    Description:
+        Map step for tables too wide for one prompt: one prompt per group of
+        columns (see split_profiles), each asking for that group's findings.
+        Combine the answers with build_reduce_prompt().
+
+    Returns:
+        list[str]: One prompt per column group.
+    """
+    groups = split_profiles(column_profiles, token_budget)
+    return [
+        _render(_MAP_INSTRUCTIONS.format(part=i + 1, parts=len(groups)), None, encode_profiles(group))
+        for i, group in enumerate(groups)
+    ]
+
+
+def build_reduce_prompt(table_summary: dict | None, partial_insights: list[str],
+                        tone: str = "neutral") -> str:
+    """Final summarization prompt over the per-group findings from the map step."""
+    sections = [_REDUCE_INSTRUCTIONS.format(tone=tone, parts=len(partial_insights))]
+    summary = encode_summary(table_summary)
+    if summary:
+        sections.append(f"TABLE SUMMARY:\n{summary}")
+    for i, text in enumerate(partial_insights):
+        sections.append(f"FINDINGS FOR GROUP {i + 1}:\n{text.strip()}")
+    return "\n\n".join(sections)
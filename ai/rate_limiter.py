@@ -0,0 +1,111 @@
+# ai/rate_limiter.py
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    🪣 TokenBucket – thread-safe token-bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    Each acquire() takes one token, blocking until one is available, so
+    short bursts of up to `capacity` requests go out immediately while the
+    long-run request rate stays at `rate`.
+
+    Parameters:
+        rate (float): Tokens added per second (requests per second).
+        capacity (int): Maximum burst size.
+
+    Usage Example:
+        limiter = TokenBucket(rate=2, capacity=4)
+        limiter.acquire()
+        query_model(prompt)
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = float(rate)
+        self.capacity = max(1, int(capacity))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        """Takes a token if one is available, without blocking."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def acquire(self) -> None:
+        """Blocks until a token is available, then takes it."""
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class SharedTokenBucket:
+    """
+    🪣 SharedTokenBucket – token bucket shared by several processes.
+
+    Same behaviour and interface as TokenBucket, but the token count and
+    refill time live in shared memory (multiprocessing.Value) behind a
+    multiprocessing.Lock, so all workers of a process pool draw from one
+    budget. Create it in the parent and hand it to the workers through the
+    pool initializer (it cannot be sent with each task).
+
+    Parameters:
+        rate (float): Tokens added per second (requests per second).
+        capacity (int): Maximum burst size.
+        ctx: multiprocessing context (default: the default context).
+    """
+
+    def __init__(self, rate: float, capacity: int = 1, ctx=None):
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        if ctx is None:
+            import multiprocessing as ctx
+        self.rate = float(rate)
+        self.capacity = max(1, int(capacity))
+        self._lock = ctx.Lock()
+        self._tokens = ctx.RawValue("d", float(self.capacity))
+        # time.monotonic() is system-wide on Linux, macOS and Windows
+        self._updated = ctx.RawValue("d", time.monotonic())
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated.value
+        self._tokens.value = min(self.capacity, self._tokens.value + elapsed * self.rate)
+        self._updated.value = now
+
+    def try_acquire(self) -> bool:
+        """Takes a token if one is available, without blocking."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens.value >= 1:
+                self._tokens.value -= 1
+                return True
+            return False
+
+    def acquire(self) -> None:
+        """Blocks until a token is available, then takes it."""
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens.value >= 1:
+                    self._tokens.value -= 1
+                    return
+                wait = (1 - self._tokens.value) / self.rate
+            time.sleep(wait)
@@ -0,0 +1,202 @@
+# benchmarks/annotate_throughput.py
+"""
+Throughput benchmark for the AI annotation path.
+
+Starts the local fake LLM server (ai/models/fake_server.py), points a
+backend at it and runs annotate_profile() over synthetic column profiles
+with different worker counts and batch sizes. This goes through the real
+client code (query_model, pooled HTTP session, rate limiter, cache), so it
+measures concurrency, connection reuse, error handling and caching
+without a live model.
+
+For each configuration it reports wall time, columns/sec, requests seen by
+the server, peak requests in flight, client connections opened and
+columns left with an error insight. With --cache, each configuration runs
+twice against a fresh LLM cache (cold, then warm). The cache is a
+temporary SQLite file owned by the benchmark; the default LLM cache
+(outputs/.cache) is never read or cleared.
+
+Usage:
+    python benchmarks/annotate_throughput.py
+    python benchmarks/annotate_throughput.py --columns 400 --workers 1 4 8 16 --latency 0.2
+    python benchmarks/annotate_throughput.py --error-rate 0.1 --batch-sizes 1 5 --cache --json
+    python benchmarks/annotate_throughput.py --api openai      # needs the openai package
+"""
+import argparse
+import ast
+import contextlib
+import copy
+import io
+import json
+import logging
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT)
+
+BACKEND = "fake"
+
+_BATCH_COLUMN = re.compile(r"^Column (.+):$", re.M)
+
+
+def batch_responder(prompt: str) -> str | None:
+    """Answers annotate_profile's batch prompts with the JSON object they ask for."""
+    if "JSON object mapping each column name" not in prompt:
+        return None
+    names = [ast.literal_eval(m) for m in _BATCH_COLUMN.findall(prompt)]
+    return json.dumps({name: f"{name} looks consistent; check its range and missing values." for name in names})
+
+
+def make_profiles(columns: int, rows: int = 200, seed: int = 0) -> list[dict]:
+    """Column profiles of a synthetic mixed-dtype dataset (no plots)."""
+    from benchmarks.synthetic import make_dataset
+    from eda_core.profile.column_report import column_report
+    from eda_core.transform.infer_dtypes import infer_dtypes
+
+    df, _ = infer_dtypes(make_dataset(rows, columns, seed=seed))
+    return column_report(df, "annotate_bench", plots="none")
+
+
+def run_config(server, profiles: list[dict], workers: int, batch_size: int,
+               requests_per_second: float | None, cache=None) -> dict:
+    """One annotate_profile() run; `cache` is an LLMCache, or None to bypass caching."""
+    from ai.generate_ai_insight import annotate_profile
+    from ai.llm_client import is_error_response
+
+    server.reset_stats()
+    columns = copy.deepcopy(profiles)
+    started = time.perf_counter()
+    annotate_profile(columns, model=BACKEND, max_workers=workers, requests_per_second=requests_per_second,
+                     burst=workers, batch_size=batch_size, cache=cache)
+    wall = time.perf_counter() - started
+
+    stats = server.stats()
+    return {
+        "workers": workers,
+        "batch_size": batch_size,
+        "columns": len(columns),
+        "wall_s": round(wall, 3),
+        "columns_per_sec": round(len(columns) / wall, 1) if wall else None,
+        "requests": stats["requests"],
+        "injected_errors": stats["errors"],
+        "peak_in_flight": stats["peak_in_flight"],
+        "connections": stats["connections"],
+        "error_columns": sum(is_error_response(c.get("ai_insight")) for c in columns),
+    }
+
+
+def run(columns: int = 200, workers: list[int] = (1, 4, 8), batch_sizes: list[int] = (1,),
+        latency: float = 0.05, tokens_per_sec: float = 400.0, tokens: int = 40, error_rate: float = 0.0,
+        requests_per_second: float | None = None, max_connections: int = 8, api: str = "ollama",
+        cache: bool = False, verbose: bool = False) -> dict:
+    """
+    📘 Function: run
+
+    Description:
+        Runs annotate_profile() once per (workers, batch_size) pair against
+        a fake LLM server and returns the measurements.
+
+    Parameters:
+        columns (int): Number of column profiles to annotate.
+        workers (list[int]): annotate_profile max_workers values to try.
+        batch_sizes (list[int]): annotate_profile batch_size values to try.
+        latency (float): Fake server time to first token (s).
+        tokens_per_sec (float): Fake server generation speed.
+        tokens (int): Tokens per fake response.
+        error_rate (float): Share of requests the server fails.
+        requests_per_second (float | None): Client rate limit; None = unlimited.
+        max_connections (int): Client connection pool size.
+        api (str): 'ollama' or 'openai' protocol.
+        cache (bool): Also measure cold and warm LLM-cache runs.
+        verbose (bool): Show the pipeline's own logs.
+
+    Returns:
+        dict: {"server": settings, "results": [one dict per run]}
+    """
+    from ai.llm_cache import LLMCache
+    from ai.models.fake_server import FakeLLMServer, register_fake_backend
+
+    if api == "openai":
+        try:
+            import openai  # noqa: F401
+        except ImportError:
+            # OpenAIBackend would otherwise retry (with back-off) every column before giving up
+            raise SystemExit("❌ --api openai needs the openai package (pip install openai)")
+
+    if not verbose:
+        # Injected errors are counted in the results; their log lines would flood the output
+        logging.disable(logging.ERROR)
+    cache_dir = tempfile.mkdtemp(prefix="eda_llm_cache_")
+
+    settings = {"latency": latency, "tokens_per_sec": tokens_per_sec, "tokens": tokens,
+                "error_rate": error_rate, "api": api, "max_connections": max_connections,
+                "requests_per_second": requests_per_second}
+    results = []
+    try:
+        with FakeLLMServer(latency=latency, tokens_per_sec=tokens_per_sec, tokens=tokens,
+                           error_rate=error_rate, responder=batch_responder) as server:
+            with contextlib.redirect_stdout(sys.stdout if verbose else io.StringIO()):
+                profiles = make_profiles(columns)
+                for batch_size in batch_sizes:
+                    for n_workers in workers:
+                        # A fresh backend (and connection pool) per configuration
+                        register_fake_backend(server, BACKEND, api=api, max_connections=max_connections)
+                        if cache:
+                            # A new, empty cache per configuration so the first run starts cold
+                            llm_cache = LLMCache(path=os.path.join(cache_dir, f"llm_cache_{len(results)}.sqlite"))
+                            for phase in ("cold", "warm"):
+                                result = run_config(server, profiles, n_workers, batch_size,
+                                                    requests_per_second, cache=llm_cache)
+                                results.append({**result, "cache": phase})
+                        else:
+                            result = run_config(server, profiles, n_workers, batch_size,
+                                                requests_per_second, cache=None)
+                            results.append({**result, "cache": "off"})
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    return {"server": settings, "results": results}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="annotate_profile throughput against a fake LLM server")
+    parser.add_argument("--columns", type=int, default=200, help="column profiles to annotate")
+    parser.add_argument("--workers", type=int, nargs="*", default=[1, 4, 8], help="max_workers values")
+    parser.add_argument("--batch-sizes", type=int, nargs="*", default=[1], help="batch_size values")
+    parser.add_argument("--latency", type=float, default=0.05, help="server time to first token (s)")
+    parser.add_argument("--tokens-per-sec", type=float, default=400.0, help="server generation speed")
+    parser.add_argument("--tokens", type=int, default=40, help="tokens per response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests the server fails")
+    parser.add_argument("--rps", type=float, default=0, help="client rate limit (0 = unlimited)")
+    parser.add_argument("--max-connections", type=int, default=8, help="client connection pool size")
+    parser.add_argument("--api", choices=["ollama", "openai"], default="ollama")
+    parser.add_argument("--cache", action="store_true", help="measure cold and warm LLM-cache runs")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--verbose", action="store_true", help="show the pipeline's own logs")
+    args = parser.parse_args()
+
+    report = run(args.columns, args.workers, args.batch_sizes, latency=args.latency,
+                 tokens_per_sec=args.tokens_per_sec, tokens=args.tokens, error_rate=args.error_rate,
+                 requests_per_second=args.rps or None, max_connections=args.max_connections,
+                 api=args.api, cache=args.cache, verbose=args.verbose)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print(f"🧪 Fake server: {report['server']}")
+    print(f"{'workers':>7} {'batch':>5} {'cache':>5} {'wall s':>8} {'cols/s':>8} {'requests':>8} "
+          f"{'in flight':>9} {'conns':>5} {'errors':>6}")
+    for r in report["results"]:
+        print(f"{r['workers']:>7} {r['batch_size']:>5} {r['cache']:>5} {r['wall_s']:>8.2f} "
+              f"{r['columns_per_sec']:>8.1f} {r['requests']:>8} {r['peak_in_flight']:>9} "
+              f"{r['connections']:>5} {r['error_columns']:>6}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
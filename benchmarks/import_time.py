@@ -0,0 +1,173 @@
+# benchmarks/import_time.py
+"""
+Import-time (CLI startup) benchmark.
+
+Imports each entry module in a fresh interpreter with `python -X importtime`
+and reports the cumulative import time. The check that fails the run is
+that no module drags in a heavy dependency it should only load on first use
+(matplotlib, the OpenAI SDK, requests, and pandas for the AI modules).
+
+Absolute times depend on the machine and on disk caches, so they are only
+reported. They can be saved as a baseline and later runs compared against
+it on the same machine; a module slower than the baseline by more than the
+tolerance is flagged as a regression (exit code 1), like
+pipeline_bench.py --compare.
+
+Usage:
+    python benchmarks/import_time.py                          # report times, check imports
+    python benchmarks/import_time.py --save-baseline          # record baseline
+    python benchmarks/import_time.py --compare --tolerance 0.3
+    python benchmarks/import_time.py --repeat 5 --json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "import_baseline.json")
+
+# module -> modules that must NOT be imported as a side effect
+FORBIDDEN = {
+    "ai.llm_client": ["openai", "requests", "matplotlib"],
+    "ai.generate_ai_insight": ["openai", "requests", "matplotlib", "pandas"],
+    "eda_core.profile.column_report": ["matplotlib", "openai", "requests"],
+    "eda_core.profile.table_profile": ["matplotlib", "openai", "requests"],
+}
+
+
+def measure(module: str) -> tuple[float, list[str]]:
+    """
+    Imports `module` in a fresh interpreter.
+
+    Returns:
+        tuple[float, list[str]]: (cumulative import time in ms, top-level
+        packages that ended up in sys.modules)
+    """
+    code = (
+        f"import {module}, sys, json; "
+        "print(json.dumps(sorted({m.split('.')[0] for m in sys.modules})))"
+    )
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, env=env, cwd=ROOT,
+    )
+    if result.returncode != 0:
+        last = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "unknown error"
+        raise RuntimeError(f"import {module} failed: {last}")
+
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        parts = [p.strip() for p in line[len("import time:"):].split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            cumulative_us = int(parts[1])
+
+    loaded = json.loads(result.stdout.strip().splitlines()[-1])
+    return (cumulative_us or 0) / 1000.0, loaded
+
+
+def run(repeat: int = 3) -> list[dict]:
+    results = []
+    for module, forbidden in FORBIDDEN.items():
+        timings = []
+        loaded = []
+        try:
+            for _ in range(repeat):
+                ms, loaded = measure(module)
+                timings.append(ms)
+        except RuntimeError as e:
+            results.append({"module": module, "error": str(e), "ok": False})
+            continue
+        leaked = sorted(set(forbidden) & set(loaded))
+        results.append({
+            "module": module,
+            "best_ms": round(min(timings), 1),
+            "leaked_imports": leaked,
+            "ok": not leaked,
+        })
+    return results
+
+
+def compare(current: list[dict], baseline: list[dict], tolerance: float = 0.3,
+            min_delta_ms: float = 20.0) -> list[dict]:
+    """
+    📘 Function: compare
+
+    Description:
+        Compares import times with a baseline from the same machine. A module
+        regresses if it is more than `tolerance` (fraction) slower than the
+        baseline and by more than `min_delta_ms` (which keeps scheduler
+        noise from being flagged). Modules that failed to import are skipped.
+
+    Returns:
+        list[dict]: One row per module present in both runs, with
+        "baseline_ms", "current_ms", "ratio" and "regression".
+    """
+    base = {r["module"]: r["best_ms"] for r in baseline if "best_ms" in r}
+    rows = []
+    for r in current:
+        if "best_ms" not in r or r["module"] not in base:
+            continue
+        before, now = base[r["module"]], r["best_ms"]
+        rows.append({
+            "module": r["module"],
+            "baseline_ms": before,
+            "current_ms": now,
+            "ratio": round(now / before, 2) if before else None,
+            "regression": now > before * (1 + tolerance) and now - before > min_delta_ms,
+        })
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Import-time startup benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per module (best is kept)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--compare", action="store_true", help="flag regressions against the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="allowed slowdown vs baseline (fraction)")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    rows = []
+    if args.compare:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            rows = compare(results, json.load(f), tolerance=args.tolerance)
+
+    if args.json:
+        print(json.dumps({"results": results, "comparison": rows} if args.compare else results, indent=2))
+    else:
+        for r in results:
+            status = "✅" if r["ok"] else "❌"
+            if "error" in r:
+                print(f"{status} {r['module']:<35} {r['error']}")
+                continue
+            leaked = f"  leaked: {', '.join(r['leaked_imports'])}" if r["leaked_imports"] else ""
+            print(f"{status} {r['module']:<35} {r['best_ms']:>8.1f} ms{leaked}")
+        if args.compare:
+            print(f"\n⚖️ Compared with {args.baseline} (tolerance {args.tolerance:.0%})")
+            for r in rows:
+                status = "❌" if r["regression"] else "✅"
+                print(f"{status} {r['module']:<35} {r['baseline_ms']:>8.1f} ms → {r['current_ms']:>8.1f} ms "
+                      f"(×{r['ratio']})")
+
+    ok = all(r["ok"] for r in results)
+    if args.save_baseline:
+        if ok:
+            with open(args.baseline, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+            print(f"\n💾 Baseline saved to {args.baseline}")
+        else:
+            print("\n⚠️ Not saving a baseline from a failing run")
+
+    return 0 if ok and not any(r["regression"] for r in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,301 @@
+# benchmarks/pipeline_bench.py
+"""
+Pipeline stage benchmark on synthetic workbooks.
+
+For each scenario in benchmarks/synthetic.py (tall 1M×20, wide 10k×1000,
+high-cardinality strings, mixed dtypes with heavy missingness) this times
+every stage of the pipeline: load_excel, infer_dtypes, column_report,
+profile_categorical, detect_outliers, plotting, render_markdown and
+annotate_profile. The LLM is mocked by an in-process backend, so no
+network calls are made. Results can be saved as a baseline and later runs
+compared against it; a stage slower than the baseline by more than the
+tolerance is flagged as a regression (exit code 1). Each stage's result is
+checked (no column profile with an error, non-empty Markdown, ...); a stage
+that fails is reported, exits 1 and is never saved as a baseline.
+
+Workbooks are generated once into benchmarks/.data/; outputs (plots,
+reports) go to a temporary directory.
+
+Usage:
+    python benchmarks/pipeline_bench.py --scale 0.01                      # quick run
+    python benchmarks/pipeline_bench.py --save-baseline                   # full size, record baseline
+    python benchmarks/pipeline_bench.py --compare --tolerance 0.2         # flag regressions
+    python benchmarks/pipeline_bench.py --scenarios wide --repeat 3 --json
+"""
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT)
+
+from benchmarks.synthetic import SCENARIOS, ensure_workbook, scenario_shape
+
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baseline.json")
+TEMPLATE_DIR = os.path.join(ROOT, "eda_core", "io", "templates")
+MOCK_BACKEND = "bench-mock"
+
+class MockBackend:
+    """Deterministic stand-in LLM: answers instantly with text derived from the prompt."""
+
+    model_name = "mock"
+
+    def generate(self, prompt: str) -> str:
+        return f"Mock insight ({len(prompt)} prompt chars): values look plausible."
+
+
+def _timed(results: dict, stage: str, fn, *args, check=None, **kwargs):
+    """
+    Runs and times one stage. `check(value)` returns a problem description
+    (or None); the pipeline's steps log and swallow most errors, so a stage
+    that returns a broken result is recorded with "error" instead of being
+    timed as if it had passed.
+    """
+    from eda_core.utils.instrument import peak_rss_mb
+
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    value = fn(*args, **kwargs)
+    results[stage] = {
+        "wall_s": round(time.perf_counter() - wall_start, 4),
+        "cpu_s": round(time.process_time() - cpu_start, 4),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+    error = check(value) if check else None
+    if error:
+        results[stage]["error"] = error
+    return value
+
+
+def _failed(items, what: str, limit: int = 5) -> str | None:
+    """'<n> <what> failed (a: reason, ...)' for (name, reason) pairs, or None."""
+    items = list(items)
+    if not items:
+        return None
+    shown = ", ".join(f"{name}: {reason}" for name, reason in items[:limit])
+    return f"{len(items)} {what} failed ({shown}{', ...' if len(items) > limit else ''})"
+
+
+def _check_profiles(profiles: list[dict]) -> str | None:
+    return _failed(((p.get("column"), p["error"]) for p in profiles if "error" in p), "column profiles")
+
+
+def _check_results(results: list[dict], columns: list) -> str | None:
+    return _failed(((c, r["error"]) for c, r in zip(columns, results) if isinstance(r, dict) and "error" in r),
+                   "columns")
+
+
+def _check_plots(profiles: list[dict]) -> str | None:
+    return _failed(((p.get("column"), "no histogram") for p in profiles
+                    if p.get("plot_spec") and not p.get("histogram_path")), "plots")
+
+
+def _check_markdown(text: str) -> str | None:
+    return None if text else "render_markdown returned no text"
+
+
+def _check_insights(profiles: list[dict]) -> str | None:
+    from ai.llm_client import is_error_response
+
+    return _failed(((p.get("column"), p.get("ai_insight")) for p in profiles
+                    if is_error_response(p.get("ai_insight"))), "column insights")
+
+
+def run_scenario(path: str, n_jobs: int = 1) -> dict:
+    """
+    Runs every stage once on the workbook at `path` (in the current
+    directory's outputs/) and returns {stage: {wall_s, cpu_s, peak_rss_mb}},
+    plus "error" for a stage whose result failed its check.
+    """
+    import pandas as pd
+    from ai.generate_ai_insight import annotate_profile
+    from eda_core.io.load_excel import load_excel
+    from eda_core.io.render_markdown import render_markdown
+    from eda_core.io.save_output import get_base_filename
+    from eda_core.plots.plot_utils import render_plots
+    from eda_core.profile.column_report import column_report
+    from eda_core.profile.detect_outliers import detect_outliers
+    from eda_core.profile.profile_categorical import profile_categorical
+    from eda_core.profile.table_profile import table_summary
+    from eda_core.transform.infer_dtypes import infer_dtypes
+
+    source = get_base_filename(path)
+    results = {}
+
+    df = _timed(results, "load_excel", load_excel, path, use_cache=False,
+                check=lambda d: None if len(d.columns) else "no data loaded")
+    df, _ = _timed(results, "infer_dtypes", infer_dtypes, df)
+    profiles = _timed(results, "column_report", column_report, df, source, n_jobs=n_jobs, plots="lazy",
+                      check=_check_profiles)
+
+    text_columns = [c for c in df.columns
+                    if pd.api.types.is_string_dtype(df[c]) or isinstance(df[c].dtype, pd.CategoricalDtype)]
+    numeric_columns = [c for c in df.columns
+                       if pd.api.types.is_numeric_dtype(df[c]) and not pd.api.types.is_bool_dtype(df[c])]
+    _timed(results, "profile_categorical", lambda: [profile_categorical(df[c]) for c in text_columns],
+           check=lambda r: _check_results(r, text_columns))
+    _timed(results, "detect_outliers", lambda: [detect_outliers(df[c]) for c in numeric_columns],
+           check=lambda r: _check_results(r, numeric_columns))
+
+    _timed(results, "plotting", render_plots, profiles, source, check=_check_plots)
+    summary = table_summary(df, file_path=path)
+    file_meta = {"source_name": source, "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+    _timed(results, "render_markdown", render_markdown, profiles, summary, file_meta, template_dir=TEMPLATE_DIR,
+           check=_check_markdown)
+
+    _timed(results, "annotate_profile", annotate_profile, profiles, model=MOCK_BACKEND,
+           max_workers=4, requests_per_second=None, check=_check_insights)
+    return results
+
+
+def run(scenarios: list[str], scale: float = 1.0, repeat: int = 1, n_jobs: int = 1,
+        verbose: bool = False) -> dict:
+    """
+    Benchmarks each scenario `repeat` times and keeps the best wall time per
+    stage (or the failure, if a stage failed its check in any repeat).
+    """
+    from ai.llm_client import register_backend
+
+    if not verbose:
+        # Per-column log lines and prints would dominate the output (and the timings)
+        logging.disable(logging.INFO)
+
+    os.environ["LLM_CACHE"] = "off"  # every annotation must reach the (mock) backend
+    register_backend(MOCK_BACKEND, MockBackend)
+
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "scale": scale,
+        "scenarios": {},
+    }
+    cwd = os.getcwd()
+    for name in scenarios:
+        path = ensure_workbook(name, scale)
+        best = {}
+        for _ in range(repeat):
+            workdir = tempfile.mkdtemp(prefix="eda_bench_")
+            os.chdir(workdir)
+            try:
+                with contextlib.redirect_stdout(sys.stdout if verbose else io.StringIO()):
+                    stages = run_scenario(path, n_jobs=n_jobs)
+            finally:
+                os.chdir(cwd)
+                shutil.rmtree(workdir, ignore_errors=True)
+            for stage, timing in stages.items():
+                # A failure in any repeat is kept: its time does not measure the real work
+                if "error" in timing or stage not in best or (
+                        "error" not in best[stage] and timing["wall_s"] < best[stage]["wall_s"]):
+                    best[stage] = timing
+        rows, cols = scenario_shape(name, scale)
+        report["scenarios"][name] = {"rows": rows, "cols": cols, "stages": best}
+    return report
+
+
+def compare(current: dict, baseline: dict, tolerance: float = 0.25, min_delta: float = 0.05) -> list[dict]:
+    """
+    📘 Function: compare
+
+    Description:
+        Compares stage wall times with a baseline run of the same scale.
+        A stage regresses if it is more than `tolerance` (fraction) slower
+        than the baseline and by more than `min_delta` seconds (which keeps
+        millisecond-level noise from being flagged). Failed stages (see
+        failed_stages()) are not compared.
+
+    Returns:
+        list[dict]: One row per scenario/stage present in both runs, with
+        "baseline_s", "current_s", "ratio" and "regression".
+    """
+    if baseline.get("scale") != current.get("scale"):
+        raise ValueError(f"Baseline scale {baseline.get('scale')} does not match current scale "
+                         f"{current.get('scale')}")
+    rows = []
+    for name, scenario in current["scenarios"].items():
+        base_stages = baseline.get("scenarios", {}).get(name, {}).get("stages", {})
+        for stage, timing in scenario["stages"].items():
+            if stage not in base_stages or "error" in timing or "error" in base_stages[stage]:
+                continue
+            base, cur = base_stages[stage]["wall_s"], timing["wall_s"]
+            rows.append({
+                "scenario": name,
+                "stage": stage,
+                "baseline_s": base,
+                "current_s": cur,
+                "ratio": round(cur / base, 2) if base else None,
+                "regression": cur > base * (1 + tolerance) and cur - base > min_delta,
+            })
+    return rows
+
+
+def failed_stages(report: dict) -> list[tuple]:
+    """(scenario, stage, error) for every stage that failed its result check."""
+    return [(name, stage, timing["error"])
+            for name, scenario in report["scenarios"].items()
+            for stage, timing in scenario["stages"].items() if "error" in timing]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Pipeline stage benchmark on synthetic workbooks")
+    parser.add_argument("--scenarios", nargs="*", default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument("--scale", type=float, default=1.0, help="row count multiplier (e.g. 0.01 for a quick run)")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per scenario (best is kept)")
+    parser.add_argument("--n-jobs", type=int, default=1, help="column_report workers")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--compare", action="store_true", help="flag regressions against the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown (fraction)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--verbose", action="store_true", help="show the pipeline's own logs")
+    args = parser.parse_args()
+
+    report = run(args.scenarios, scale=args.scale, repeat=args.repeat, n_jobs=args.n_jobs,
+                 verbose=args.verbose)
+
+    rows = []
+    if args.compare:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            rows = compare(report, json.load(f), tolerance=args.tolerance)
+
+    if args.json:
+        print(json.dumps({**report, "comparison": rows}, indent=2))
+    else:
+        for name, scenario in report["scenarios"].items():
+            print(f"\n📊 {name} ({scenario['rows']}×{scenario['cols']})")
+            for stage, timing in scenario["stages"].items():
+                print(f"   {stage:<20} {timing['wall_s']:>9.3f} s  (CPU {timing['cpu_s']:.3f} s, "
+                      f"peak RSS {timing['peak_rss_mb']} MB)" + ("  ❌ FAILED" if "error" in timing else ""))
+        if rows:
+            print(f"\n⚖️ Compared with {args.baseline} (tolerance {args.tolerance:.0%})")
+            for r in rows:
+                status = "❌" if r["regression"] else "✅"
+                print(f"{status} {r['scenario']:<18} {r['stage']:<20} {r['baseline_s']:>9.3f} s → "
+                      f"{r['current_s']:>9.3f} s  (×{r['ratio']})")
+
+    failures = failed_stages(report)
+    for name, stage, error in failures:
+        print(f"❌ {name}/{stage} failed: {error}", file=sys.stderr)
+
+    if args.save_baseline:
+        if failures:
+            print(f"\n⚠️ Baseline not saved: {len(failures)} stage(s) failed", file=sys.stderr)
+        else:
+            with open(args.baseline, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            print(f"\n💾 Baseline saved to {args.baseline}")
+
+    return 1 if failures or any(r["regression"] for r in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
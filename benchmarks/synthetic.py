@@ -0,0 +1,139 @@
+# benchmarks/synthetic.py
+"""
+Synthetic workbooks for the pipeline benchmark.
+
+Datasets are generated from a seed, so every run of a scenario sees the
+same values. Column kinds cycle through COLUMN_KINDS so any width gets a
+mix of dtypes; each column gets its own missing rate.
+
+Usage:
+    df = make_dataset(rows=10_000, cols=50, seed=0)
+    path = ensure_workbook("wide", scale=0.1)
+"""
+import os
+import numpy as np
+import pandas as pd
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".data")
+
+# Every column kind the profilers treat differently
+COLUMN_KINDS = [
+    "float",           # normal
+    "int",             # poisson counts
+    "skewed",          # lognormal with a tail of outliers
+    "category",        # ~10 labels
+    "bool",
+    "date",
+    "numeric_string",  # numbers stored as text (exercises infer_dtypes)
+    "id",              # high-cardinality strings
+]
+
+# name -> (rows, cols, column kinds, missing rate range); rows are multiplied by --scale
+SCENARIOS = {
+    "tall": {"rows": 1_000_000, "cols": 20, "kinds": COLUMN_KINDS, "missing": (0.0, 0.1)},
+    "wide": {"rows": 10_000, "cols": 1000, "kinds": COLUMN_KINDS, "missing": (0.0, 0.1)},
+    "high_cardinality": {"rows": 200_000, "cols": 8, "kinds": ["id", "id", "category", "float"],
+                         "missing": (0.0, 0.05)},
+    "mixed_missing": {"rows": 100_000, "cols": 40, "kinds": COLUMN_KINDS, "missing": (0.0, 0.8)},
+}
+
+
+def _column(kind: str, rows: int, rng: np.random.Generator) -> pd.Series:
+    if kind == "float":
+        return pd.Series(rng.normal(100.0, 15.0, rows))
+    if kind == "int":
+        return pd.Series(rng.poisson(20, rows))
+    if kind == "skewed":
+        values = rng.lognormal(3.0, 1.0, rows)
+        values[rng.random(rows) < 0.01] *= 50
+        return pd.Series(values)
+    if kind == "category":
+        labels = np.array([f"label_{i}" for i in range(10)], dtype=object)
+        return pd.Series(labels[rng.integers(0, len(labels), rows)])
+    if kind == "bool":
+        return pd.Series(rng.random(rows) < 0.3)
+    if kind == "date":
+        start = np.datetime64("2020-01-01")
+        return pd.Series(start + rng.integers(0, 5 * 365, rows).astype("timedelta64[D]"))
+    if kind == "numeric_string":
+        return pd.Series(np.round(rng.normal(50.0, 10.0, rows), 2).astype(str).astype(object))
+    if kind == "id":
+        # ~rows distinct values
+        return pd.Series(np.char.add("id_", rng.integers(0, rows * 10, rows).astype(str)).astype(object))
+    raise ValueError(f"Unknown column kind: {kind}")
+
+
+def make_dataset(rows: int, cols: int, kinds: list[str] | None = None,
+                 missing: tuple[float, float] = (0.0, 0.1), seed: int = 0) -> pd.DataFrame:
+    """
+    📘 Function: make_dataset
+
+    Description:
+        Builds a deterministic DataFrame with `cols` columns cycling through
+        `kinds`. Each column gets a missing rate drawn uniformly from the
+        `missing` range and that share of its cells set to missing.
+
+    Parameters:
+        rows (int): Number of rows.
+        cols (int): Number of columns.
+        kinds (list[str] | None): Column kinds to cycle through (default COLUMN_KINDS).
+        missing (tuple[float, float]): Range of per-column missing rates.
+        seed (int): Random seed.
+
+    Returns:
+        pd.DataFrame: Columns named "<kind>_<index>".
+    """
+    kinds = kinds or COLUMN_KINDS
+    rng = np.random.default_rng(seed)
+    data = {}
+    for i in range(cols):
+        kind = kinds[i % len(kinds)]
+        series = _column(kind, rows, rng)
+        rate = rng.uniform(*missing)
+        if rate > 0:
+            series = series.astype(object) if kind in ("bool", "int") else series
+            series[rng.random(rows) < rate] = None
+        data[f"{kind}_{i}"] = series
+    return pd.DataFrame(data)
+
+
+def write_workbook(df: pd.DataFrame, path: str) -> str:
+    """Writes `df` to .xlsx with openpyxl's write-only mode (streams rows; much faster than to_excel)."""
+    from openpyxl import Workbook
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("data")
+    sheet.append([str(c) for c in df.columns])
+
+    columns = []
+    for col in df.columns:
+        values = df[col]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            values = values.dt.to_pydatetime()
+        columns.append(pd.Series(values, dtype=object).where(pd.notna(df[col]), None).tolist())
+    for row in zip(*columns):
+        sheet.append(row)
+
+    workbook.save(path + ".tmp")
+    os.replace(path + ".tmp", path)
+    return path
+
+
+def scenario_shape(name: str, scale: float = 1.0) -> tuple[int, int]:
+    spec = SCENARIOS[name]
+    return max(1, int(spec["rows"] * scale)), spec["cols"]
+
+
+def ensure_workbook(name: str, scale: float = 1.0, seed: int = 0, data_dir: str = DATA_DIR) -> str:
+    """
+    Path of the scenario's workbook in benchmarks/.data/, generated on first
+    use (writing the 1M-row workbook takes a few minutes).
+    """
+    rows, cols = scenario_shape(name, scale)
+    path = os.path.join(data_dir, f"{name}_{rows}x{cols}_seed{seed}.xlsx")
+    if not os.path.exists(path):
+        spec = SCENARIOS[name]
+        print(f"🧪 Generating {name} workbook ({rows}×{cols}) → {path}")
+        write_workbook(make_dataset(rows, cols, spec["kinds"], spec["missing"], seed), path)
+    return path
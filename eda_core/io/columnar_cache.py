@@ -0,0 +1,118 @@
+# eda_core/io/columnar_cache.py
+import json
+import os
+import pandas as pd
+from eda_core.utils.logger_utils import setup_logger
+
+logger = setup_logger("columnar_cache")
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # optional, caching is skipped without it
+    pa = None
+    feather = None
+
+FRAME_CACHE_DIR = os.getenv("FRAME_CACHE_DIR", os.path.join("outputs", ".cache", "frames"))
+# Bump when the cached layout or the producing code changes incompatibly
+CACHE_VERSION = "2"
+
+
+def frame_cache_enabled() -> bool:
+    """True if pyarrow is installed and FRAME_CACHE is not set to 'off'."""
+    if os.getenv("FRAME_CACHE", "on").lower() in ("off", "0", "false", "no"):
+        return False
+    return feather is not None
+
+
+def _cache_base(fingerprint: str, stage: str) -> str:
+    return os.path.join(FRAME_CACHE_DIR, f"{fingerprint}_{stage}_v{CACHE_VERSION}")
+
+
+def read_cached_frame(fingerprint: str, stage: str) -> tuple[pd.DataFrame, dict] | None:
+    """
+    📘 Function: read_cached_frame
+
+    Description:
+        Loads a cached DataFrame (Arrow IPC / Feather, memory-mapped) and its
+        JSON metadata for the given file fingerprint and pipeline stage
+        (e.g. "raw" for load_excel, "typed" for infer_dtypes).
+
+    Parameters:
+        fingerprint (str): Source file fingerprint.
+        stage (str): Pipeline stage name.
+
+    Returns:
+        tuple[pd.DataFrame, dict] | None: (frame, metadata), or None on a miss.
+    """
+    if not frame_cache_enabled():
+        return None
+
+    base = _cache_base(fingerprint, stage)
+    if not os.path.exists(base + ".feather"):
+        return None
+
+    try:
+        table = feather.read_table(base + ".feather", memory_map=True)
+        df = table.to_pandas()
+        meta = {}
+        if os.path.exists(base + ".json"):
+            with open(base + ".json", "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        logger.info(f"♻️ Loaded cached '{stage}' frame {df.shape} for {fingerprint[:12]}")
+        return df, meta
+    except Exception as e:
+        logger.warning(f"⚠️ Ignoring unreadable frame cache {base}: {e}")
+        return None
+
+
+def write_cached_frame(df: pd.DataFrame, fingerprint: str, stage: str, meta: dict | None = None) -> str:
+    """
+    📘 Function: write_cached_frame
+
+    Description:
+        Writes a DataFrame to the columnar cache as uncompressed Feather (so it
+        can be memory-mapped on read), plus optional JSON metadata. Frames that
+        Arrow cannot represent losslessly (non-string column names, a custom
+        index, mixed-type object columns) are skipped with a warning.
+
+    Parameters:
+        df (pd.DataFrame): Frame to cache.
+        fingerprint (str): Source file fingerprint.
+        stage (str): Pipeline stage name.
+        meta (dict | None): JSON-serializable metadata stored next to the frame.
+
+    Returns:
+        str: Path of the cached file, or "" if nothing was written.
+    """
+    if not frame_cache_enabled():
+        return ""
+
+    if not all(isinstance(col, str) for col in df.columns) or not df.columns.is_unique:
+        logger.info(f"⏭️ Not caching '{stage}' frame: column names must be unique strings")
+        return ""
+    if not isinstance(df.index, pd.RangeIndex) or df.index.start != 0 or df.index.step != 1:
+        logger.info(f"⏭️ Not caching '{stage}' frame: only a default RangeIndex is supported")
+        return ""
+
+    base = _cache_base(fingerprint, stage)
+    try:
+        os.makedirs(FRAME_CACHE_DIR, exist_ok=True)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+
+        # Write to temp files first so readers never see a partial cache entry
+        feather.write_feather(table, base + ".feather.tmp", compression="uncompressed")
+        with open(base + ".json.tmp", "w", encoding="utf-8") as f:
+            json.dump(meta or {}, f, ensure_ascii=False, default=str)
+        os.replace(base + ".json.tmp", base + ".json")
+        os.replace(base + ".feather.tmp", base + ".feather")
+
+        logger.info(f"💾 Cached '{stage}' frame to {base}.feather")
+        return base + ".feather"
+
+    except Exception as e:
+        logger.warning(f"⚠️ Could not cache '{stage}' frame: {e}")
+        for suffix in (".feather.tmp", ".json.tmp"):
+            if os.path.exists(base + suffix):
+                os.remove(base + suffix)
+        return ""
@@ -1,25 +1,42 @@
 import os
 import argparse
+import datetime as dt
 import pandas as pd
 from typing import Iterator
 from eda_core.utils.logger_utils import setup_logger
+from eda_core.utils.instrument import instrument
+from eda_core.utils.fingerprint import file_fingerprint
+from eda_core.io.columnar_cache import frame_cache_enabled, read_cached_frame, write_cached_frame
 
 
 
 logger = setup_logger("load_excel")
 
-def load_excel(file_path: str, chunksize: int | None = None) -> pd.DataFrame | Iterator[pd.DataFrame]:
+@instrument
+def load_excel(
+    file_path: str,
+    chunksize: int | None = None,
+    use_cache: bool = True,
+) -> pd.DataFrame | Iterator[pd.DataFrame]:
     """
     📘 Function: load_excel
 
     Description:
         Loads an Excel file (.xlsx or .xls) using pandas.
         - If chunksize is None, loads the entire sheet into memory.
-        - If chunksize is provided, returns an iterator over DataFrame chunks.
+        - If chunksize is provided, streams the sheet through openpyxl's
+          read-only cursor and returns an iterator over DataFrame chunks
+          (see iter_excel_chunks). Only .xlsx is supported in this mode.
+
+        Full loads go through a columnar cache (see columnar_cache): after the
+        first parse the DataFrame is written as Feather, keyed by the file
+        fingerprint, and later loads of the unchanged file memory-map that
+        cache instead of re-parsing the workbook.
 
     Parameters:
         file_path (str): Full path to the Excel file to load.
         chunksize (int | None): Number of rows per chunk. If None, loads full DataFrame.
+        use_cache (bool): Read/write the columnar cache for full loads.
 
     Returns:
         pd.DataFrame: If chunksize is None.
@@ -45,19 +62,224 @@ def load_excel(file_path: str, chunksize: int | None = None) -> pd.DataFrame | I
         logger.error("Unsupported file format")
         raise ValueError("Only .xlsx or .xls files are supported.")
 
+    if chunksize is not None:
+        if chunksize <= 0:
+            raise ValueError("chunksize must be a positive integer.")
+        if not file_path.lower().endswith(".xlsx"):
+            logger.error("Chunked reading requires an .xlsx file")
+            raise ValueError("Chunked reading is only supported for .xlsx files.")
+        logger.info(f"Returning streaming reader with chunksize={chunksize}")
+        return iter_excel_chunks(file_path, chunksize=chunksize)
+
+    fingerprint = None
+    if use_cache and frame_cache_enabled():
+        fingerprint = file_fingerprint(file_path)
+        cached = read_cached_frame(fingerprint, "raw")
+        if cached is not None:
+            return cached[0]
+
     try:
-        if chunksize is None:
-            df = pd.read_excel(file_path, engine="openpyxl")
-            logger.info(f"Successfully loaded file into DataFrame with shape {df.shape}")
-            return df
-        else:
-            logger.info(f"Returning chunked reader with chunksize={chunksize}")
-            return pd.read_excel(file_path, engine="openpyxl", chunksize=chunksize)
+        df = pd.read_excel(file_path, engine="openpyxl")
+        logger.info(f"Successfully loaded file into DataFrame with shape {df.shape}")
+        if fingerprint:
+            write_cached_frame(df, fingerprint, "raw", {"source_file": file_path})
+        return df
 
     except Exception as e:
         logger.exception("Error reading Excel file")
         raise IOError(f"Error reading Excel file: {e}")
 
+
+def _is_int(v) -> bool:
+    return isinstance(v, int) and not isinstance(v, bool)
+
+
+def _is_number(v) -> bool:
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+
+# Locked dtype -> test every non-missing cell must pass
+_FITS = {
+    "Int64": lambda v: _is_int(v) or (isinstance(v, float) and v.is_integer()),
+    "float64": _is_number,
+    "boolean": lambda v: isinstance(v, bool),
+    "datetime64[ns]": lambda v: isinstance(v, (dt.datetime, dt.date)),
+    "object": lambda v: True,
+}
+
+# Next dtype to try when a later chunk has values the locked dtype cannot hold
+_WIDER = {"Int64": "float64", "float64": "object", "boolean": "object", "datetime64[ns]": "object"}
+
+
+def _infer_chunk_dtype(values: pd.Series) -> str:
+    """
+    Picks the dtype a streamed column is locked to, based on the first chunk.
+
+    Whole numbers use the nullable Int64 (exact for large IDs, and a blank
+    cell in a later chunk does not flip the column to float64).
+    """
+    non_null = values.dropna()
+    if non_null.empty:
+        return "object"
+    for dtype in ("boolean", "Int64", "float64", "datetime64[ns]"):
+        if non_null.map(_FITS[dtype]).all():
+            return dtype
+    return "object"
+
+
+def _cast(raw: pd.Series, dtype: str) -> pd.Series:
+    if dtype == "Int64":
+        return pd.Series(pd.array([None if pd.isna(v) else int(v) for v in raw], dtype="Int64"), index=raw.index)
+    if dtype == "float64":
+        return pd.to_numeric(raw).astype("float64")
+    if dtype == "datetime64[ns]":
+        return pd.to_datetime(raw).astype("datetime64[ns]")
+    if dtype == "boolean":
+        return raw.astype("boolean")
+    return raw.astype("object")
+
+
+def _coerce_chunk(chunk: pd.DataFrame, schema: dict) -> pd.DataFrame:
+    """
+    Casts a raw (object) chunk to the locked schema.
+
+    No value is dropped: if a chunk has cells the locked dtype cannot hold
+    (e.g. text in a numeric column), the column is widened (Int64 → float64
+    → object) from that chunk on, the new dtype is kept in `schema` for the
+    following chunks, and the change is logged.
+    """
+    for col, dtype in schema.items():
+        raw = chunk[col]
+        non_null = raw.dropna()
+        widened = dtype
+        while not non_null.map(_FITS[widened]).all():
+            widened = _WIDER[widened]
+        if widened != dtype:
+            logger.warning(f"⚠️ {col}: values from row {raw.index[0]} on do not fit the locked dtype {dtype}; "
+                           f"switching the column to {widened}")
+            schema[col] = widened
+        chunk[col] = _cast(raw, widened)
+    return chunk
+
+
+def _dedupe_columns(names: list[str]) -> list[str]:
+    """Renames repeated header names the way pandas' readers do: a, a.1, a.2, ..."""
+    counts = {}
+    result = []
+    for name in names:
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[name] = count + 1
+            name = f"{name}.{count}"
+            count = counts.get(name, 0)
+        counts[name] = count + 1
+        result.append(name)
+    return result
+
+
+def iter_excel_chunks(
+    file_path: str,
+    chunksize: int = 100_000,
+    sheet_name: str | None = None,
+    dtype: dict | None = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    📘 Function: iter_excel_chunks
+
+    Description:
+        Streams an .xlsx sheet row by row through openpyxl's read-only
+        `iter_rows` cursor and yields DataFrames of at most `chunksize` rows.
+        Only one chunk of raw rows is held at a time, so peak memory is bounded
+        by the chunk size rather than by the file size.
+
+        The first row is used as the header. Column dtypes are locked after the
+        first chunk (whole numbers → Int64, other numbers → float64, boolean,
+        datetime64[ns], else object) and every later chunk is cast to the same
+        schema. A later chunk with values the locked dtype cannot hold widens
+        that column (Int64 → float64 → object) instead of losing the values,
+        so the dtype can change once per column; this is logged. Fully empty
+        rows are skipped.
+
+    Parameters:
+        file_path (str): Path to the .xlsx file.
+        chunksize (int): Maximum number of rows per yielded DataFrame.
+        sheet_name (str | None): Sheet to read. Defaults to the first sheet.
+        dtype (dict | None): Optional {column: dtype} overrides for the locked
+            schema ("Int64", "float64", "boolean", "datetime64[ns]" or "object").
+
+    Yields:
+        pd.DataFrame: Consecutive chunks of the sheet with a stable schema.
+
+    Raises:
+        IOError: If the workbook cannot be opened or read.
+    """
+    from openpyxl import load_workbook
+
+    logger.info(f"Entering function iter_excel_chunks() with chunksize={chunksize}")
+
+    try:
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+    except Exception as e:
+        logger.exception("Error opening Excel file")
+        raise IOError(f"Error reading Excel file: {e}")
+
+    try:
+        sheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        rows = sheet.iter_rows(values_only=True)
+
+        header = next(rows, None)
+        if header is None:
+            logger.warning("Sheet is empty, nothing to stream")
+            return
+        columns = _dedupe_columns([
+            str(name) if name is not None else f"Unnamed: {i}"
+            for i, name in enumerate(header)
+        ])
+        width = len(columns)
+
+        schema = None
+        buffer = []
+        chunk_count = 0
+        row_count = 0
+
+        def build_chunk(records):
+            nonlocal schema
+            # Raw cells stay Python objects (no float inference) until cast to the schema
+            chunk = pd.DataFrame(records, columns=columns, dtype=object)
+            chunk.index = pd.RangeIndex(row_count - len(records), row_count)
+            if schema is None:
+                schema = {col: _infer_chunk_dtype(chunk[col]) for col in columns}
+                schema.update(dtype or {})
+                logger.info(f"Locked streaming schema: {schema}")
+            return _coerce_chunk(chunk, schema)
+
+        for row in rows:
+            if all(v is None for v in row):
+                continue
+            # Read-only sheets may report ragged rows; pad/truncate to the header width
+            if len(row) != width:
+                row = (tuple(row) + (None,) * width)[:width]
+            buffer.append(row)
+            row_count += 1
+
+            if len(buffer) >= chunksize:
+                chunk_count += 1
+                yield build_chunk(buffer)
+                buffer = []
+
+        if buffer:
+            chunk_count += 1
+            yield build_chunk(buffer)
+
+        logger.info(f"Streamed {row_count} rows in {chunk_count} chunk(s)")
+
+    except Exception as e:
+        logger.exception("Error streaming Excel file")
+        raise IOError(f"Error reading Excel file: {e}")
+    finally:
+        workbook.close()
+
+
 def main():
     """
     🧪 Manual CLI Test Interface
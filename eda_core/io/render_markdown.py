@@ -4,6 +4,7 @@ import os
 from jinja2 import Environment, FileSystemLoader
 from datetime import datetime
 from eda_core.utils.logger_utils import setup_logger
+from eda_core.utils.instrument import instrument
 
 logger = setup_logger("render_markdown")
 
@@ -39,6 +40,7 @@ logger = setup_logger("render_markdown")
 #         return ""
 
 
+@instrument
 def render_markdown(column_profiles, table_summary, file_meta, template_dir="eda_core/io/templates") -> str:
     """
     Render a Markdown report using Jinja2 template
@@ -60,7 +62,15 @@ def render_markdown(column_profiles, table_summary, file_meta, template_dir="eda
         for k, v in default_table_summary.items():
             table_summary.setdefault(k, v)
 
+        # Profiles built with plots="lazy" only carry a plot spec until a report needs the images
+        if any("plot_spec" in col and not col.get("histogram_path") for col in column_profiles):
+            from eda_core.plots.plot_utils import render_plots
+            render_plots(column_profiles, file_meta["source_name"])
+
         for col in column_profiles:
+            col.setdefault("plot_files", [
+                os.path.basename(col[key]) for key in ("histogram_path", "boxplot_path") if col.get(key)
+            ])
             col.setdefault("missing", 0)
             col.setdefault("missing_pct", "0.00%")
             col.setdefault("outlier_count", 0)
@@ -4,6 +4,7 @@ import os
 import json
 from datetime import datetime
 from eda_core.utils.logger_utils import setup_logger
+from eda_core.utils.instrument import instrument
 
 logger = setup_logger("save_output")
 
@@ -35,6 +36,7 @@ def get_output_subfolder(source_filename: str, subfolder: str) -> str:
     return folder_path
 
 
+@instrument
 def save_json(data: dict, file_prefix: str = "insight", original_filename: str ="") -> str:
     """
     💾 Save final AI-generated insight to a JSON file.
@@ -65,7 +67,18 @@ def save_json(data: dict, file_prefix: str = "insight", original_filename: str =
         logger.error(f"❌ Failed to save insight JSON: {e}")
         return ""
 
+def get_insight_stream_path(original_filename: str = "", file_prefix: str = "insight_stream") -> str:
+    """
+    Path for an insight that is written progressively while it streams in,
+    e.g. outputs/blahblah/insights/insight_stream_20250713_203109_blahblah.md
+    """
+    output_dir = get_output_subfolder(original_filename, "insights")
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    base_name = os.path.splitext(os.path.basename(original_filename))[0]
+    return os.path.join(output_dir, f"{file_prefix}_{timestamp}_{base_name}.md")
+
 # eda_core/io/save_output.py — extend with:
+@instrument
 def save_table_insight(insight_text: str, original_filename: str = "") -> str:
     try:
         output_dir = get_output_subfolder(original_filename, "insights")
@@ -82,6 +95,7 @@ def save_table_insight(insight_text: str, original_filename: str = "") -> str:
         logger.error(f"❌ Failed to save table insight: {e}")
         return ""
 
+@instrument
 def save_markdown(markdown_text: str, original_filename: str) -> str:
     """
     💾 Save rendered markdown report into the correct output/docs folder
@@ -109,4 +123,29 @@ def save_markdown(markdown_text: str, original_filename: str) -> str:
 
     except Exception as e:
         logger.error(f"❌ Failed to save markdown report: {e}")
-        return ""
\ No newline at end of file
+        return ""
+
+
+def save_run_report(report: dict, original_filename: str) -> str:
+    """
+    💾 Save an instrumentation run report (see eda_core.utils.instrument)
+    next to table_profile.json, e.g. outputs/blahblah/stats/run_report.json.
+
+    Parameters:
+        report (dict): Output from build_run_report()
+        original_filename (str): Source file name
+
+    Returns:
+        str: Full path to the saved report ("" on failure)
+    """
+    try:
+        target = os.path.join(get_output_subfolder(original_filename, "stats"), "run_report.json")
+        with open(target + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+        os.replace(target + ".tmp", target)
+        logger.info(f"⏱️ Run report saved to {target}")
+        return target
+
+    except Exception as e:
+        logger.error(f"❌ Failed to save run report: {e}")
+        return ""
@@ -0,0 +1,121 @@
+# eda_core/plots/plot_spec.py
+import math
+import numpy as np
+import pandas as pd
+
+HIST_BINS = 30
+# Most outlier markers drawn per box plot; beyond this a sample is drawn
+MAX_FLIERS = 100
+
+
+def histogram_counts(values: np.ndarray, bins: int = HIST_BINS, value_range: tuple | None = None) -> tuple:
+    """
+    Bin counts for a histogram with np.histogram.
+
+    `value_range` should be the (min, max) already computed by the profiler,
+    which saves np.histogram its own min/max scan. NaNs must be removed.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (counts, bin_edges)
+    """
+    if value_range is not None and not all(map(math.isfinite, value_range)):
+        value_range = None
+    if value_range is not None and value_range[0] == value_range[1]:
+        value_range = (value_range[0] - 0.5, value_range[1] + 0.5)
+    return np.histogram(values, bins=bins, range=value_range)
+
+
+def numeric_values(series: pd.Series) -> np.ndarray:
+    """Non-missing values of a numeric column as float64."""
+    return series.dropna().to_numpy(dtype="float64")
+
+
+def value_range(stats: dict | None) -> tuple | None:
+    """(min, max) from a numeric profile, if it has them."""
+    if stats and "min" in stats and "max" in stats:
+        return stats["min"], stats["max"]
+    return None
+
+
+def sample_fliers(fliers: np.ndarray, max_fliers: int = MAX_FLIERS, random_state: int | None = 0) -> np.ndarray:
+    """
+    At most `max_fliers` outlier values for drawing: the two extremes are
+    always kept (so the plotted range stays exact), the rest is a uniform
+    random sample without replacement.
+    """
+    if len(fliers) <= max_fliers:
+        return np.sort(fliers)
+    lo_idx, hi_idx = int(np.argmin(fliers)), int(np.argmax(fliers))
+    rest = np.delete(fliers, [lo_idx, hi_idx] if lo_idx != hi_idx else [lo_idx])
+    rng = np.random.default_rng(random_state)
+    picked = rng.choice(rest, size=max(max_fliers - 2, 0), replace=False)
+    return np.sort(np.concatenate([[fliers[lo_idx], fliers[hi_idx]], picked]))
+
+
+def box_summary(values: np.ndarray, stats: dict | None = None, max_fliers: int = MAX_FLIERS) -> dict:
+    """
+    Five-number summary, 1.5×IQR whiskers and a capped sample of the
+    outliers, in the field names used by matplotlib's Axes.bxp(). Quartiles
+    and min/max are taken from `stats` when given, so they stay exact even
+    though at most `max_fliers` outlier markers are kept ("n_fliers" is the
+    true outlier count).
+    """
+    if len(values) == 0:
+        return {}
+    if stats and "p25" in stats:
+        q1, med, q3 = stats["p25"], stats["median"], stats["p75"]
+        lo, hi = stats["min"], stats["max"]
+    else:
+        q1, med, q3 = (float(v) for v in np.quantile(values, [0.25, 0.5, 0.75]))
+        lo, hi = float(values.min()), float(values.max())
+
+    iqr = q3 - q1
+    is_inside = (values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)
+    inside = values[is_inside]
+    fliers = values[~is_inside]
+    # Whiskers end at the most extreme values inside the 1.5×IQR fences
+    whislo = float(inside.min()) if len(inside) else q1
+    whishi = float(inside.max()) if len(inside) else q3
+
+    return {
+        "min": float(lo),
+        "q1": float(q1),
+        "med": float(med),
+        "q3": float(q3),
+        "max": float(hi),
+        "whislo": whislo,
+        "whishi": whishi,
+        "fliers": sample_fliers(fliers, max_fliers).tolist(),
+        "n_fliers": int(len(fliers)),
+    }
+
+
+def build_plot_spec(series: pd.Series, stats: dict | None = None, bins: int = HIST_BINS) -> dict:
+    """
+    📘 Function: build_plot_spec
+
+    Description:
+        Precomputes everything needed to draw a numeric column's plots later:
+        histogram bin counts and the box-plot summary (with at most
+        MAX_FLIERS outlier markers, so its size does not grow with rows).
+        The spec is plain JSON data, so it can be stored with the profile and
+        rendered on demand by plot_utils.render_plots() without touching the
+        raw column again. Does not import matplotlib.
+
+    Parameters:
+        series (pd.Series): A numeric column.
+        stats (dict | None): The column's numeric profile (reuses min/max/quartiles).
+        bins (int): Number of histogram bins.
+
+    Returns:
+        dict: {"histogram": {"counts", "bin_edges"}, "box": {...}}
+    """
+    values = numeric_values(series)
+    counts, bin_edges = histogram_counts(values, bins=bins, value_range=value_range(stats))
+    return {
+        "histogram": {
+            "counts": counts.tolist(),
+            "bin_edges": bin_edges.tolist(),
+        },
+        "box": box_summary(values, stats),
+    }
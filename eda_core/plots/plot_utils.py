@@ -1,38 +1,114 @@
 # eda_core/plots/plot_utils.py
-import matplotlib.pyplot as plt
 import os
 from eda_core.io.save_output import get_output_subfolder
+from eda_core.plots.plot_spec import box_summary, histogram_counts, numeric_values, value_range
+from eda_core.plots.renderer import get_renderer, render_small_multiples
+from eda_core.utils.logger_utils import setup_logger
+from eda_core.utils.instrument import instrument
 
+logger = setup_logger("plot_utils")
 
-def plot_numeric_hist(series, column_name, source_filename: str = "") -> str:
+# Panels per numeric overview page (keeps each figure small), and the most
+# columns drawn across all pages
+OVERVIEW_PANELS_PER_PAGE = 48
+OVERVIEW_MAX_PANELS = int(os.getenv("OVERVIEW_MAX_PANELS", 192))
 
+
+def _plot_path(source_filename: str, column_name, suffix: str) -> str:
     plot_dir = get_output_subfolder(source_filename, "plots")
     os.makedirs(plot_dir, exist_ok=True)
-    path = os.path.join(plot_dir, f"{column_name}_hist.png")    
+    return os.path.join(plot_dir, f"{column_name}_{suffix}.png")
 
-    plt.figure()
-    series.dropna().hist(bins=30, edgecolor='black')
-    plt.title(f"Histogram – {column_name}")
-    plt.xlabel(column_name)
-    plt.ylabel("Frequency")
-    plt.tight_layout()
-    plt.savefig(path)
-    plt.close()
 
-    return path
+@instrument(aggregate=True)
+def plot_numeric_hist(series, column_name, source_filename: str = "", stats: dict | None = None,
+                      histogram: tuple | None = None) -> str:
+    """
+    Histogram PNG for a numeric column. Bins come from np.histogram; pass the
+    column's profile as `stats` to reuse its min/max for the bin range, or
+    already computed (counts, bin_edges) as `histogram`.
+    """
+    path = _plot_path(source_filename, column_name, "hist")
+    if histogram is None:
+        histogram = histogram_counts(numeric_values(series), value_range=value_range(stats))
+    counts, bin_edges = histogram
+    return get_renderer().render_hist(counts, bin_edges, column_name, path)
 
-def plot_box(series, column_name, source_filename: str = "") -> str:
+@instrument(aggregate=True)
+def plot_box(series, column_name, source_filename: str = "", stats: dict | None = None) -> str:
+    """
+    Box plot PNG for a numeric column, drawn from its summary: quartiles and
+    min/max from `stats` (or computed), whiskers at 1.5×IQR and at most
+    MAX_FLIERS sampled outlier markers.
+    """
+    path = _plot_path(source_filename, column_name, "box")
+    summary = box_summary(numeric_values(series), stats)
+    if not summary:
+        # No values: keep writing an (empty) image so the report has a consistent set of plots
+        return get_renderer().render_empty(column_name, "Box Plot", path)
+    return get_renderer().render_box_summary(summary, column_name, path)
 
-    plot_dir = get_output_subfolder(source_filename, "plots")
-    os.makedirs(plot_dir, exist_ok=True)
-    path = os.path.join(plot_dir, f"{column_name}_box.png")    
+@instrument
+def plot_small_multiples(histograms: list[tuple], source_filename: str = "",
+                         panels_per_page: int = OVERVIEW_PANELS_PER_PAGE,
+                         max_panels: int = OVERVIEW_MAX_PANELS) -> list[str]:
+    """
+    Overview PNGs with a small histogram per numeric column, drawn from
+    already binned (column, counts, bin_edges) tuples, e.g. a plot_spec's
+    "histogram". Pages of at most `panels_per_page` panels are saved as
+    outputs/<name>/plots/numeric_overview.png (or numeric_overview_<page>.png
+    when there are several); columns beyond `max_panels` are left out.
+    """
+    if len(histograms) > max_panels:
+        logger.info(f"🖼️ Numeric overview limited to the first {max_panels} of {len(histograms)} columns")
+        histograms = histograms[:max_panels]
+
+    pages = [histograms[i:i + panels_per_page] for i in range(0, len(histograms), panels_per_page)]
+    paths = []
+    for page, panels in enumerate(pages, start=1):
+        suffix = "overview" if len(pages) == 1 else f"overview_{page}"
+        title = f"Numeric columns – {source_filename}" + (f" ({page}/{len(pages)})" if len(pages) > 1 else "")
+        paths.append(render_small_multiples(panels, _plot_path(source_filename, "numeric", suffix), title=title))
+    return paths
+
+
+@instrument
+def render_plots(column_profiles: list[dict], source_filename: str = "") -> list[dict]:
+    """
+    📘 Function: render_plots
+
+    Description:
+        Renders the PNGs for profiles produced with column_report(..., plots="lazy").
+        Each profile's "plot_spec" (histogram counts + box summary) is drawn
+        and the resulting "histogram_path" / "boxplot_path" are added to the
+        profile. Profiles that already have plot paths, or no spec, are left
+        as they are, so calling this twice renders nothing the second time.
+
+    Parameters:
+        column_profiles (list[dict]): Column profiles from column_report().
+        source_filename (str): Source name used for the plots output folder.
+
+    Returns:
+        list[dict]: The same profiles, updated in place.
+    """
+    renderer = get_renderer()
+    rendered = 0
 
-    plt.figure()
-    plt.boxplot(series.dropna(), vert=False)
-    plt.title(f"Box Plot – {column_name}")
-    plt.xlabel(column_name)
-    plt.tight_layout()
-    plt.savefig(path)
-    plt.close()
+    for profile in column_profiles:
+        spec = profile.get("plot_spec")
+        if not spec or profile.get("histogram_path"):
+            continue
+        col = profile.get("column")
+        try:
+            hist = spec["histogram"]
+            profile["histogram_path"] = renderer.render_hist(
+                hist["counts"], hist["bin_edges"], col, _plot_path(source_filename, col, "hist"))
+            if spec.get("box"):
+                profile["boxplot_path"] = renderer.render_box_summary(
+                    spec["box"], col, _plot_path(source_filename, col, "box"))
+            rendered += 1
+        except Exception as e:
+            logger.error(f"❌ Failed to render plots for column {col}: {e}")
 
-    return path
+    logger.info(f"🖼️ Rendered plots for {rendered} columns")
+    return column_profiles
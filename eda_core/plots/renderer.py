@@ -0,0 +1,156 @@
+# eda_core/plots/renderer.py
+import math
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+import numpy as np
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from eda_core.utils.logger_utils import setup_logger
+from eda_core.utils.instrument import bind
+
+logger = setup_logger("renderer")
+
+FIGSIZE = (6.4, 4.8)
+DPI = 100
+
+# matplotlib >= 3.10 replaced boxplot(vert=False) with orientation="horizontal"
+_MPL_VERSION = tuple(int(p) for p in matplotlib.__version__.split(".")[:2] if p.isdigit())
+HORIZONTAL = {"orientation": "horizontal"} if _MPL_VERSION >= (3, 10) else {"vert": False}
+
+
+class PlotRenderer:
+    """
+    📘 Class: PlotRenderer
+
+    Description:
+        Renders profile plots on a single reused Agg figure through the
+        object-oriented matplotlib API (no pyplot state, no new figure per
+        plot, no tight_layout pass). One renderer must only be used by one
+        thread at a time; get_renderer() hands out one per thread.
+    """
+
+    def __init__(self, figsize: tuple = FIGSIZE, dpi: int = DPI):
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.figure.subplots_adjust(left=0.12, right=0.96, top=0.9, bottom=0.12)
+        self.ax = self.figure.add_subplot(1, 1, 1)
+
+    def _save(self, path: str) -> str:
+        self.figure.savefig(path)
+        self.ax.clear()
+        return path
+
+    def render_hist(self, counts: np.ndarray, bin_edges: np.ndarray, column_name, path: str) -> str:
+        """Draws pre-binned histogram counts."""
+        self.ax.stairs(counts, bin_edges, fill=True, edgecolor="black", linewidth=0.5)
+        self.ax.set_title(f"Histogram – {column_name}")
+        self.ax.set_xlabel(str(column_name))
+        self.ax.set_ylabel("Frequency")
+        return self._save(path)
+
+    def render_box_summary(self, summary: dict, column_name, path: str) -> str:
+        """
+        Draws a horizontal box plot from a precomputed summary (see
+        plot_spec.box_summary) instead of the raw values, so drawing cost
+        does not depend on the number of rows.
+        """
+        stats = {key: summary[key] for key in ("q1", "med", "q3", "whislo", "whishi")}
+        stats["fliers"] = summary.get("fliers", [])
+        self.ax.bxp([stats], **HORIZONTAL)
+        self.ax.set_title(f"Box Plot – {column_name}")
+        self.ax.set_xlabel(str(column_name))
+        return self._save(path)
+
+    def render_empty(self, column_name, kind: str, path: str) -> str:
+        """Writes an empty chart (column without values)."""
+        self.ax.set_title(f"{kind} – {column_name}")
+        self.ax.set_xlabel(str(column_name))
+        return self._save(path)
+
+
+_local = threading.local()
+
+
+def get_renderer() -> PlotRenderer:
+    """Returns this thread's PlotRenderer, creating it on first use."""
+    renderer = getattr(_local, "renderer", None)
+    if renderer is None:
+        renderer = _local.renderer = PlotRenderer()
+    return renderer
+
+
+def render_small_multiples(histograms: list[tuple], path: str, ncols: int = 4, title: str = "") -> str:
+    """
+    📘 Function: render_small_multiples
+
+    Description:
+        Draws one combined sheet with a small histogram per column, from
+        pre-binned counts. Keep the number of panels per sheet modest (see
+        plot_utils.plot_small_multiples, which paginates).
+
+    Parameters:
+        histograms (list[tuple]): (column_name, counts, bin_edges) per column.
+        path (str): Output PNG path.
+        ncols (int): Panels per row.
+        title (str): Optional sheet title.
+
+    Returns:
+        str: The saved path, or "" if there was nothing to draw.
+    """
+    if not histograms:
+        return ""
+
+    ncols = max(1, min(ncols, len(histograms)))
+    nrows = math.ceil(len(histograms) / ncols)
+    figure = Figure(figsize=(3.2 * ncols, 2.4 * nrows), dpi=DPI)
+    FigureCanvasAgg(figure)
+
+    for i, (column_name, counts, bin_edges) in enumerate(histograms):
+        ax = figure.add_subplot(nrows, ncols, i + 1)
+        ax.stairs(counts, bin_edges, fill=True, edgecolor="black", linewidth=0.3)
+        ax.set_title(str(column_name), fontsize=8)
+        ax.tick_params(labelsize=6)
+        # Few ticks and no count axis: tick labels are most of the drawing time
+        ax.locator_params(axis="x", nbins=3)
+        ax.set_yticks([])
+
+    if title:
+        figure.suptitle(title)
+    # Fixed spacing; tight_layout() measures every tick label of every panel
+    figure.subplots_adjust(left=0.03, right=0.97, bottom=0.5 / nrows, top=1 - 0.6 / nrows,
+                           wspace=0.15, hspace=0.6)
+    figure.savefig(path)
+    return path
+
+
+class BackgroundPlotWriter:
+    """
+    📘 Class: BackgroundPlotWriter
+
+    Description:
+        Runs plot jobs on a small pool of background threads so the caller
+        (e.g. column_report) keeps profiling while PNGs are rendered and
+        written. Each worker thread uses its own PlotRenderer.
+
+    Usage Example:
+        with BackgroundPlotWriter() as writer:
+            future = writer.submit(plot_numeric_hist, series, "age", "blahblah")
+        path = future.result()
+    """
+
+    def __init__(self, max_workers: int = 1):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="plot-writer")
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        # bind(): plot spans are recorded under the caller's run
+        return self._pool.submit(bind(fn), *args, **kwargs)
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> "BackgroundPlotWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
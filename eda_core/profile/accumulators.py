@@ -0,0 +1,317 @@
+# eda_core/profile/accumulators.py
+import math
+import numpy as np
+import pandas as pd
+from eda_core.utils.logger_utils import setup_logger
+from eda_core.profile.sketches import HyperLogLog, KLLSketch, SpaceSaving
+from eda_core.profile.categorical_stats import entropy_from_counts, string_value_counts
+
+logger = setup_logger("accumulators")
+
+
+class NumericAccumulator:
+    """
+    📘 Class: NumericAccumulator
+
+    Description:
+        Single-pass, mergeable statistics for one numeric column: count,
+        missing, mean/variance (Welford, combined per chunk with Chan's
+        parallel formula), min/max and approximate quantiles from a
+        mergeable KLL sketch.
+    """
+
+    kind = "numeric"
+
+    def __init__(self, column, dtype: str, sketch_k: int = 200):
+        self.column = column
+        self.dtype = dtype
+        self.count = 0
+        self.missing = 0
+        # Present but not numeric, e.g. text in a column the loader widened to object
+        self.non_numeric = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+        self.sketch = KLLSketch(k=sketch_k)
+
+    def _combine(self, n_b: int, mean_b: float, m2_b: float) -> None:
+        n_a = self.count
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta * delta * n_a * n_b / n
+        self.count = n
+
+    def update(self, series: pd.Series) -> None:
+        values = pd.to_numeric(series, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+        mask = np.isnan(values)
+        data = values[~mask]
+        blank = int(series.isna().sum())
+        if mask.sum() > blank:
+            logger.warning(f"⚠️ {self.column}: {int(mask.sum()) - blank} non-numeric value(s) left out of the stats")
+        self.missing += blank
+        self.non_numeric += int(mask.sum()) - blank
+        if len(data) == 0:
+            return
+
+        chunk_mean = float(data.mean())
+        chunk_m2 = float(((data - chunk_mean) ** 2).sum())
+        self._combine(len(data), chunk_mean, chunk_m2)
+        self.min = min(self.min, float(data.min()))
+        self.max = max(self.max, float(data.max()))
+        self.sketch.update(data)
+
+    def merge(self, other: "NumericAccumulator") -> None:
+        self.missing += other.missing
+        self.non_numeric += other.non_numeric
+        if other.count:
+            self._combine(other.count, other.mean, other.m2)
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+
+    def finalize(self) -> dict:
+        total = self.count + self.missing + self.non_numeric
+        if self.count == 0:
+            nan = float("nan")
+            p25 = median = p75 = mean = std = lo = hi = nan
+        else:
+            p25, median, p75 = self.sketch.quantiles([0.25, 0.5, 0.75])
+            mean = self.mean
+            std = (self.m2 / (self.count - 1)) ** 0.5 if self.count > 1 else float("nan")
+            lo, hi = self.min, self.max
+
+        iqr = p75 - p25
+        lower = p25 - 1.5 * iqr
+        upper = p75 + 1.5 * iqr
+        outliers = int(round(self.sketch.fraction_outside(lower, upper) * self.count))
+
+        return {
+            "column": self.column,
+            "dtype": self.dtype,
+            "count": self.count,
+            "missing": self.missing,
+            "missing_pct": float(self.missing / total) if total else 0.0,
+            "non_numeric": self.non_numeric,
+            "mean": float(mean),
+            "std": float(std),
+            "min": float(lo),
+            "p25": float(p25),
+            "median": float(median),
+            "p75": float(p75),
+            "max": float(hi),
+            "iqr": float(iqr),
+            "outliers": outliers,
+            "outlier_method": "iqr",
+            "outlier_count": outliers,
+            "approximate": not self.sketch.is_exact,
+        }
+
+
+class CategoricalAccumulator:
+    """
+    📘 Class: CategoricalAccumulator
+
+    Description:
+        Single-pass, mergeable frequency statistics for one categorical column.
+        Counts are kept exactly while the column has at most `exact_threshold`
+        distinct values. Above that the accumulator switches to sketches: a
+        HyperLogLog for the distinct count and a Space-Saving summary for the
+        top-k values, so memory no longer grows with the cardinality. Reports
+        built from sketches are flagged as approximate.
+    """
+
+    kind = "categorical"
+
+    def __init__(self, column, dtype: str, top_k: int = 5, exact_threshold: int = 10_000,
+                 heavy_hitters: int = 1000, hll_precision: int = 14):
+        self.column = column
+        self.dtype = dtype
+        self.top_k = top_k
+        self.exact_threshold = exact_threshold
+        self.heavy_hitters = max(heavy_hitters, top_k)
+        self.hll_precision = hll_precision
+        self.count = 0
+        self.missing = 0
+        self.counts = pd.Series(dtype="int64")
+        self.hll = None
+        self.heavy = None
+
+    @property
+    def sketched(self) -> bool:
+        return self.heavy is not None
+
+    def _switch_to_sketch(self) -> None:
+        logger.info(f"🔀 {self.column}: more than {self.exact_threshold} distinct values, switching to sketches")
+        self.hll = HyperLogLog(self.hll_precision)
+        self.hll.update(self.counts.index.to_numpy())
+        self.heavy = SpaceSaving(self.heavy_hitters)
+        self.heavy.update_counts(self.counts)
+        self.counts = None
+
+    def _absorb(self, counts: pd.Series) -> None:
+        if self.sketched:
+            self.hll.update(counts.index.to_numpy())
+            self.heavy.update_counts(counts)
+            return
+        self.counts = self.counts.add(counts, fill_value=0).astype("int64")
+        if len(self.counts) > self.exact_threshold:
+            self._switch_to_sketch()
+
+    def update(self, series: pd.Series) -> None:
+        counts = string_value_counts(series)
+        chunk_count = int(counts.sum())
+        self.missing += len(series) - chunk_count
+        self.count += chunk_count
+        self._absorb(counts)
+
+    def merge(self, other: "CategoricalAccumulator") -> None:
+        self.missing += other.missing
+        self.count += other.count
+        if not other.sketched:
+            self._absorb(other.counts)
+            return
+        if not self.sketched:
+            self._switch_to_sketch()
+        self.hll.merge(other.hll)
+        self.heavy.merge(other.heavy)
+
+    def _finalize_exact(self) -> tuple:
+        top = self.counts.sort_values(ascending=False, kind="stable").head(self.top_k)
+        entropy = entropy_from_counts(self.counts.to_numpy())
+        top_k = [(v, int(c)) for v, c in top.items()]
+        return len(self.counts), top_k, entropy
+
+    def _finalize_sketch(self) -> tuple:
+        total = self.count
+        unique = max(int(round(self.hll.estimate())), len(self.heavy.counts))
+        top_k = [(v, c) for v, c, _ in self.heavy.top(self.top_k)]
+
+        # Monitored values contribute exactly; the remaining mass is assumed
+        # to be spread evenly over the remaining distinct values.
+        monitored = np.minimum(self.heavy.counts.to_numpy(dtype="float64"), total)
+        probs = monitored / total
+        entropy = float(-(probs[probs > 0] * np.log2(probs[probs > 0])).sum())
+        residual = max(total - monitored.sum(), 0.0) / total
+        residual_distinct = max(unique - len(monitored), 1)
+        if residual > 0:
+            entropy -= residual * math.log2(residual / residual_distinct)
+        return unique, top_k, entropy
+
+    def finalize(self) -> dict:
+        total = self.count
+        if total == 0:
+            unique, top_k, entropy = 0, [], 0.0
+        elif self.sketched:
+            unique, top_k, entropy = self._finalize_sketch()
+        else:
+            unique, top_k, entropy = self._finalize_exact()
+
+        return {
+            "column": self.column,
+            "dtype": self.dtype,
+            "count": int(total),
+            "missing": int(self.missing),
+            "missing_pct": float(self.missing / (total + self.missing)) if (total + self.missing) else 0.0,
+            "unique": int(unique),
+            "mode": top_k[0][0] if top_k else None,
+            "top_k_values": [
+                {"value": v, "count": int(c), "pct": float(c / total)}
+                for v, c in top_k
+            ],
+            "entropy": float(entropy),
+            "approximate": self.sketched,
+        }
+
+
+class MissingOnlyAccumulator:
+    """Tracks only counts for column types the profilers do not support."""
+
+    kind = "unsupported"
+
+    def __init__(self, column, dtype: str):
+        self.column = column
+        self.dtype = dtype
+        self.count = 0
+        self.missing = 0
+
+    def update(self, series: pd.Series) -> None:
+        missing = int(series.isnull().sum())
+        self.missing += missing
+        self.count += len(series) - missing
+
+    def merge(self, other: "MissingOnlyAccumulator") -> None:
+        self.missing += other.missing
+        self.count += other.count
+
+    def finalize(self) -> dict:
+        return {
+            "column": self.column,
+            "dtype": self.dtype,
+            "note": "Unsupported data type",
+        }
+
+
+class TableAccumulator:
+    """
+    📘 Class: TableAccumulator
+
+    Description:
+        Holds one accumulator per column. The accumulator type is picked from
+        the dtype of the first chunk seen, so chunks must share a schema (as
+        produced by load_excel(..., chunksize=N)). Two table accumulators built
+        over disjoint chunks can be merged before finalizing.
+
+    Usage Example:
+        acc = TableAccumulator()
+        for chunk in load_excel("big.xlsx", chunksize=100_000):
+            acc.update(chunk)
+        reports = acc.finalize()
+    """
+
+    def __init__(self, top_k: int = 5, sketch_k: int = 200, high_missing_threshold: float = 0.5):
+        self.top_k = top_k
+        self.sketch_k = sketch_k
+        self.high_missing_threshold = high_missing_threshold
+        self.columns: dict = {}
+        self.row_count = 0
+
+    def _make(self, col, series: pd.Series):
+        dtype = str(series.dtype)
+        if pd.api.types.is_bool_dtype(series):
+            return CategoricalAccumulator(col, dtype, top_k=self.top_k)
+        if pd.api.types.is_numeric_dtype(series):
+            return NumericAccumulator(col, dtype, sketch_k=self.sketch_k)
+        if pd.api.types.is_string_dtype(series) or isinstance(series.dtype, pd.CategoricalDtype):
+            return CategoricalAccumulator(col, dtype, top_k=self.top_k)
+        return MissingOnlyAccumulator(col, dtype)
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        self.row_count += len(chunk)
+        for col in chunk.columns:
+            if col not in self.columns:
+                self.columns[col] = self._make(col, chunk[col])
+            self.columns[col].update(chunk[col])
+
+    def merge(self, other: "TableAccumulator") -> None:
+        self.row_count += other.row_count
+        for col, acc in other.columns.items():
+            if col in self.columns:
+                self.columns[col].merge(acc)
+            else:
+                self.columns[col] = acc
+
+    def finalize(self) -> list[dict]:
+        reports = []
+        for col, acc in self.columns.items():
+            report = acc.finalize()
+            missing_pct = acc.missing / self.row_count if self.row_count else 0.0
+            report.update({
+                "missing": int(acc.missing),
+                "missing_pct": float(missing_pct),
+                "all_missing": bool(acc.missing == self.row_count),
+                "high_missing": bool(missing_pct > self.high_missing_threshold),
+            })
+            reports.append(report)
+        return reports
@@ -0,0 +1,107 @@
+# eda_core/profile/categorical_stats.py
+import numpy as np
+import pandas as pd
+
+
+def factorize_counts(series: pd.Series) -> tuple[np.ndarray, pd.Index, int]:
+    """
+    📘 Function: factorize_counts
+
+    Description:
+        Counts every distinct value of a column with one factorization: values
+        are mapped to integer codes (pd.factorize, or the existing codes of a
+        categorical) and counted with np.bincount. No string copy of the
+        column is made.
+
+    Parameters:
+        series (pd.Series): Column to count.
+
+    Returns:
+        tuple: (counts per distinct value, distinct values in first-seen
+        order, number of missing values)
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    valid = codes[codes >= 0]
+    counts = np.bincount(valid, minlength=len(uniques))
+    if isinstance(uniques, pd.Categorical):
+        # Unused categories never appear in the data
+        used = counts > 0
+        counts, uniques = counts[used], uniques[used]
+    return counts, pd.Index(uniques), int(len(codes) - len(valid))
+
+
+def merge_string_forms(counts: np.ndarray, uniques: pd.Index) -> tuple[np.ndarray, pd.Index]:
+    """
+    Re-keys factorize_counts output by the string form of each value, adding
+    up the counts of distinct values that print the same (e.g. 1 and "1").
+    Only the distinct values are converted to str; first-seen order is kept.
+    """
+    labels = uniques.astype(str)
+    if labels.is_unique:
+        return counts, labels
+    codes, merged = pd.factorize(labels)
+    return np.bincount(codes, weights=counts, minlength=len(merged)).astype("int64"), pd.Index(merged)
+
+
+def string_value_counts(series: pd.Series) -> pd.Series:
+    """
+    Value counts keyed by the string form of each value, converting only the
+    distinct values (not every row) to str.
+    """
+    counts, uniques, _ = factorize_counts(series)
+    counts, labels = merge_string_forms(counts, uniques)
+    return pd.Series(counts, index=labels, dtype="int64")
+
+
+def entropy_from_counts(counts: np.ndarray) -> float:
+    """Shannon entropy (bits) of the full distribution given by `counts`."""
+    total = counts.sum()
+    if total == 0:
+        return 0.0
+    probs = counts[counts > 0] / total
+    return float(-(probs * np.log2(probs)).sum())
+
+
+def categorical_stats(series: pd.Series, top_k: int = 5) -> dict:
+    """
+    📘 Function: categorical_stats
+
+    Description:
+        Count, missing, unique, mode, top-k and exact entropy over all value
+        counts, all derived from a single factorization of the column.
+        Ties for the mode / top-k are broken by first occurrence.
+
+    Parameters:
+        series (pd.Series): A string/categorical column
+        top_k (int): Number of top frequent values to include
+
+    Returns:
+        dict: {"count", "missing", "unique", "mode", "top_k_values", "entropy"}
+    """
+    counts, uniques, missing = factorize_counts(series)
+    # Values are reported as strings, so values with the same string form count as one
+    counts, uniques = merge_string_forms(counts, uniques)
+    total = int(counts.sum())
+
+    if len(counts) > top_k > 0:
+        # Only values at least as frequent as the k-th largest count can make the cut
+        kth = np.partition(counts, len(counts) - top_k)[len(counts) - top_k]
+        candidates = np.flatnonzero(counts >= kth)
+    else:
+        candidates = np.arange(len(counts))
+    # Highest count first; equal counts keep first-seen order
+    top_idx = candidates[np.lexsort((candidates, -counts[candidates]))][:top_k]
+
+    top_k_values = [
+        {"value": str(uniques[i]), "count": int(counts[i]), "pct": float(counts[i] / total)}
+        for i in top_idx
+    ]
+
+    return {
+        "count": total,
+        "missing": missing,
+        "unique": int(len(counts)),
+        "mode": top_k_values[0]["value"] if top_k_values else None,
+        "top_k_values": top_k_values,
+        "entropy": entropy_from_counts(counts),
+    }
@@ -1,17 +1,122 @@
 # eda_core/profile/column_report.py
+import os
 import pandas as pd
-from eda_core.profile.profile_numeric import profile_numeric
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterable
+from eda_core.profile.accumulators import TableAccumulator
+from eda_core.profile.profile_numeric import profile_numeric, profile_numeric_table
 from eda_core.profile.profile_categorical import profile_categorical
 from eda_core.profile.detect_outliers import detect_outliers
 from eda_core.profile.profile_missing import profile_missing
 from eda_core.utils.logger_utils import setup_logger
+from eda_core.utils.instrument import bind, instrument
+from eda_core.utils.persist_metadata import column_fingerprints, load_column_profile
 import json
-from eda_core.plots.plot_utils import plot_numeric_hist, plot_box  # 💡 Add import at top
+from eda_core.plots.plot_spec import build_plot_spec
 from eda_core.io.save_output import get_output_subfolder
 
 logger = setup_logger("column_report")
 
-def column_report(df: pd.DataFrame, source_filename) -> list[dict]:
+# DataFrame shared with pool workers; set once per worker by _init_worker()
+_SHARED_DF = None
+
+PLOT_MODES = ("eager", "lazy", "none")
+
+
+def _init_worker(df: pd.DataFrame) -> None:
+    """Pool initializer: keeps one copy of the DataFrame per worker process."""
+    global _SHARED_DF
+    _SHARED_DF = df
+
+
+def _profile_column(series: pd.Series, numeric_stats: dict) -> dict:
+    """Profiles a single column (without plots)."""
+    col = series.name
+    dtype = str(series.dtype)
+
+    try:
+        if pd.api.types.is_numeric_dtype(series):
+            logger.info(f"🔢 Profiling numeric column: {col}")
+            if col in numeric_stats:
+                return dict(numeric_stats[col])
+            base_report = profile_numeric(series)
+            outlier_info = detect_outliers(series)
+            base_report.update({
+                "outlier_method": outlier_info["method"],
+                "outlier_count": outlier_info["outlier_count"]
+            })
+            return base_report
+
+        elif pd.api.types.is_string_dtype(series) or isinstance(series.dtype, pd.CategoricalDtype):
+            logger.info(f"🔤 Profiling categorical column: {col}")
+            return profile_categorical(series)
+
+        logger.info(f"❔ Skipped unsupported column: {col}")
+        return {
+            "column": col,
+            "dtype": dtype,
+            "note": "Unsupported data type"
+        }
+
+    except Exception as e:
+        logger.error(f"❌ Failed to process column {col}: {e}")
+        return {
+            "column": col,
+            "dtype": dtype,
+            "error": str(e)
+        }
+
+
+def _render_plots(series: pd.Series, source_filename, stats: dict | None = None,
+                  keep_histogram: bool = False) -> dict:
+    """
+    Renders histogram + box plot for a numeric column and returns their
+    paths (plus the histogram's bin counts under "_histogram" if asked, for
+    the numeric overview).
+    """
+    # Imported here so plots="lazy"/"none" never load matplotlib
+    from eda_core.plots.plot_spec import histogram_counts, numeric_values, value_range
+    from eda_core.plots.plot_utils import plot_numeric_hist, plot_box
+
+    col = series.name
+    histogram = histogram_counts(numeric_values(series), value_range=value_range(stats))
+    hist_path = plot_numeric_hist(series, col, source_filename, stats=stats, histogram=histogram)
+    box_path = plot_box(series, col, source_filename, stats=stats)
+    result = {
+        "histogram_path": hist_path,
+        "boxplot_path": box_path
+    }
+    if keep_histogram:
+        result["_histogram"] = histogram
+    return result
+
+
+def _profile_shared_column(col) -> dict:
+    return _profile_column(_SHARED_DF[col], {})
+
+
+def _render_shared_plots(col, source_filename, stats: dict | None = None, keep_histogram: bool = False) -> dict:
+    return _render_plots(_SHARED_DF[col], source_filename, stats, keep_histogram)
+
+
+def _resolve_n_jobs(n_jobs: int) -> int:
+    if n_jobs is None or n_jobs == 0:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+@instrument
+def column_report(
+    df: pd.DataFrame | Iterable[pd.DataFrame],
+    source_filename,
+    n_jobs: int = 1,
+    executor: str = "thread",
+    incremental: bool = False,
+    plots: str = "eager",
+    overview: bool = False,
+) -> list[dict]:
     """
     📘 Function: column_report
 
@@ -19,77 +124,301 @@ def column_report(df: pd.DataFrame, source_filename) -> list[dict]:
         Combines multiple profiling functions into a single unified
         per-column report for numeric and categorical data.
 
+        If an iterator of DataFrame chunks is passed instead of a DataFrame
+        (e.g. from load_excel(..., chunksize=N)), the columns are profiled in a
+        single pass with streaming accumulators and the full DataFrame is never
+        built. See stream_column_report().
+
+        With n_jobs > 1, columns are spread across a worker pool. Column
+        profiling runs in threads (executor="thread") or processes
+        (executor="process"); plot rendering always runs in worker processes
+        because matplotlib is not thread-safe and holds the GIL. Process
+        workers receive the DataFrame once, through the pool initializer,
+        instead of once per column. The output order always follows df.columns.
+
+        With incremental=True, each column's content hash is compared with
+        the "content_hash" stored in outputs/<name>/stats/colum_profile.json
+        from the previous run. Unchanged columns reuse their stored profile,
+        plots and AI insight; only changed or new columns are profiled.
+
+        `plots` controls the PNGs for numeric columns:
+            "eager" – render histogram and box plot now (default).
+            "lazy"  – store a "plot_spec" (histogram bin counts and box-plot
+                      summary) in each numeric profile; images are rendered
+                      later by plot_utils.render_plots() or render_markdown().
+            "none"  – no plots and no spec; matplotlib is never imported.
+
+        With overview=True (and plots other than "none"), small-multiples
+        overview pages of the numeric histograms are also rendered
+        (plot_utils.plot_small_multiples), reusing the bin counts of the
+        per-column histograms or plot specs. Off by default: on very wide
+        sheets it adds many panels for little extra insight.
+
     Parameters:
-        df (pd.DataFrame): The DataFrame to analyze.
+        df (pd.DataFrame | Iterable[pd.DataFrame]): The DataFrame (or chunks) to analyze.
+        source_filename (str): Source name used for the plots output folder.
+        n_jobs (int): Number of workers. 1 = serial, -1 = all CPU cores.
+        executor (str): 'thread' or 'process' pool for column profiling.
+        incremental (bool): Reuse stored results for unchanged columns.
+        plots (str): 'eager', 'lazy' or 'none'.
+        overview (bool): Also render the numeric overview pages.
 
     Returns:
         List[dict]: List of column profiles.
     """
+    if plots not in PLOT_MODES:
+        raise ValueError(f"Unsupported plots mode. Use one of {PLOT_MODES}.")
+    if not isinstance(df, pd.DataFrame):
+        return stream_column_report(df)
+    if incremental:
+        return _incremental_column_report(df, source_filename, n_jobs, executor, plots, overview)
+
     logger.info("📊 Entering function column_report()")
 
-    reports = []
+    if executor not in ("thread", "process"):
+        raise ValueError("Unsupported executor. Use 'thread' or 'process'.")
+    n_jobs = _resolve_n_jobs(n_jobs)
+
     missing_df = profile_missing(df).set_index("column")
 
-    for col in df.columns:
-        series = df[col]
-        dtype = str(series.dtype)
-
-        try:
-            if pd.api.types.is_numeric_dtype(series):
-                logger.info(f"🔢 Profiling numeric column: {col}")
-                base_report = profile_numeric(series)
-                outlier_info = detect_outliers(series)
-                base_report.update({"outlier_count": outlier_info["outlier_count"]})
-
-                base_report.update({
-                    "outlier_method": outlier_info["method"],
-                    "outlier_count": outlier_info["outlier_count"]
-                })
-
-                # 📊 Generate plots and record paths
-                hist_path = plot_numeric_hist(series, col,source_filename)
-                box_path = plot_box(series, col,source_filename)
-                base_report.update({
-                    "histogram_path": hist_path,
-                    "boxplot_path": box_path
-                })
-
-
-            elif pd.api.types.is_string_dtype(series) or pd.api.types.is_categorical_dtype(series):
-                logger.info(f"🔤 Profiling categorical column: {col}")
-                base_report = profile_categorical(series)
-
-            else:
-                logger.info(f"❔ Skipped unsupported column: {col}")
-                base_report = {
-                    "column": col,
-                    "dtype": dtype,
-                    "note": "Unsupported data type"
-                }
-
-            # Add missing info to report
-            if col in missing_df.index:
-                base_report.update({
-                    "missing": int(missing_df.loc[col, "missing"]),
-                    "missing_pct": float(missing_df.loc[col, "missing_pct"]),
-                    "all_missing": bool(missing_df.loc[col, "all_missing"]),
-                    "high_missing": bool(missing_df.loc[col, "high_missing"]),
-                })
-
-            reports.append(base_report)
-
-        except Exception as e:
-            logger.error(f"❌ Failed to process column {col}: {e}")
-            reports.append({
-                "column": col,
-                "dtype": dtype,
-                "error": str(e)
+    # All numeric statistics and IQR outliers in one vectorized pass
+    numeric_stats = profile_numeric_table(df)
+
+    columns = list(df.columns)
+    numeric_columns = [col for col in columns if pd.api.types.is_numeric_dtype(df[col])]
+    plot_columns = numeric_columns if plots == "eager" else []
+
+    if n_jobs == 1 and plot_columns:
+        from eda_core.plots.renderer import BackgroundPlotWriter
+
+        # Plots are rendered and written on a background thread while profiling continues
+        with BackgroundPlotWriter() as writer:
+            plot_futures = {
+                col: writer.submit(_render_plots, df[col], source_filename, numeric_stats.get(col), overview)
+                for col in plot_columns
+            }
+            reports = [_profile_column(df[col], numeric_stats) for col in columns]
+
+        plot_results = {}
+        for col, future in plot_futures.items():
+            try:
+                plot_results[col] = future.result()
+            except Exception as e:
+                plot_results[col] = e
+    elif n_jobs == 1:
+        reports = [_profile_column(df[col], numeric_stats) for col in columns]
+        plot_results = {}
+    else:
+        logger.info(f"🧵 Profiling {len(columns)} columns with n_jobs={n_jobs} ({executor})")
+        reports, plot_results = _column_report_parallel(df, columns, plot_columns, numeric_stats,
+                                                        source_filename, n_jobs, executor, overview)
+
+    histograms = {}
+    if plots == "lazy":
+        for report in reports:
+            col = report["column"]
+            if col in numeric_columns and "error" not in report:
+                report["plot_spec"] = build_plot_spec(df[col], numeric_stats.get(col))
+                hist = report["plot_spec"]["histogram"]
+                histograms[col] = (hist["counts"], hist["bin_edges"])
+    for col, plot_result in plot_results.items():
+        if isinstance(plot_result, dict) and "_histogram" in plot_result:
+            histograms[col] = plot_result.pop("_histogram")
+    if overview and histograms:
+        _render_overview([(col, *histograms[col]) for col in numeric_columns if col in histograms],
+                         source_filename)
+
+    for report in reports:
+        col = report["column"]
+        if "error" in report:
+            continue
+
+        plot_result = plot_results.get(col)
+        if isinstance(plot_result, Exception):
+            logger.error(f"❌ Failed to process column {col}: {plot_result}")
+            report.clear()
+            report.update({"column": col, "dtype": str(df[col].dtype), "error": str(plot_result)})
+            continue
+        if plot_result:
+            # 📊 Record plot paths
+            report.update(plot_result)
+
+        # Add missing info to report
+        if col in missing_df.index:
+            report.update({
+                "missing": int(missing_df.loc[col, "missing"]),
+                "missing_pct": float(missing_df.loc[col, "missing_pct"]),
+                "all_missing": bool(missing_df.loc[col, "all_missing"]),
+                "high_missing": bool(missing_df.loc[col, "high_missing"]),
             })
 
     logger.info(f"✅ Completed profiling for {len(df.columns)} columns")
     return reports
 
 
+def _render_overview(histograms: list[tuple], source_filename) -> None:
+    from eda_core.plots.plot_utils import plot_small_multiples
+
+    try:
+        for path in plot_small_multiples(histograms, source_filename):
+            logger.info(f"🖼️ Numeric overview saved to {path}")
+    except Exception as e:
+        logger.warning(f"⚠️ Could not render numeric overview: {e}")
+
+
+def _is_reusable(previous: dict | None, content_hash: str, plots: str = "eager") -> bool:
+    """A stored profile is reusable if its hash matches and its plots still exist."""
+    if not previous or "error" in previous or not content_hash:
+        return False
+    if previous.get("content_hash") != content_hash:
+        return False
+    # A numeric profile must carry what the requested plot mode needs
+    has_plots = bool(previous.get("histogram_path"))
+    if plots == "eager" and "plot_spec" in previous and not has_plots:
+        return False
+    if plots == "lazy" and "min" in previous and not ("plot_spec" in previous or has_plots):
+        return False
+    for key in ("histogram_path", "boxplot_path"):
+        if previous.get(key) and not os.path.exists(previous[key]):
+            return False
+    return True
+
+
+def _incremental_column_report(df, source_filename, n_jobs, executor, plots="eager",
+                               overview=False) -> list[dict]:
+    """Profiles only changed/new columns and reuses stored results for the rest."""
+    logger.info("📊 Entering function column_report() in incremental mode")
+
+    hashes = column_fingerprints(df)
+    previous = {str(p.get("column")): p for p in load_column_profile(source_filename)}
+
+    reused = {
+        col: previous[str(col)] for col in df.columns
+        if _is_reusable(previous.get(str(col)), hashes[str(col)], plots)
+    }
+    changed = [col for col in df.columns if col not in reused]
+    logger.info(f"♻️ Reusing {len(reused)} unchanged columns, profiling {len(changed)} changed/new columns")
+
+    fresh = {}
+    if changed:
+        # No overview here: it would only show the changed columns
+        for report in column_report(df[changed], source_filename, n_jobs=n_jobs, executor=executor,
+                                    plots=plots, overview=False):
+            fresh[report["column"]] = report
+
+    reports = []
+    for col in df.columns:
+        report = reused.get(col) or fresh[col]
+        report["content_hash"] = hashes[str(col)]
+        reports.append(report)
+
+    histograms = _overview_histograms(df, reports) if overview and plots != "none" else []
+    if histograms:
+        _render_overview(histograms, source_filename)
+    return reports
+
+
+def _overview_histograms(df: pd.DataFrame, reports: list[dict]) -> list[tuple]:
+    """
+    (column, counts, bin_edges) for every numeric column of the merged
+    report: from the stored plot spec when there is one, otherwise binned
+    from the column with the profile's min/max.
+    """
+    from eda_core.plots.plot_spec import histogram_counts, numeric_values, value_range
+
+    histograms = []
+    for report in reports:
+        col = report["column"]
+        if "error" in report or not pd.api.types.is_numeric_dtype(df[col]):
+            continue
+        hist = (report.get("plot_spec") or {}).get("histogram")
+        if hist:
+            histograms.append((col, hist["counts"], hist["bin_edges"]))
+        else:
+            histograms.append((col, *histogram_counts(numeric_values(df[col]), value_range=value_range(report))))
+    return histograms
+
+
+def _column_report_parallel(df, columns, plot_columns, numeric_stats, source_filename, n_jobs, executor,
+                            keep_histograms=False):
+    """
+    Runs per-column profiling and plot rendering on worker pools.
+
+    Returns (reports in column order, {column: plot paths or Exception}).
+    """
+    # Numeric columns are already profiled by the vectorized pass
+    pending = [col for col in columns if col not in numeric_stats]
+    profiled = {col: dict(numeric_stats[col]) for col in columns if col in numeric_stats}
+    plots = {}
+
+    process_pool = None
+    if plot_columns or executor == "process":
+        process_pool = ProcessPoolExecutor(
+            max_workers=n_jobs,
+            initializer=_init_worker,
+            initargs=(df,)
+        )
+
+    try:
+        plot_futures = {
+            col: process_pool.submit(_render_shared_plots, col, source_filename, numeric_stats.get(col),
+                                     keep_histograms)
+            for col in plot_columns
+        }
+
+        if executor == "process":
+            for col, report in zip(pending, process_pool.map(_profile_shared_column, pending)):
+                profiled[col] = report
+        else:
+            with ThreadPoolExecutor(max_workers=n_jobs) as thread_pool:
+                for col, report in zip(pending, thread_pool.map(bind(lambda c: _profile_column(df[c], {})), pending)):
+                    profiled[col] = report
+
+        for col, future in plot_futures.items():
+            try:
+                plots[col] = future.result()
+            except Exception as e:
+                plots[col] = e
+    finally:
+        if process_pool is not None:
+            process_pool.shutdown()
+
+    return [profiled[col] for col in columns], plots
+
+
+def stream_column_report(chunks: Iterable[pd.DataFrame], top_k: int = 5) -> list[dict]:
+    """
+    📘 Function: stream_column_report
+
+    Description:
+        Profiles a stream of DataFrame chunks in one pass. Each chunk updates
+        per-column accumulators (count, missing, Welford mean/variance,
+        min/max, approximate quantiles, top-k / unique counts) and is then
+        released, so memory is bounded by the chunk size.
+
+        Quantiles, outlier counts and (for very high cardinality columns)
+        unique/top-k values are estimates; such reports carry
+        "approximate": True. Plots are not generated in this mode.
+
+    Parameters:
+        chunks (Iterable[pd.DataFrame]): Chunks sharing the same schema.
+        top_k (int): Number of top frequent values for categorical columns.
+
+    Returns:
+        List[dict]: List of column profiles, in column order.
+    """
+    logger.info("📊 Entering function stream_column_report()")
+
+    accumulator = TableAccumulator(top_k=top_k)
+    for i, chunk in enumerate(chunks):
+        accumulator.update(chunk)
+        logger.info(f"🔹 Profiled chunk {i + 1} ({accumulator.row_count} rows so far)")
+
+    reports = accumulator.finalize()
+    logger.info(f"✅ Completed streaming profile for {len(reports)} columns")
+    return reports
+
+
 def serialize_profile(table_summary: dict, column_profiles: list[dict], file_path: str):
     """
     📦 Function: serialize_profile
@@ -2,10 +2,19 @@
 import pandas as pd
 import numpy as np
 from eda_core.utils.logger_utils import setup_logger
+from eda_core.utils.instrument import instrument
+from eda_core.profile.profile_numeric import numeric_quantiles
 
 logger = setup_logger("detect_outliers")
 
-def detect_outliers(series: pd.Series, method: str = "iqr", z_threshold: float = 3.0) -> dict:
+@instrument(aggregate=True)
+def detect_outliers(
+    series: pd.Series,
+    method: str = "iqr",
+    z_threshold: float = 3.0,
+    quantile_method: str = "exact",
+    sketch_k: int = 200,
+) -> dict:
     """
     📘 Function: detect_outliers
 
@@ -16,6 +25,8 @@ def detect_outliers(series: pd.Series, method: str = "iqr", z_threshold: float =
         series (pd.Series): The numeric series to analyze.
         method (str): 'iqr' or 'zscore'.
         z_threshold (float): Z-score threshold, used only if method == 'zscore'.
+        quantile_method (str): 'exact' or 'sketch' (KLL) for the IQR bounds.
+        sketch_k (int): KLL accuracy parameter when quantile_method='sketch'.
 
     Returns:
         dict: {
@@ -34,8 +45,7 @@ def detect_outliers(series: pd.Series, method: str = "iqr", z_threshold: float =
 
     try:
         if method == "iqr":
-            q1 = data.quantile(0.25)
-            q3 = data.quantile(0.75)
+            q1, q3 = numeric_quantiles(data, [0.25, 0.75], quantile_method, sketch_k)
             iqr = q3 - q1
             lower = q1 - 1.5 * iqr
             upper = q3 + 1.5 * iqr
@@ -2,11 +2,20 @@
 import pandas as pd
 import numpy as np
 from eda_core.utils.logger_utils import setup_logger
-from collections import Counter
+from eda_core.utils.instrument import instrument
+from eda_core.profile.accumulators import CategoricalAccumulator
+from eda_core.profile.categorical_stats import categorical_stats
 
 logger = setup_logger("profile_categorical")
 
-def profile_categorical(series: pd.Series, top_k: int = 5) -> dict:
+@instrument(aggregate=True)
+def profile_categorical(
+    series: pd.Series,
+    top_k: int = 5,
+    method: str = "exact",
+    exact_threshold: int = 10_000,
+    slice_size: int = 100_000,
+) -> dict:
     """
     📘 Function: profile_categorical
 
@@ -14,34 +23,38 @@ def profile_categorical(series: pd.Series, top_k: int = 5) -> dict:
         Generate statistics for a categorical column such as top-k values,
         frequencies, mode, and entropy (diversity measure).
 
+        In 'exact' mode everything comes from one factorization of the column
+        (see categorical_stats): no string copy of the column is made and the
+        entropy covers the full value distribution, not only the top-k.
+
+        method='sketch' is meant for high-cardinality (ID-like) columns: the
+        column is consumed in slices of `slice_size` rows by a mergeable
+        CategoricalAccumulator, which stays exact up to `exact_threshold`
+        distinct values and then switches to HyperLogLog (distinct count) and
+        Space-Saving (top-k). The result then carries "approximate": True.
+
     Parameters:
         series (pd.Series): A string/categorical column
         top_k (int): Number of top frequent values to include
+        method (str): 'exact' or 'sketch'
+        exact_threshold (int): Distinct values kept exactly in 'sketch' mode
+        slice_size (int): Rows processed per slice in 'sketch' mode
 
     Returns:
         dict: Profiling result
     """
     logger.info(f"Entering function profile_categorical() → {series.name}")
     try:
-        col = series.dropna().astype(str)
-        counts = col.value_counts().head(top_k)
-        total = len(col)
-        entropy = -sum((c / total) * np.log2(c / total) for c in counts)
-
-        top_k_values = [
-            {"value": v, "count": int(c), "pct": float(c / total)}
-            for v, c in counts.items()
-        ]
+        if method == "sketch":
+            return _profile_categorical_sketch(series, top_k, exact_threshold, slice_size)
+        if method != "exact":
+            raise ValueError("Unsupported method. Use 'exact' or 'sketch'.")
 
+        stats = categorical_stats(series, top_k=top_k)
         result = {
             "column": series.name,
             "dtype": str(series.dtype),
-            "count": int(total),
-            "missing": int(series.isnull().sum()),
-            "unique": int(series.nunique(dropna=True)),
-            "mode": col.mode().iloc[0] if not col.mode().empty else None,
-            "top_k_values": top_k_values,
-            "entropy": float(entropy)
+            **stats
         }
 
         logger.info(f"✅ Profiled {series.name}: unique={result['unique']}, mode={result['mode']}")
@@ -54,3 +67,15 @@ def profile_categorical(series: pd.Series, top_k: int = 5) -> dict:
             "dtype": str(series.dtype),
             "error": str(e)
         }
+
+
+def _profile_categorical_sketch(series: pd.Series, top_k: int, exact_threshold: int, slice_size: int) -> dict:
+    accumulator = CategoricalAccumulator(series.name, str(series.dtype), top_k=top_k,
+                                         exact_threshold=exact_threshold)
+    for start in range(0, len(series), slice_size):
+        accumulator.update(series.iloc[start:start + slice_size])
+
+    result = accumulator.finalize()
+    result.pop("missing_pct", None)
+    logger.info(f"✅ Profiled {series.name} (sketch): unique≈{result['unique']}, mode={result['mode']}")
+    return result
@@ -1,9 +1,11 @@
 # stats/profile_missing.py
 import pandas as pd
 from eda_core.utils.logger_utils import setup_logger
+from eda_core.utils.instrument import instrument
 
 logger = setup_logger("profile_missing")
 
+@instrument
 def profile_missing(df: pd.DataFrame, threshold: float = 0.5) -> pd.DataFrame:
     """
     📘 Function: profile_missing
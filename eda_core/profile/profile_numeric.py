@@ -1,11 +1,42 @@
 # stats/profile_numeric.py
+import os
+import warnings
 import numpy as np
 import pandas as pd
 from eda_core.utils.logger_utils import setup_logger
+from eda_core.utils.instrument import instrument
+from eda_core.profile.sketches import KLLSketch
 
 logger = setup_logger("profile_numeric")
 
-def profile_numeric(series: pd.Series) -> dict:
+# Bytes of float64 data converted per block in profile_numeric_table(). The
+# sorted copy and the outlier mask come on top, so peak use is about 2.2x this.
+NUMERIC_BLOCK_BYTES = int(os.getenv("NUMERIC_BLOCK_BYTES", 256 * 1024 * 1024))
+
+
+def numeric_block_columns(n_rows: int, block_bytes: int = NUMERIC_BLOCK_BYTES) -> int:
+    """Number of float64 columns of `n_rows` rows that fit in `block_bytes` (at least 1)."""
+    return max(1, block_bytes // (8 * max(n_rows, 1)))
+
+
+def numeric_quantiles(data: pd.Series, qs: list[float], method: str = "exact", sketch_k: int = 200) -> list[float]:
+    """
+    Quantiles of a NaN-free numeric Series, either exact (one multi-quantile
+    pandas call) or from a KLL sketch with bounded memory.
+    """
+    if len(data) == 0:
+        return [np.nan] * len(qs)
+    if method == "exact":
+        return data.quantile(qs).tolist()
+    if method == "sketch":
+        sketch = KLLSketch(k=sketch_k)
+        sketch.update(data.to_numpy(dtype="float64"))
+        return sketch.quantiles(qs)
+    raise ValueError("Unsupported quantile_method. Use 'exact' or 'sketch'.")
+
+
+@instrument(aggregate=True)
+def profile_numeric(series: pd.Series, quantile_method: str = "exact", sketch_k: int = 200) -> dict:
     """
     📘 Function: profile_numeric
 
@@ -15,6 +46,9 @@ def profile_numeric(series: pd.Series) -> dict:
 
     Parameters:
         series (pd.Series): A numeric pandas Series.
+        quantile_method (str): 'exact' (pandas quantile) or 'sketch'
+            (one-pass KLL sketch, see sketches.KLLSketch).
+        sketch_k (int): KLL accuracy parameter when quantile_method='sketch'.
 
     Returns:
         dict: A dictionary of computed statistics.
@@ -23,22 +57,24 @@ def profile_numeric(series: pd.Series) -> dict:
 
     try:
         data = series.dropna()
+        missing = len(series) - len(data)
+        p25, median, p75 = numeric_quantiles(data, [0.25, 0.5, 0.75], quantile_method, sketch_k)
         stats = {
             "column": series.name,
             "dtype": str(series.dtype),
             "count": len(data),
-            "missing": series.isnull().sum(),
-            "missing_pct": float(series.isnull().mean()),
+            "missing": missing,
+            "missing_pct": float(missing / len(series)) if len(series) else 0.0,
 
             "mean": float(data.mean()),
             "std": float(data.std()),
             "min": float(data.min()),
-            "p25": float(data.quantile(0.25)),
-            "median": float(data.median()),
-            "p75": float(data.quantile(0.75)),
+            "p25": float(p25),
+            "median": float(median),
+            "p75": float(p75),
             "max": float(data.max()),
 
-            "iqr": float(data.quantile(0.75) - data.quantile(0.25)),
+            "iqr": float(p75 - p25),
         }
 
         # Detect outliers using IQR method
@@ -46,6 +82,9 @@ def profile_numeric(series: pd.Series) -> dict:
         upper = stats["p75"] + 1.5 * stats["iqr"]
         stats["outliers"] = int(((data < lower) | (data > upper)).sum())
 
+        if quantile_method == "sketch":
+            stats["quantile_method"] = "sketch"
+
         logger.info(f"✅ Profiled {series.name}: mean={stats['mean']}, outliers={stats['outliers']}")
         return stats
 
@@ -56,3 +95,123 @@ def profile_numeric(series: pd.Series) -> dict:
             "dtype": str(series.dtype),
             "error": str(e)
         }
+
+
+def _block_quantiles(sorted_block: np.ndarray, counts: np.ndarray, qs: list[float]) -> np.ndarray:
+    """
+    Linear-interpolated quantiles (pandas' default) for every column of a
+    block that was sorted along axis 0 with NaNs pushed to the end.
+
+    Returns an array of shape (len(qs), n_columns); columns without data get NaN.
+    """
+    n_cols = sorted_block.shape[1]
+    col_idx = np.arange(n_cols)
+    last = np.maximum(counts - 1, 0)
+    out = np.full((len(qs), n_cols), np.nan)
+
+    for i, q in enumerate(qs):
+        pos = q * last
+        lo = np.floor(pos).astype(np.intp)
+        hi = np.ceil(pos).astype(np.intp)
+        frac = pos - lo
+        lo_val = sorted_block[lo, col_idx]
+        hi_val = sorted_block[hi, col_idx]
+        out[i] = lo_val + (hi_val - lo_val) * frac
+
+    out[:, counts == 0] = np.nan
+    return out
+
+
+@instrument
+def profile_numeric_table(df: pd.DataFrame, block_size: int | None = None,
+                          block_bytes: int = NUMERIC_BLOCK_BYTES) -> dict:
+    """
+    📘 Function: profile_numeric_table
+
+    Description:
+        Batched version of profile_numeric() + detect_outliers(method="iqr")
+        for every numeric column of a DataFrame. Columns are converted to one
+        2-D float64 NumPy block, sorted once, and all statistics are taken
+        from that block: a single missing mask, min/max/quantiles read from
+        the sorted block, and one shared outlier mask for the IQR bounds.
+
+        To bound memory, blocks hold as many columns as fit in `block_bytes`
+        for the frame's row count (see numeric_block_columns), so a 2M-row
+        sheet is processed a few columns at a time and a narrow sheet in one.
+
+    Parameters:
+        df (pd.DataFrame): The DataFrame to analyze. Non-numeric columns are ignored.
+        block_size (int | None): Columns per block; None = sized from block_bytes.
+        block_bytes (int): Byte budget of one float64 block.
+
+    Returns:
+        dict: {column_name: stats}, where stats has the keys of
+        profile_numeric() plus "outlier_method", "outlier_count",
+        "lower_bound" and "upper_bound" (as in detect_outliers()).
+    """
+    logger.info("Entering function profile_numeric_table()")
+
+    numeric_cols = [
+        col for col in df.columns
+        if pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_bool_dtype(df[col])
+    ]
+    n_rows = len(df)
+    results = {}
+    block_size = block_size or numeric_block_columns(n_rows, block_bytes)
+
+    for start in range(0, len(numeric_cols), block_size):
+        cols = numeric_cols[start:start + block_size]
+        try:
+            block = df[cols].to_numpy(dtype="float64", na_value=np.nan)
+            missing = np.isnan(block).sum(axis=0)
+            counts = n_rows - missing
+
+            with warnings.catch_warnings(), np.errstate(all="ignore"):
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                means = np.nanmean(block, axis=0)
+                stds = np.nanstd(block, axis=0, ddof=1)
+
+            sorted_block = np.sort(block, axis=0)
+            p25, median, p75 = _block_quantiles(sorted_block, counts, [0.25, 0.5, 0.75])
+            mins = np.where(counts > 0, sorted_block[0], np.nan)
+            maxs = sorted_block[np.maximum(counts - 1, 0), np.arange(len(cols))]
+            maxs = np.where(counts > 0, maxs, np.nan)
+            del sorted_block
+
+            iqr = p75 - p25
+            lower = p25 - 1.5 * iqr
+            upper = p75 + 1.5 * iqr
+            outlier_mask = (block < lower) | (block > upper)
+            outliers = outlier_mask.sum(axis=0)
+        except Exception as e:
+            logger.error(f"❌ Failed to profile numeric block {cols}: {e}")
+            for col in cols:
+                results[col] = profile_numeric(df[col])
+            continue
+
+        for j, col in enumerate(cols):
+            results[col] = {
+                "column": col,
+                "dtype": str(df[col].dtype),
+                "count": int(counts[j]),
+                "missing": int(missing[j]),
+                "missing_pct": float(missing[j] / n_rows) if n_rows else 0.0,
+
+                "mean": float(means[j]),
+                "std": float(stds[j]) if counts[j] > 1 else float("nan"),
+                "min": float(mins[j]),
+                "p25": float(p25[j]),
+                "median": float(median[j]),
+                "p75": float(p75[j]),
+                "max": float(maxs[j]),
+
+                "iqr": float(iqr[j]),
+                "outliers": int(outliers[j]),
+                "outlier_method": "iqr",
+                "outlier_count": int(outliers[j]),
+                "lower_bound": float(lower[j]),
+                "upper_bound": float(upper[j]),
+            }
+
+    logger.info(f"✅ Profiled {len(results)} numeric columns in blocks of {min(block_size, len(numeric_cols))}")
+    return results
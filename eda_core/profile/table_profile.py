@@ -1,18 +1,17 @@
 import pandas as pd
-import hashlib
 import os
 from datetime import datetime
 from eda_core.profile.column_report import column_report
 from eda_core.utils.logger_utils import setup_logger
+from eda_core.utils.fingerprint import file_fingerprint
 
 logger = setup_logger(__name__)
 
 
-def get_file_hash(file_path):
-    """Generate a SHA-256 hash for the file."""
+def get_file_hash(file_path, algorithm: str = "sha256"):
+    """Generate a hash for the file (streamed in blocks, cached by path/size/mtime)."""
     try:
-        with open(file_path, 'rb') as f:
-            return hashlib.sha256(f.read()).hexdigest()
+        return file_fingerprint(file_path, algorithm=algorithm)
     except Exception as e:
         logger.warning(f"Could not hash file {file_path}: {e}")
         return None
@@ -50,7 +49,14 @@ def table_summary(df: pd.DataFrame, file_path: str = None) -> dict:
 
 
 
-def table_profile(df: pd.DataFrame, source_filename) -> list[dict]:
+def table_profile(
+    df: pd.DataFrame,
+    source_filename,
+    n_jobs: int = 1,
+    executor: str = "thread",
+    incremental: bool = False,
+    plots: str = "eager",
+) -> list[dict]:
     """
     📘 Function: table_profile
 
@@ -60,6 +66,13 @@ def table_profile(df: pd.DataFrame, source_filename) -> list[dict]:
 
     Parameters:
         df (pd.DataFrame): The DataFrame to analyze.
+        source_filename (str): Source name used for the output folders.
+        n_jobs (int): Number of column_report() workers (1 = serial, -1 = all cores).
+        executor (str): 'thread' or 'process' pool for column profiling.
+        incremental (bool): Reuse stored profiles, plots and AI insights for
+            columns whose content hash did not change since the last run.
+        plots (str): 'eager' renders plots now, 'lazy' stores a plot spec to
+            render later (see render_plots()), 'none' skips plots entirely.
 
     Returns:
         List[dict]: Full profile containing all column stats and insights.
@@ -67,7 +80,8 @@ def table_profile(df: pd.DataFrame, source_filename) -> list[dict]:
     logger.info("📊 Entering function table_profile()")
 
     try:
-        profile = column_report(df,source_filename)
+        profile = column_report(df, source_filename, n_jobs=n_jobs, executor=executor,
+                                incremental=incremental, plots=plots)
         logger.info(f"✅ Completed table profiling with {len(profile)} columns")
         return profile
     except Exception as e:
@@ -1,10 +1,74 @@
 # infer_dtypes.py
+import warnings
+import numpy as np
 import pandas as pd
 from eda_core.utils.logger_utils import setup_logger
+from eda_core.utils.instrument import instrument
+from eda_core.io.columnar_cache import read_cached_frame, write_cached_frame
 
 logger = setup_logger("infer_dtypes")
 
-def infer_dtypes(df: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
+# Values accepted for boolean columns and what they map to
+_BOOL_MAP = {
+    True: True, False: False,
+    1: True, 0: False,
+    "1": True, "0": False,
+    "True": True, "False": False,
+}
+
+
+def _sample(values: pd.Series, sample_size: int, random_state: int) -> pd.Series:
+    """Small random sample (with replacement) of the non-null values."""
+    if len(values) <= sample_size:
+        return values
+    rng = np.random.default_rng(random_state)
+    return values.iloc[rng.integers(0, len(values), sample_size)]
+
+
+def _success_ratio(converted: pd.Series, n_values: int) -> float:
+    return float(converted.notna().sum() / n_values) if n_values else 0.0
+
+
+def _to_datetime(values: pd.Series) -> pd.Series:
+    with warnings.catch_warnings():
+        # Format inference warnings are expected while probing string columns
+        warnings.simplefilter("ignore", category=UserWarning)
+        return pd.to_datetime(values, errors="coerce")
+
+
+def _try_convert(series: pd.Series, non_null: pd.Series, converter, sample_size: int,
+                 min_success_ratio: float, random_state: int) -> pd.Series | None:
+    """
+    Probes a sample first and converts the full column only if the sample
+    parses well enough; the full conversion must then pass the same ratio.
+    """
+    sample = _sample(non_null, sample_size, random_state)
+    if _success_ratio(converter(sample), len(sample)) < min_success_ratio:
+        return None
+    converted = converter(series)
+    if _success_ratio(converted, len(non_null)) < min_success_ratio:
+        return None
+    return converted
+
+
+def _try_boolean(series: pd.Series, non_null: pd.Series, sample_size: int, random_state: int) -> pd.Series | None:
+    sample = _sample(non_null, sample_size, random_state)
+    if not pd.Series(pd.unique(sample)).isin(_BOOL_MAP.keys()).all():
+        return None
+    if not pd.Series(pd.unique(non_null)).isin(_BOOL_MAP.keys()).all():
+        return None
+    converted = series.map(_BOOL_MAP)
+    return converted.astype("boolean") if converted.isna().any() else converted.astype(bool)
+
+
+@instrument
+def infer_dtypes(
+    df: pd.DataFrame,
+    cache_key: str | None = None,
+    sample_size: int = 1000,
+    min_success_ratio: float = 1.0,
+    random_state: int = 0,
+) -> tuple[pd.DataFrame, dict]:
     """
     📘 Function: infer_dtypes
 
@@ -12,8 +76,26 @@ def infer_dtypes(df: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
         Attempts to infer better data types for each column in the DataFrame.
         Especially useful for converting strings to datetime, integers, or booleans.
 
+        Only object/string columns are candidates (columns that already have a
+        numeric, boolean or datetime dtype are kept as they are). For each
+        candidate, numeric → datetime → boolean parsing is first tried on a
+        small random sample; the full column is converted only when the
+        sample parses with at least `min_success_ratio` success. Parsing uses
+        errors='coerce' (no exception per failed column) and the boolean
+        mapping is a vectorized dict lookup.
+
     Parameters:
         df (pd.DataFrame): The input DataFrame with raw types (e.g., from Excel).
+        cache_key (str | None): Fingerprint of the source file `df` was loaded
+            from. If given, the typed frame and conversion_log are read from /
+            written to the columnar cache under that key and the inference
+            settings below.
+        sample_size (int): Number of non-null values probed per column.
+        min_success_ratio (float): Share of non-null values that must parse
+            for a conversion to be accepted. 1.0 (default) requires every
+            value to parse; lower values accept columns with a few bad cells,
+            which become missing.
+        random_state (int): Seed for the probe sample.
 
     Returns:
         Tuple[pd.DataFrame, dict]: (updated DataFrame, conversion_log)
@@ -23,58 +105,55 @@ def infer_dtypes(df: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
     }
 
     Notes:
-        - Does not modify the original DataFrame.
-        - Uses pandas smart inference (e.g., `to_numeric`, `to_datetime`, etc.)
+        - Does not modify the original DataFrame; unchanged columns are
+          shared with it rather than copied.
+        - Boolean columns with missing values use pandas' nullable "boolean" dtype.
     """
     logger.info("Entering function infer_dtypes()")
 
-    df_clean = df.copy()
+    # The typed frame depends on the inference settings as well as the file
+    stage = f"typed-n{sample_size}-r{min_success_ratio:g}-s{random_state}"
+    if cache_key:
+        cached = read_cached_frame(cache_key, stage)
+        if cached is not None:
+            return cached[0], cached[1].get("conversion_log", {})
+
+    df_clean = df.copy(deep=False)
     conversion_log = {}
+    converted_count = 0
 
     for col in df.columns:
-        original_type = str(df[col].dtype)
-        new_col = df[col]
+        series = df[col]
+        original_type = str(series.dtype)
+        converted = None
 
-        # Try convert to numeric
-        try:
-            converted = pd.to_numeric(df[col], errors='raise')
-            df_clean[col] = converted
-            new_type = str(converted.dtype)
-            if new_type != original_type:
-                conversion_log[col] = f"{original_type} → {new_type}"
-                logger.info(f"{col}: {conversion_log[col]}")
-                continue
-        except Exception:
-            pass
-
-        # Try convert to datetime
         try:
-            converted = pd.to_datetime(df[col], errors='raise')
+            if pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+                non_null = series.dropna()
+                if len(non_null):
+                    converted = _try_convert(series, non_null, lambda s: pd.to_numeric(s, errors="coerce"),
+                                             sample_size, min_success_ratio, random_state)
+                    if converted is None:
+                        converted = _try_convert(series, non_null, _to_datetime,
+                                                 sample_size, min_success_ratio, random_state)
+                    if converted is None:
+                        converted = _try_boolean(series, non_null, sample_size, random_state)
+        except Exception as e:
+            logger.warning(f"{col}: inference failed ({e}), keeping {original_type}")
+            converted = None
+
+        if converted is not None and str(converted.dtype) != original_type:
             df_clean[col] = converted
-            new_type = str(converted.dtype)
-            if new_type != original_type:
-                conversion_log[col] = f"{original_type} → {new_type}"
-                logger.info(f"{col}: {conversion_log[col]}")
-                continue
-        except Exception:
-            pass
-
-        # Try convert to boolean
-        try:
-            if set(df[col].dropna().unique()).issubset({0, 1, "0", "1", "True", "False", True, False}):
-                converted = df[col].map(lambda x: str(x).lower() in ["1", "true"])
-                df_clean[col] = converted
-                new_type = str(converted.dtype)
-                if new_type != original_type:
-                    conversion_log[col] = f"{original_type} → {new_type}"
-                    logger.info(f"{col}: {conversion_log[col]}")
-                    continue
-        except Exception:
-            pass
+            conversion_log[col] = f"{original_type} → {converted.dtype}"
+            converted_count += 1
+            logger.info(f"{col}: {conversion_log[col]}")
+            continue
 
         # Fallback if no conversion worked
         conversion_log[col] = f"{original_type} → {original_type}"
         logger.info(f"{col}: Unchanged ({original_type})")
 
-    logger.info(f"Inferred {sum(1 for v in conversion_log.values() if '→' in v and not v.endswith('→ ' + v.split('→')[-1]))} column types.")
+    logger.info(f"Inferred {converted_count} column types.")
+    if cache_key:
+        write_cached_frame(df_clean, cache_key, stage, {"conversion_log": conversion_log})
     return df_clean, conversion_log
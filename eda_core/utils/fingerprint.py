@@ -0,0 +1,186 @@
+# eda_core/utils/fingerprint.py
+import hashlib
+import mmap
+import os
+import sqlite3
+import threading
+from contextlib import closing
+import pandas as pd
+from eda_core.utils.logger_utils import setup_logger
+
+logger = setup_logger("fingerprint")
+
+try:
+    import xxhash
+except ImportError:  # optional, falls back to BLAKE2
+    xxhash = None
+
+FINGERPRINT_CACHE_PATH = os.getenv(
+    "FINGERPRINT_CACHE_PATH", os.path.join("outputs", ".cache", "file_hashes.sqlite")
+)
+BLOCK_SIZE = 1024 * 1024
+
+_memory_cache: dict = {}
+_cache_lock = threading.Lock()
+
+
+def new_hasher(algorithm: str = "sha256"):
+    """
+    Returns a hashlib-style object (update()/hexdigest()) for `algorithm`.
+
+    Supported: any hashlib name ("sha256", "sha1", "blake2b", ...) and
+    "xxhash" (xxh3_128, non-cryptographic). If the xxhash package is not
+    installed, "xxhash" falls back to BLAKE2b with a 16-byte digest.
+    """
+    if algorithm == "xxhash":
+        if xxhash is not None:
+            return xxhash.xxh3_128()
+        return hashlib.blake2b(digest_size=16)
+    if algorithm == "blake2b":
+        return hashlib.blake2b(digest_size=32)
+    return hashlib.new(algorithm)
+
+
+def _connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(FINGERPRINT_CACHE_PATH, timeout=30)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS file_hashes (
+            path TEXT,
+            size INTEGER,
+            mtime_ns INTEGER,
+            algorithm TEXT,
+            digest TEXT,
+            PRIMARY KEY (path, algorithm)
+        )
+    """)
+    conn.commit()
+    return conn
+
+
+def _disk_lookup(key: tuple) -> str | None:
+    """Digest stored on disk for (path, size, mtime_ns, algorithm), if any."""
+    try:
+        if not os.path.exists(FINGERPRINT_CACHE_PATH):
+            return None
+        with closing(_connect()) as conn:
+            row = conn.execute(
+                "SELECT digest FROM file_hashes WHERE path = ? AND size = ? AND mtime_ns = ? AND algorithm = ?",
+                key,
+            ).fetchone()
+        return row[0] if row else None
+    except Exception as e:
+        logger.warning(f"⚠️ Ignoring unreadable fingerprint cache {FINGERPRINT_CACHE_PATH}: {e}")
+        return None
+
+
+def _disk_store(key: tuple, digest: str) -> None:
+    """
+    Stores one digest. Each entry is its own row (one per path and
+    algorithm, replacing a stale one), so concurrent writers in other
+    threads or processes never overwrite each other's entries.
+    """
+    try:
+        folder = os.path.dirname(FINGERPRINT_CACHE_PATH)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with closing(_connect()) as conn, conn:
+            conn.execute("INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?, ?)", (*key, digest))
+    except Exception as e:
+        logger.warning(f"⚠️ Could not persist fingerprint cache: {e}")
+
+
+def _hash_file(file_path: str, algorithm: str, block_size: int, use_mmap: bool) -> str:
+    hasher = new_hasher(algorithm)
+    with open(file_path, "rb") as f:
+        if use_mmap and os.fstat(f.fileno()).st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    for start in range(0, len(view), block_size):
+                        hasher.update(view[start:start + block_size])
+                finally:
+                    view.release()
+        else:
+            buffer = bytearray(block_size)
+            view = memoryview(buffer)
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                hasher.update(view[:n])
+    return hasher.hexdigest()
+
+
+def file_fingerprint(
+    file_path: str,
+    algorithm: str = "sha256",
+    block_size: int = BLOCK_SIZE,
+    use_mmap: bool = False,
+    use_cache: bool = True,
+) -> str:
+    """
+    📘 Function: file_fingerprint
+
+    Description:
+        Hashes a file in fixed-size blocks (or through mmap), so memory use is
+        independent of the file size. Results are cached in memory and in
+        the SQLite file outputs/.cache/file_hashes.sqlite (shared by threads
+        and batch worker processes), keyed by (path, size, mtime, algorithm),
+        so an unchanged file is never hashed twice.
+
+    Parameters:
+        file_path (str): File to fingerprint.
+        algorithm (str): "sha256" (default), "blake2b", "xxhash" or any hashlib name.
+        block_size (int): Bytes read per update.
+        use_mmap (bool): Hash through a read-only memory map instead of read().
+        use_cache (bool): Look up / store the (path, size, mtime) cache.
+
+    Returns:
+        str: Hex digest.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    stat = os.stat(file_path)
+    key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns, algorithm)
+
+    if use_cache:
+        with _cache_lock:
+            cached = _memory_cache.get(key)
+        if cached is None:
+            cached = _disk_lookup(key)
+            if cached is not None:
+                with _cache_lock:
+                    _memory_cache[key] = cached
+        if cached is not None:
+            logger.info(f"♻️ Fingerprint cache hit for {file_path}")
+            return cached
+
+    digest = _hash_file(file_path, algorithm, block_size, use_mmap)
+
+    if use_cache:
+        with _cache_lock:
+            # Drop stale entries for the same path before storing the new one
+            for old_key in [k for k in _memory_cache if k[0] == key[0] and k[3] == algorithm]:
+                del _memory_cache[old_key]
+            _memory_cache[key] = digest
+        _disk_store(key, digest)
+
+    return digest
+
+
+def frame_fingerprint(df: pd.DataFrame | pd.Series, algorithm: str = "sha1", index: bool = True) -> str:
+    """
+    🧮 Hashes DataFrame/Series content via pandas' vectorized row hashes.
+
+    Parameters:
+        df (pd.DataFrame | pd.Series): Data to fingerprint.
+        algorithm (str): Digest applied to the row hashes (see new_hasher()).
+        index (bool): Include the index in the row hashes.
+
+    Returns:
+        str: Hex digest.
+    """
+    hasher = new_hasher(algorithm)
+    hasher.update(pd.util.hash_pandas_object(df, index=index).values.tobytes())
+    return hasher.hexdigest()
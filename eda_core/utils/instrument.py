@@ -0,0 +1,426 @@
+# eda_core/utils/instrument.py
+import functools
+import inspect
+import itertools
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from eda_core.utils.logger_utils import setup_logger
+
+logger = setup_logger("instrument")
+
+try:
+    import resource  # not available on Windows
+except ImportError:
+    resource = None
+
+try:
+    import psutil  # optional: current RSS on every platform
+except ImportError:
+    psutil = None
+
+# EDA_INSTRUMENT=0 turns every span into a no-op
+INSTRUMENT_ENABLED = os.getenv("EDA_INSTRUMENT", "1") != "0"
+# Spans at least this long are also logged
+LOG_MIN_SECONDS = float(os.getenv("EDA_INSTRUMENT_LOG_SECONDS", 1.0))
+# EDA_TRACEMALLOC=1 starts tracemalloc with each run (Python allocations; slows runs down 2-3×)
+TRACEMALLOC_ENABLED = os.getenv("EDA_TRACEMALLOC", "0") == "1"
+# EDA_INSTRUMENT_SPANS=1 keeps a full record of every span, including per-column ones
+ALL_SPANS_ENABLED = os.getenv("EDA_INSTRUMENT_SPANS", "0") == "1"
+
+_local = threading.local()
+_ids = itertools.count(1)
+_records: dict = {}  # run id -> {"spans": full span records, "summary": per-name totals}
+_records_lock = threading.Lock()
+_traced_lock = threading.Lock()
+_traced_open: set = set()  # ids of open spans measuring tracemalloc peaks
+_traced_peaks: dict = {}
+
+
+def _stack() -> list:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _mb(n_bytes) -> float | None:
+    return round(n_bytes / (1024 * 1024), 2) if n_bytes is not None else None
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process so far, in MB (None if unknown)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes on Linux
+    return _mb(peak if sys.platform == "darwin" else peak * 1024)
+
+
+def rss_mb() -> float | None:
+    """Current resident set size of this process, in MB (None if unknown)."""
+    if psutil is not None:
+        return _mb(psutil.Process().memory_info().rss)
+    try:
+        with open("/proc/self/statm") as f:
+            return _mb(int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE"))
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _shape_fields(obj) -> dict:
+    """rows/cols (and column name for a Series) of a DataFrame-like object."""
+    shape = getattr(obj, "shape", None)
+    if not isinstance(shape, tuple) or not shape:
+        return {}
+    fields = {"rows": int(shape[0]), "cols": int(shape[1]) if len(shape) > 1 else 1}
+    if len(shape) == 1 and getattr(obj, "name", None) is not None:
+        fields["column"] = str(obj.name)
+    return fields
+
+
+def annotate(**fields) -> None:
+    """Adds fields (e.g. cached=True) to the innermost open span of this thread."""
+    stack = _stack()
+    if stack:
+        stack[-1]["fields"].update(fields)
+
+
+def current_run() -> str | None:
+    """Run id of the innermost open span of this thread, if any."""
+    stack = _stack()
+    return stack[-1]["run"] if stack else None
+
+
+def _traced_enter(span: dict) -> None:
+    with _traced_lock:
+        current, peak = tracemalloc.get_traced_memory()
+        # The peak so far belongs to every span already open; then measure afresh
+        for span_id in _traced_open:
+            _traced_peaks[span_id] = max(_traced_peaks[span_id], peak)
+        tracemalloc.reset_peak()
+        span["py_start"] = current
+        _traced_open.add(span["id"])
+        _traced_peaks[span["id"]] = current
+
+
+def _traced_exit(span: dict) -> dict:
+    with _traced_lock:
+        current, peak = tracemalloc.get_traced_memory()
+        for span_id in _traced_open:
+            _traced_peaks[span_id] = max(_traced_peaks[span_id], peak)
+        _traced_open.discard(span["id"])
+        span_peak = _traced_peaks.pop(span["id"])
+    return {
+        "py_alloc_mb": _mb(current - span["py_start"]),
+        "py_peak_mb": _mb(span_peak - span["py_start"]),
+    }
+
+
+@contextmanager
+def track(name: str, run: str | None = None, aggregate: bool = False, **fields):
+    """
+    📘 Function: track
+
+    Description:
+        Context manager that measures one span of work: wall time, CPU time
+        of the current thread, current and peak RSS, and (when tracemalloc is
+        tracing) Python allocations and their peak. rows/cols/column fields
+        can be added with annotate() or are filled in by @instrument.
+
+        Spans nest per thread; a span inherits the run id of its parent.
+        Every span of a run is added to the run's per-name totals; a full
+        record is kept only for spans with aggregate=False (stage-level
+        work), unless EDA_INSTRUMENT_SPANS=1. Aggregate spans (per-column
+        work, called thousands of times) only measure wall/CPU time, which
+        keeps their overhead small. Results are kept until collect_run(run)
+        is called (spans of a run that finish after that are dropped). Spans
+        outside any run are only logged (when slower than
+        EDA_INSTRUMENT_LOG_SECONDS). Work handed to a thread pool is attributed
+        to the run only if the callable is wrapped with bind(); work in
+        worker processes is not recorded.
+
+    Parameters:
+        name (str): Span name, usually the function name.
+        run (str | None): Run id; starts a run (default: inherit the parent's).
+        aggregate (bool): Only add this span to the per-name totals.
+        **fields: Extra fields stored with the span.
+
+    Usage Example:
+        with track("load_excel", run="sales-1a2b3c4d"):
+            df = load_excel(path)
+    """
+    if not INSTRUMENT_ENABLED:
+        yield
+        return
+
+    stack = _stack()
+    parent = stack[-1] if stack else None
+    span = {
+        "id": next(_ids),
+        "name": name,
+        "run": run or (parent["run"] if parent else None),
+        "parent_id": parent["id"] if parent else None,
+        "fields": dict(fields),
+    }
+    if run:
+        with _records_lock:
+            _records.setdefault(run, {"spans": [], "summary": {}})
+        if TRACEMALLOC_ENABLED and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    if aggregate and not ALL_SPANS_ENABLED:
+        yield from _track_light(span, stack)
+        return
+
+    traced = tracemalloc.is_tracing()
+    if traced:
+        _traced_enter(span)
+
+    stack.append(span)
+    started_at = time.time()
+    wall_start, cpu_start = time.perf_counter(), time.thread_time()
+    peak_start = peak_rss_mb()
+    error = None
+    try:
+        yield
+    except GeneratorExit:
+        raise
+    except BaseException as e:
+        error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+        _pop(stack, span)
+        peak_end = peak_rss_mb()
+        record = {
+            "name": name,
+            "span_id": span["id"],
+            "parent_id": span["parent_id"],
+            "thread": threading.current_thread().name,
+            "started_at": datetime.fromtimestamp(started_at).isoformat(timespec="milliseconds"),
+            "wall_s": round(wall, 6),
+            "cpu_s": round(cpu, 6),
+            "rss_mb": rss_mb(),
+            "peak_rss_mb": peak_end,
+            # > 0 only if this span raised the process's high-water mark
+            "peak_rss_growth_mb": round(peak_end - peak_start, 2) if peak_end is not None else None,
+            **(_traced_exit(span) if traced else {}),
+            **span["fields"],
+        }
+        if error:
+            record["error"] = error
+        _finish(span["run"], record)
+
+
+def _track_light(span: dict, stack: list):
+    """Body of track() for aggregate spans: wall/CPU time only, no full record."""
+    stack.append(span)
+    wall_start, cpu_start = time.perf_counter(), time.thread_time()
+    error = None
+    try:
+        yield
+    except GeneratorExit:
+        raise
+    except BaseException as e:
+        error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        record = {
+            "name": span["name"],
+            "wall_s": time.perf_counter() - wall_start,
+            "cpu_s": time.thread_time() - cpu_start,
+            **span["fields"],
+        }
+        _pop(stack, span)
+        if error:
+            record["error"] = error
+        _finish(span["run"], record, keep=False)
+
+
+def _pop(stack: list, span: dict) -> None:
+    # A suspended generator's span may not be on top of the stack
+    if stack and stack[-1] is span:
+        stack.pop()
+        return
+    for i in range(len(stack) - 1, -1, -1):
+        if stack[i] is span:
+            del stack[i]
+            return
+
+
+def _finish(run: str | None, record: dict, keep: bool = True) -> None:
+    if record["wall_s"] >= LOG_MIN_SECONDS:
+        shape = f", {record['rows']}×{record['cols']}" if "rows" in record else ""
+        peak = f", peak RSS {record['peak_rss_mb']} MB" if "peak_rss_mb" in record else ""
+        logger.info(f"⏱️ {record['name']}: {record['wall_s']:.2f}s wall, {record['cpu_s']:.2f}s CPU"
+                    f"{peak}{shape}")
+    if run is not None:
+        with _records_lock:
+            # Runs already collected (e.g. spans still open at report time) are not kept
+            state = _records.get(run)
+            if state is not None:
+                _add_to_summary(state["summary"], record)
+                if keep:
+                    state["spans"].append(record)
+
+
+def instrument(name=None, aggregate: bool = False, **fields):
+    """
+    📘 Function: instrument
+
+    Description:
+        Decorator form of track(). The span is named after the function
+        unless `name` is given. rows/cols are taken from the return value
+        (or the first element of a returned tuple) if it is DataFrame-like,
+        else from the first argument; a Series argument also sets "column".
+        Generator functions are measured until the generator is exhausted.
+        Use aggregate=True for functions called once per column or request:
+        their calls only add to the run report's per-name totals.
+
+    Usage Example:
+        @instrument
+        def load_excel(path): ...
+
+        @instrument("plots.box", aggregate=True)
+        def plot_box(series, column_name): ...
+    """
+    if callable(name):
+        return instrument()(name)
+
+    def decorator(fn):
+        span_name = name or fn.__name__
+
+        if inspect.isgeneratorfunction(fn):
+            @functools.wraps(fn)
+            def gen_wrapper(*args, **kwargs):
+                with track(span_name, aggregate=aggregate, **fields):
+                    if args:
+                        annotate(**_shape_fields(args[0]))
+                    yield from fn(*args, **kwargs)
+            return gen_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not INSTRUMENT_ENABLED:
+                return fn(*args, **kwargs)
+            with track(span_name, aggregate=aggregate, **fields):
+                if args:
+                    annotate(**_shape_fields(args[0]))
+                result = fn(*args, **kwargs)
+                shaped = result[0] if isinstance(result, tuple) and result else result
+                annotate(**_shape_fields(shaped))
+                return result
+        return wrapper
+
+    return decorator
+
+
+def bind(fn):
+    """
+    Wraps `fn` so spans it opens on another thread (e.g. in a
+    ThreadPoolExecutor) nest under the caller's current span and run.
+    """
+    stack = _stack()
+    parent = stack[-1] if stack else None
+    if parent is None or not INSTRUMENT_ENABLED:
+        return fn
+
+    @functools.wraps(fn)
+    def bound(*args, **kwargs):
+        worker_stack = _stack()
+        worker_stack.append(parent)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            worker_stack.pop()
+    return bound
+
+
+def new_run_id(source_filename: str) -> str:
+    """Unique run id for one pipeline run over `source_filename`."""
+    return f"{source_filename}-{os.getpid()}-{next(_ids)}"
+
+
+def collect_run(run: str) -> tuple[list[dict], dict]:
+    """
+    Removes and returns the results of `run`: its full span records (in
+    completion order) and the per-name totals of all its spans.
+    """
+    with _records_lock:
+        state = _records.pop(run, None) or {"spans": [], "summary": {}}
+    return state["spans"], _finalize_summary(state["summary"])
+
+
+def _add_to_summary(summary: dict, span: dict) -> None:
+    entry = summary.get(span["name"])
+    if entry is None:
+        entry = summary[span["name"]] = {
+            "calls": 0, "wall_s": 0.0, "cpu_s": 0.0, "max_wall_s": 0.0, "peak_rss_mb": None, "errors": 0,
+        }
+    entry["calls"] += 1
+    entry["wall_s"] += span["wall_s"]
+    entry["cpu_s"] += span["cpu_s"]
+    entry["max_wall_s"] = max(entry["max_wall_s"], span["wall_s"])
+    if span.get("peak_rss_mb") is not None:
+        entry["peak_rss_mb"] = max(entry["peak_rss_mb"] or 0.0, span["peak_rss_mb"])
+    if "rows" in span:
+        entry["rows"] = entry.get("rows", 0) + span["rows"]
+    if span.get("py_peak_mb") is not None:
+        entry["py_peak_mb"] = max(entry.get("py_peak_mb", 0.0), span["py_peak_mb"])
+    entry["errors"] += bool(span.get("error"))
+
+
+def _finalize_summary(summary: dict) -> dict:
+    for entry in summary.values():
+        entry["wall_s"] = round(entry["wall_s"], 4)
+        entry["cpu_s"] = round(entry["cpu_s"], 4)
+        entry["max_wall_s"] = round(entry["max_wall_s"], 6)
+    return dict(sorted(summary.items(), key=lambda item: -item[1]["wall_s"]))
+
+
+def summarize_spans(spans: list[dict]) -> dict:
+    """Totals per span name: calls, wall/CPU seconds, slowest call, peak RSS, rows."""
+    summary = {}
+    for span in spans:
+        _add_to_summary(summary, span)
+    return _finalize_summary(summary)
+
+
+def build_run_report(run: str, source_path: str = "", **fields) -> dict:
+    """
+    📘 Function: build_run_report
+
+    Description:
+        Collects the results of `run` (see collect_run) into a
+        machine-readable run report: per-name totals of every span
+        ("summary") plus the full records of stage-level spans ("spans"; of
+        every span with EDA_INSTRUMENT_SPANS=1), along with process-level
+        peak RSS.
+
+    Parameters:
+        run (str): Run id.
+        source_path (str): Input file of the run.
+        **fields: Extra top-level fields (e.g. fingerprint, stage_seconds).
+
+    Returns:
+        dict: The run report (JSON-serializable).
+    """
+    spans, summary = collect_run(run)
+    return {
+        "run_id": run,
+        "source_path": source_path,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "pid": os.getpid(),
+        "peak_rss_mb": peak_rss_mb(),
+        "tracemalloc": tracemalloc.is_tracing(),
+        **fields,
+        "all_spans": ALL_SPANS_ENABLED,
+        "summary": summary,
+        "spans": spans,
+    }
@@ -1,10 +1,11 @@
 import os
 import json
-import hashlib
 import pandas as pd
 from datetime import datetime
 from eda_core.utils.logger_utils import setup_logger
+from eda_core.utils.instrument import instrument
 from eda_core.io.save_output import get_output_subfolder
+from eda_core.utils.fingerprint import frame_fingerprint, new_hasher
 
 logger = setup_logger("persist_metadata")
 
@@ -14,12 +15,49 @@ def calculate_hash(df: pd.DataFrame) -> str:
     Uses SHA-1 for fast and consistent fingerprinting.
     """
     try:
-        hash_val = hashlib.sha1(pd.util.hash_pandas_object(df, index=True).values).hexdigest()
-        return hash_val
+        return frame_fingerprint(df, algorithm="sha1", index=True)
     except Exception as e:
         logger.error(f"Failed to compute hash: {e}")
         return ""
 
+def column_fingerprints(df: pd.DataFrame) -> dict:
+    """
+    🧮 Calculates a content hash per column (values + dtype, index ignored).
+
+    Returns:
+        dict: {column_name (str): sha1 hex digest}
+    """
+    hashes = {}
+    for col in df.columns:
+        try:
+            digest = new_hasher("sha1")
+            digest.update(pd.util.hash_pandas_object(df[col], index=False).values.tobytes())
+            digest.update(str(df[col].dtype).encode("utf-8"))
+            hashes[str(col)] = digest.hexdigest()
+        except Exception as e:
+            logger.error(f"Failed to compute hash for column {col}: {e}")
+            hashes[str(col)] = ""
+    return hashes
+
+def load_column_profile(original_filename) -> list[dict]:
+    """
+    📂 Loads the column profile saved by serialize_profile() on a previous run.
+
+    Returns:
+        list[dict]: Previous column profiles, or [] if none could be read.
+    """
+    path = os.path.join(get_output_subfolder(original_filename, "stats"), "colum_profile.json")
+    if not os.path.exists(path):
+        return []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            profile = json.load(f)
+        return profile if isinstance(profile, list) else []
+    except Exception as e:
+        logger.warning(f"⚠️ Could not read previous column profile {path}: {e}")
+        return []
+
+@instrument
 def persist_run_metadata(df: pd.DataFrame, original_filename) -> None:
     """
     💾 Save profiling metadata to JSON log.
@@ -47,6 +85,7 @@ def persist_run_metadata(df: pd.DataFrame, original_filename) -> None:
     except Exception as e:
         logger.error(f"❌ Failed to persist metadata: {e}")
 
+@instrument
 def serialize_profile(profile: list[dict],original_filename) -> None:
     """
     💾 Saves column profile data to JSON.
@@ -0,0 +1,181 @@
+# pipeline/batch.py
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+# ✅ Allow `python pipeline/batch.py` as well as `python -m pipeline.batch`
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from ai.rate_limiter import SharedTokenBucket
+from eda_core.io.save_output import get_base_filename
+from eda_core.utils.fingerprint import file_fingerprint
+from eda_core.utils.logger_utils import setup_logger
+from pipeline.manifest import is_up_to_date
+
+logger = setup_logger("batch")
+
+# In-memory DataFrame size relative to the .xlsx on disk (zipped XML),
+# used to estimate each file's peak memory before scheduling it.
+MEMORY_EXPANSION = float(os.getenv("BATCH_MEMORY_EXPANSION", 10))
+
+# Set in each worker by _init_worker()
+_LIMITER = None
+_MODEL = "ollama"
+_INCREMENTAL = True
+
+
+def _init_worker(limiter, model: str, incremental: bool) -> None:
+    """Pool initializer: every worker shares the parent's rate limiter."""
+    global _LIMITER, _MODEL, _INCREMENTAL
+    _LIMITER, _MODEL, _INCREMENTAL = limiter, model, incremental
+
+
+def _run_one(path: str, fingerprint: str) -> dict:
+    from pipeline.run_pipeline import run_pipeline
+
+    return run_pipeline(path, incremental=_INCREMENTAL, model=_MODEL, limiter=_LIMITER,
+                        fingerprint=fingerprint)
+
+
+def discover_workbooks(source) -> list[str]:
+    """All .xlsx files in a directory (or the given list of paths), sorted by name."""
+    if isinstance(source, str) and os.path.isdir(source):
+        return sorted(
+            os.path.join(source, name) for name in os.listdir(source)
+            if name.endswith(".xlsx") and not name.startswith("~$")
+        )
+    return [source] if isinstance(source, str) else list(source)
+
+
+def estimate_memory_mb(path: str) -> float:
+    return os.path.getsize(path) * MEMORY_EXPANSION / (1024 * 1024)
+
+
+def run_batch(
+    source,
+    max_workers: int | None = None,
+    memory_budget_mb: float | None = None,
+    model: str = "ollama",
+    requests_per_second: float | None = 2.0,
+    burst: int = 1,
+    resume: bool = True,
+    incremental: bool = True,
+) -> list[dict]:
+    """
+    📘 Function: run_batch
+
+    Description:
+        Runs run_pipeline() over many workbooks with a process pool.
+
+        - Memory: each file's peak memory is estimated from its size
+          (× BATCH_MEMORY_EXPANSION). Files are started largest first, and a
+          file only starts while the estimates of all running files fit in
+          `memory_budget_mb`. A single file over budget still runs, alone.
+        - LLM: all workers share one rate limiter (SharedTokenBucket) and
+          the on-disk SQLite LLM cache, so the request rate is global and a
+          prompt answered by one worker is a cache hit for the others.
+        - Resume: with resume=True, files whose run manifest matches the
+          current file fingerprint (and whose outputs still exist) are
+          skipped, so a crashed batch can simply be started again.
+
+    Parameters:
+        source (str | list[str]): Directory of .xlsx files, or file paths.
+        max_workers (int | None): Worker processes (default: CPU count).
+        memory_budget_mb (float | None): Memory budget for running files
+            (default: BATCH_MEMORY_MB env var, else unbounded).
+        model (str): LLM backend.
+        requests_per_second (float | None): Global LLM request rate; None = unlimited.
+        burst (int): Token-bucket capacity.
+        resume (bool): Skip files that are already done.
+        incremental (bool): Reuse unchanged column results within a file.
+
+    Returns:
+        list[dict]: One result per file with "path", "status"
+        ('done', 'partial', 'skipped' or 'error') and timing or error details.
+    """
+    paths = discover_workbooks(source)
+    max_workers = max_workers or os.cpu_count() or 1
+    if memory_budget_mb is None and os.getenv("BATCH_MEMORY_MB"):
+        memory_budget_mb = float(os.getenv("BATCH_MEMORY_MB"))
+
+    results = []
+    queue = []
+    for path in paths:
+        fingerprint = file_fingerprint(path)
+        if resume and is_up_to_date(get_base_filename(path), fingerprint):
+            results.append({"path": path, "status": "skipped", "fingerprint": fingerprint})
+            continue
+        queue.append((path, fingerprint, estimate_memory_mb(path)))
+
+    logger.info(f"📚 Batch: {len(paths)} files, {len(results)} up to date, {len(queue)} to run "
+                f"(workers={max_workers}, memory budget={memory_budget_mb or '∞'} MB)")
+    if not queue:
+        return results
+
+    # Largest files first keeps the tail of the batch short
+    queue.sort(key=lambda item: item[2], reverse=True)
+    limiter = SharedTokenBucket(requests_per_second, burst) if requests_per_second else None
+
+    started = time.perf_counter()
+    running = {}
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                             initargs=(limiter, model, incremental)) as pool:
+        while queue or running:
+            in_use = sum(mb for _, _, mb in running.values())
+            # Start every file that fits; the largest fitting file goes first
+            for item in list(queue):
+                if len(running) >= max_workers:
+                    break
+                path, fingerprint, mb = item
+                fits = memory_budget_mb is None or in_use + mb <= memory_budget_mb
+                if fits or not running:
+                    queue.remove(item)
+                    running[pool.submit(_run_one, path, fingerprint)] = item
+                    in_use += mb
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                path, fingerprint, mb = running.pop(future)
+                try:
+                    result = future.result()
+                    results.append({"path": path, "status": "done", **result})
+                    logger.info(f"✅ {path} done in {result['seconds']}s")
+                except Exception as e:
+                    results.append({"path": path, "status": "error", "fingerprint": fingerprint,
+                                    "error": str(e)})
+                    logger.error(f"❌ {path} failed: {e}")
+
+    failed = sum(r["status"] == "error" for r in results)
+    logger.info(f"🏁 Batch finished in {time.perf_counter() - started:.1f}s ({failed} failed)")
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run the EDA pipeline over many workbooks")
+    parser.add_argument("source", nargs="?", default="sample_source", help="directory of .xlsx files")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--memory-mb", type=float, default=None, help="memory budget for running files")
+    parser.add_argument("--model", default="ollama", help="LLM backend")
+    parser.add_argument("--rps", type=float, default=2.0, help="global LLM requests per second (0 = unlimited)")
+    parser.add_argument("--burst", type=int, default=1, help="rate limiter burst size")
+    parser.add_argument("--no-resume", action="store_true", help="re-run files that are already done")
+    args = parser.parse_args()
+
+    results = run_batch(
+        args.source,
+        max_workers=args.workers,
+        memory_budget_mb=args.memory_mb,
+        model=args.model,
+        requests_per_second=args.rps or None,
+        burst=args.burst,
+        resume=not args.no_resume,
+    )
+    for r in results:
+        print(f"{r['status']:>8}  {r['path']}" + (f"  ({r['error']})" if "error" in r else ""))
+    return 1 if any(r["status"] == "error" for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+# pipeline/manifest.py
+import json
+import os
+from datetime import datetime
+from eda_core.io.save_output import get_output_subfolder
+from eda_core.utils.logger_utils import setup_logger
+
+logger = setup_logger("manifest")
+
+MANIFEST_NAME = "run_manifest.json"
+
+
+def _manifest_path(source_filename: str) -> str:
+    return os.path.join(get_output_subfolder(source_filename, "stats"), MANIFEST_NAME)
+
+
+def write_run_manifest(path: str, source_filename: str, fingerprint: str, outputs: dict,
+                       status: str = "complete", problems: list[str] | None = None) -> str:
+    """
+    💾 Records a finished run: source path, file fingerprint, the main
+    output files and whether every output was produced ("complete") or
+    some step failed ("partial", with the reasons in "problems"), in
+    outputs/<name>/stats/run_manifest.json.
+    """
+    manifest = {
+        "source_path": path,
+        "fingerprint": fingerprint,
+        "status": status,
+        "outputs": outputs,
+        "completed_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    if problems:
+        manifest["problems"] = problems
+    target = _manifest_path(source_filename)
+    try:
+        with open(target + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        os.replace(target + ".tmp", target)
+        logger.info(f"📦 Run manifest saved to {target}")
+        return target
+    except Exception as e:
+        logger.error(f"❌ Failed to save run manifest: {e}")
+        return ""
+
+
+def load_run_manifest(source_filename: str) -> dict:
+    """The stored run manifest, or {} if there is none."""
+    target = _manifest_path(source_filename)
+    if not os.path.exists(target):
+        return {}
+    try:
+        with open(target, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        logger.warning(f"⚠️ Could not read run manifest {target}: {e}")
+        return {}
+
+
+def is_up_to_date(source_filename: str, fingerprint: str) -> bool:
+    """
+    True if the last run was complete, for a file with this fingerprint,
+    and its recorded outputs still exist. Partial runs are never up to date.
+    """
+    manifest = load_run_manifest(source_filename)
+    if not manifest or manifest.get("fingerprint") != fingerprint:
+        return False
+    if manifest.get("status") != "complete":
+        return False
+    return all(not p or os.path.exists(p) for p in manifest.get("outputs", {}).values())
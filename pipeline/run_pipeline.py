@@ -0,0 +1,284 @@
+# pipeline/run_pipeline.py
+import functools
+import time
+from eda_core.io.load_excel import load_excel
+from eda_core.validation.validate_schema import validate_schema
+from eda_core.transform.infer_dtypes import infer_dtypes
+from eda_core.utils.fingerprint import file_fingerprint
+from eda_core.profile.table_profile import table_summary, table_profile
+from ai.generate_ai_insight import generate_ai_insight_stream, prepare_table_prompt
+from ai.llm_client import StreamMetrics, is_error_response
+from ai.generate_ai_insight import annotate_profile
+from ai.llm_cache import get_default_cache
+import numpy as np
+from eda_core.utils.persist_metadata import persist_run_metadata, serialize_profile
+from eda_core.io.save_output import save_json
+from eda_core.io.save_output import save_table_insight, get_base_filename
+from eda_core.io.save_output import save_markdown, save_run_report
+from eda_core.io.render_markdown import render_markdown
+from eda_core.utils.instrument import build_run_report, new_run_id, track
+from pipeline.manifest import write_run_manifest
+from datetime import datetime
+
+
+def sanitize_summary(summary: dict) -> dict:
+    cleaned = {}
+    for k, v in summary.items():
+        # Fix for column_types which contains np.dtype keys
+        if k == "column_types" and isinstance(v, dict):
+            cleaned[k] = {str(key): int(val) for key, val in v.items()}
+        elif isinstance(v, (np.integer, np.floating)):
+            cleaned[k] = float(v)
+        else:
+            cleaned[k] = v
+    return cleaned
+
+
+
+def new_run(path, incremental: bool = True, model: str = "ollama", limiter=None,
+            fingerprint: str | None = None, echo: bool = True) -> dict:
+    """
+    State for one workbook as it moves through PIPELINE_STAGES. With
+    echo=False the table insight is not printed as it streams (e.g. when
+    several files run at once).
+    """
+    return {
+        "path": path,
+        "source_filename": get_base_filename(path),
+        "run_id": new_run_id(get_base_filename(path)),
+        "fingerprint": fingerprint or file_fingerprint(path),
+        "incremental": incremental,
+        "model": model,
+        "limiter": limiter,
+        "echo": echo,
+        "started": time.perf_counter(),
+    }
+
+
+def load_stage(run: dict) -> dict:
+    """Load → validate → infer dtypes → table summary (CPU / disk)."""
+    path = run["path"]
+    print(f"📂 Loading file: {path}")
+    df = load_excel(path)
+
+    print("✅ Validating schema...")
+    validate_schema(df, rules=None)
+
+    print("🔍 Inferring data types...")
+    df_clean, _ = infer_dtypes(df, cache_key=run["fingerprint"])
+
+    print("📄 Generating table summary...")
+    summary = table_summary(df_clean, file_path=path)
+    print("\n=== 📊 Table Summary ===")
+    for k, v in summary.items():
+        print(f"{k}: {v}")
+
+    run.update({"df": df_clean, "summary": summary})
+    return run
+
+
+def profile_stage(run: dict) -> dict:
+    """Column profiles and table metadata (CPU). Releases the DataFrame afterwards."""
+    # print("\n🧠 Profiling columns... ")
+    # column_profiles = table_profile(df)
+
+    print("\n🧠 Profiling columns...")
+    df_clean = run.pop("df")
+    # Plots are only rendered when the Markdown report is built
+    run["column_profiles"] = table_profile(df_clean, run["source_filename"],
+                                           incremental=run["incremental"], plots="lazy")
+
+    # Save metadata
+    persist_run_metadata(df_clean, run["source_filename"])
+    return run
+
+
+def annotate_stage(run: dict) -> dict:
+    """Per-column AI insights (network)."""
+    # after column_profiles = column_report(df)
+    run["column_profiles"] = annotate_profile(run["column_profiles"], model=run["model"],
+                                              skip_annotated=run["incremental"], limiter=run["limiter"])
+
+    # Save profile
+    serialize_profile(run["column_profiles"], run["source_filename"])
+    return run
+
+
+def insight_stage(run: dict) -> dict:
+    """Table-level AI insight, streamed to the console and insights/ (network)."""
+    source_filename, model = run["source_filename"], run["model"]
+
+    print("🪄 Generating AI prompt...")
+    summary_clean = sanitize_summary(run["summary"])
+    prompt = prepare_table_prompt(summary_clean, run["column_profiles"], model=model, limiter=run["limiter"])
+
+    print("🤖 Generating AI insight...")
+    echo = run.get("echo", True)
+    if echo:
+        print("\n🎉 Table Insight Output:")
+        print("-" * 48)
+    # Stream the insight to the console (and insights/) as it is generated
+    metrics = StreamMetrics()
+    chunks = []
+    for chunk in generate_ai_insight_stream(prompt, model=model, original_filename=source_filename,
+                                            metrics=metrics, limiter=run["limiter"]):
+        if echo:
+            print(chunk, end="", flush=True)
+        chunks.append(chunk)
+    if echo:
+        print()
+        print("-" * 48)
+    else:
+        print(f"🎉 Table insight for {source_filename} streamed to {metrics.path}")
+    print(f"⏱️ {metrics.as_dict()}")
+
+    text = "".join(chunks)
+    if metrics.error or is_error_response(text):
+        insight = {"status": "error", "message": metrics.error or text.strip() or "empty response"}
+    else:
+        insight = {"status": "success", "insight": text}
+
+    print("💾 Saving insight result to JSON file...")
+    save_json(insight,original_filename=run["path"])
+
+
+    # 📝 Save table-level insight separately
+    table_insight = ""
+    if isinstance(insight, dict) and insight.get("status") == "success":
+        table_insight = save_table_insight(
+            insight_text=insight.get("insight", ""),
+            original_filename=source_filename
+        )
+    print("📝 Table-level insight saved to JSON.")
+
+    run["insight_stream"] = metrics.path
+    run["insight_status"] = insight["status"] if table_insight else "error"
+    return run
+
+
+def _write_run_report(run: dict, **fields) -> str:
+    """Saves the run's instrumentation spans to outputs/<name>/stats/run_report.json."""
+    report = build_run_report(run["run_id"], run["path"], fingerprint=run["fingerprint"],
+                              total_wall_s=round(time.perf_counter() - run["started"], 3),
+                              stage_seconds=run.get("stage_seconds", {}), **fields)
+    return save_run_report(report, run["source_filename"])
+
+
+def _run_problems(run: dict, md_text: str, md_path: str) -> list[str]:
+    """Reasons the run's outputs are incomplete (empty if everything was produced)."""
+    problems = []
+    if not md_text or not md_path:
+        problems.append("Markdown report was not rendered or saved")
+    if run.get("insight_status") != "success":
+        problems.append("table insight failed")
+    failed = [str(c.get("column")) for c in run["column_profiles"] if is_error_response(c.get("ai_insight"))]
+    if failed:
+        problems.append(f"{len(failed)} column insight(s) failed: {', '.join(failed[:10])}"
+                        + (" ..." if len(failed) > 10 else ""))
+    return problems
+
+
+def report_stage(run: dict) -> dict:
+    """Markdown report (renders the lazy plots), run report and run manifest (CPU / disk)."""
+    source_filename = run["source_filename"]
+    created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    file_meta = {
+        "source_name": source_filename,
+        "created_at": created_at
+    }
+
+    md_text = render_markdown(run["column_profiles"], run["summary"], file_meta)
+    md_path = save_markdown(md_text, original_filename=file_meta["source_name"])
+    print(f"📝 Markdown file saved to outputs folder {md_path}.")
+
+    cache = get_default_cache()
+    if cache is not None:
+        print(f"💾 LLM cache: {cache.stats()}")
+
+    # Timings of every instrumented step so far (the report stage itself is still running)
+    run["run_report"] = _write_run_report(run)
+
+    # Written last; only a "complete" manifest lets resume skip this file
+    outputs = {"markdown": md_path, "insight_stream": run.get("insight_stream"),
+               "run_report": run["run_report"]}
+    run["problems"] = _run_problems(run, md_text, md_path)
+    if run["problems"]:
+        print(f"⚠️ Run incomplete: {'; '.join(run['problems'])}")
+        write_run_manifest(run["path"], source_filename, run["fingerprint"], outputs,
+                           status="partial", problems=run["problems"])
+    else:
+        write_run_manifest(run["path"], source_filename, run["fingerprint"], outputs)
+
+    run["markdown"] = md_path
+    return run
+
+
+def _tracked(name: str, stage):
+    """Runs `stage` as a "stage.<name>" span of the run's run report."""
+    @functools.wraps(stage)
+    def tracked(run: dict) -> dict:
+        try:
+            with track(f"stage.{name}", run=run["run_id"]):
+                return stage(run)
+        except Exception as e:
+            # Keep the timings up to the failure
+            _write_run_report(run, error=str(e), failed_stage=name)
+            raise
+    return tracked
+
+
+# (name, function) in execution order; see pipeline.stages for running them concurrently
+PIPELINE_STAGES = [
+    ("load", _tracked("load", load_stage)),
+    ("profile", _tracked("profile", profile_stage)),
+    ("annotate", _tracked("annotate", annotate_stage)),
+    ("insight", _tracked("insight", insight_stage)),
+    ("report", _tracked("report", report_stage)),
+]
+
+
+def run_result(run: dict) -> dict:
+    """Summary of a finished run."""
+    return {
+        "status": "partial" if run.get("problems") else "done",
+        "source": run["source_filename"],
+        "fingerprint": run["fingerprint"],
+        "markdown": run.get("markdown"),
+        "run_report": run.get("run_report"),
+        "seconds": round(time.perf_counter() - run["started"], 2),
+    }
+
+
+def run_pipeline(path, incremental: bool = True, model: str = "ollama", limiter=None,
+                 fingerprint: str | None = None) -> dict:
+    """
+    📘 Function: run_pipeline
+
+    Description:
+        Runs the full pipeline for one workbook: load → validate → infer
+        dtypes → table summary → column profiles → AI annotations → table
+        insight → JSON/Markdown outputs (the PIPELINE_STAGES, in sequence).
+        Timings and memory of each instrumented step are saved to
+        outputs/<name>/stats/run_report.json. Last, a run manifest with the
+        file fingerprint is written to outputs/<name>/stats/run_manifest.json;
+        it is marked "complete" only if the Markdown report, the table
+        insight and every column insight were produced, which lets batch
+        runs skip files that are already done (see pipeline.batch) while
+        partial runs are redone.
+
+    Parameters:
+        path (str): Excel file to process.
+        incremental (bool): Reuse profiles/insights of unchanged columns.
+        model (str): LLM backend for annotations and the table insight.
+        limiter (TokenBucket | SharedTokenBucket | None): Rate limiter for
+            every LLM request of the run (shared across batch workers).
+        fingerprint (str | None): Precomputed file_fingerprint(path).
+
+    Returns:
+        dict: {"status" ('done' or 'partial'), "source", "fingerprint",
+        "markdown", "run_report", "seconds"}
+    """
+    run = new_run(path, incremental=incremental, model=model, limiter=limiter, fingerprint=fingerprint)
+    for _, stage in PIPELINE_STAGES:
+        run = stage(run)
+    return run_result(run)
@@ -0,0 +1,236 @@
+# pipeline/stages.py
+import argparse
+import os
+import queue
+import sys
+import threading
+import time
+
+# ✅ Allow `python pipeline/stages.py` as well as `python -m pipeline.stages`
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from ai.rate_limiter import TokenBucket
+from eda_core.utils.logger_utils import setup_logger
+
+logger = setup_logger("stages")
+
+# Default workers per stage: the LLM-bound stages get more so that
+# parsing/profiling of the next file overlaps with waiting on the model.
+DEFAULT_CONCURRENCY = {"load": 1, "profile": 1, "annotate": 2, "insight": 1, "report": 1}
+
+_DONE = object()
+
+
+class StagedPipeline:
+    """
+    📘 Class: StagedPipeline
+
+    Description:
+        Runs items through a list of stages, each with its own worker threads,
+        connected by bounded queues. While one item is in a slow (e.g. LLM)
+        stage, the next items are already being processed by earlier stages;
+        the bounded queues apply back-pressure so at most `queue_size` items
+        wait between two stages (this caps how many loaded DataFrames are in
+        memory at once).
+
+        A stage is a function item -> item. If it raises, the item is marked
+        with "error" and "failed_stage" and skips the remaining stages.
+        Per-stage wall time for each item is recorded in item["stage_seconds"].
+
+    Parameters:
+        stages (list[tuple[str, callable]]): (name, function) in order.
+        concurrency (dict | None): Worker threads per stage name (default 1).
+        queue_size (int): Capacity of each queue between stages.
+
+    Usage Example:
+        pipeline = StagedPipeline(PIPELINE_STAGES, {"annotate": 4}, queue_size=2)
+        results = pipeline.run(new_run(p) for p in paths)
+    """
+
+    def __init__(self, stages: list[tuple], concurrency: dict | None = None, queue_size: int = 2):
+        unknown = set(concurrency or {}) - {name for name, _ in stages}
+        if unknown:
+            raise ValueError(f"Unknown stage(s) in concurrency: {sorted(unknown)}")
+        self.stages = stages
+        self.concurrency = {name: max(1, int((concurrency or {}).get(name, 1))) for name, _ in stages}
+        self.queue_size = max(1, int(queue_size))
+        self.feed_error = None
+
+    def _worker(self, name: str, fn, inbox: queue.Queue, outbox: queue.Queue) -> None:
+        while True:
+            item = inbox.get()
+            if item is _DONE:
+                return
+            if "error" not in item:
+                started = time.perf_counter()
+                try:
+                    item = fn(item)
+                except Exception as e:
+                    logger.error(f"❌ Stage '{name}' failed for {item.get('path')}: {e}")
+                    item["error"] = str(e)
+                    item["failed_stage"] = name
+                item.setdefault("stage_seconds", {})[name] = round(time.perf_counter() - started, 3)
+            outbox.put(item)
+
+    def run(self, items) -> list:
+        """
+        Processes all items and returns them in completion order. If
+        `items` raises, the items fed so far are still finished and
+        returned, and the error is kept in self.feed_error.
+        """
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        results = queue.Queue()
+        outboxes = queues[1:] + [results]
+
+        pools = []
+        for (name, fn), inbox, outbox in zip(self.stages, queues, outboxes):
+            threads = [
+                threading.Thread(target=self._worker, args=(name, fn, inbox, outbox),
+                                 name=f"stage-{name}-{i}", daemon=True)
+                for i in range(self.concurrency[name])
+            ]
+            for t in threads:
+                t.start()
+            pools.append(threads)
+
+        # Blocks whenever the first queue is full (back-pressure)
+        count = 0
+        self.feed_error = None
+        try:
+            for item in items:
+                queues[0].put(item)
+                count += 1
+        except Exception as e:
+            # Items already fed are still finished and returned
+            logger.error(f"❌ Reading pipeline items failed after {count} items: {e}")
+            self.feed_error = str(e)
+        finally:
+            # Shut the stages down in order, once each upstream stage has drained
+            for (name, _), inbox, threads in zip(self.stages, queues, pools):
+                for _ in threads:
+                    inbox.put(_DONE)
+                for t in threads:
+                    t.join()
+
+        return [results.get() for _ in range(count)]
+
+
+def run_staged(
+    source,
+    concurrency: dict | None = None,
+    queue_size: int = 2,
+    model: str = "ollama",
+    requests_per_second: float | None = 2.0,
+    burst: int = 1,
+    resume: bool = True,
+    incremental: bool = True,
+) -> list[dict]:
+    """
+    📘 Function: run_staged
+
+    Description:
+        Runs the pipeline over many workbooks in one process with the stages
+        of pipeline.run_pipeline.PIPELINE_STAGES overlapping: file N+1 is
+        loaded and profiled while file N is still being annotated. All
+        annotate workers share one rate limiter. Files whose outputs match
+        their current fingerprint are skipped (resume=True).
+
+        Use this to overlap CPU and LLM time on one machine; use
+        pipeline.batch.run_batch to spread CPU-heavy work over processes.
+
+    Parameters:
+        source (str | list[str]): Directory of .xlsx files, or file paths.
+        concurrency (dict | None): Workers per stage, merged over DEFAULT_CONCURRENCY.
+        queue_size (int): Files allowed to wait between two stages.
+        model (str): LLM backend.
+        requests_per_second (float | None): LLM request rate; None = unlimited.
+        burst (int): Token-bucket capacity.
+        resume (bool): Skip files that are already done.
+        incremental (bool): Reuse unchanged column results within a file.
+
+    Returns:
+        list[dict]: One result per file with "path", "status"
+        ('done', 'partial', 'skipped' or 'error') and per-stage timings.
+    """
+    from eda_core.io.save_output import get_base_filename
+    from eda_core.utils.fingerprint import file_fingerprint
+    from pipeline.batch import discover_workbooks
+    from pipeline.manifest import is_up_to_date
+    from pipeline.run_pipeline import PIPELINE_STAGES, new_run, run_result
+
+    concurrency = {**DEFAULT_CONCURRENCY, **(concurrency or {})}
+    limiter = TokenBucket(requests_per_second, burst) if requests_per_second else None
+
+    results = []
+    runs = []
+    for path in discover_workbooks(source):
+        fingerprint = file_fingerprint(path)
+        if resume and is_up_to_date(get_base_filename(path), fingerprint):
+            results.append({"path": path, "status": "skipped", "fingerprint": fingerprint})
+            continue
+        runs.append((path, fingerprint))
+
+    logger.info(f"🏭 Staged run: {len(runs)} files to run, {len(results)} up to date "
+                f"(concurrency={concurrency}, queue_size={queue_size})")
+    if not runs:
+        return results
+
+    started = time.perf_counter()
+    pipeline = StagedPipeline(PIPELINE_STAGES, concurrency, queue_size)
+    # Streamed insights are not echoed chunk by chunk: other stages print at the same time
+    items = (new_run(path, incremental=incremental, model=model, limiter=limiter, fingerprint=fingerprint,
+                     echo=False)
+             for path, fingerprint in runs)
+
+    for run in pipeline.run(items):
+        if "error" in run:
+            results.append({"path": run["path"], "status": "error", "fingerprint": run["fingerprint"],
+                            "error": run["error"], "failed_stage": run["failed_stage"],
+                            "stage_seconds": run.get("stage_seconds", {})})
+        else:
+            results.append({"path": run["path"], "status": "done", **run_result(run),
+                            "stage_seconds": run.get("stage_seconds", {})})
+    if pipeline.feed_error:
+        results.append({"path": None, "status": "error", "error": pipeline.feed_error})
+
+    logger.info(f"🏁 Staged run finished in {time.perf_counter() - started:.1f}s")
+    return results
+
+
+def _parse_concurrency(values: list[str]) -> dict:
+    parsed = {}
+    for value in values:
+        name, _, workers = value.partition("=")
+        parsed[name] = int(workers)
+    return parsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run the EDA pipeline with overlapping stages")
+    parser.add_argument("source", nargs="?", default="sample_source", help="directory of .xlsx files")
+    parser.add_argument("--concurrency", nargs="*", default=[], metavar="STAGE=N",
+                        help="workers per stage, e.g. annotate=4 insight=2")
+    parser.add_argument("--queue-size", type=int, default=2, help="files allowed to wait between stages")
+    parser.add_argument("--model", default="ollama", help="LLM backend")
+    parser.add_argument("--rps", type=float, default=2.0, help="LLM requests per second (0 = unlimited)")
+    parser.add_argument("--burst", type=int, default=1, help="rate limiter burst size")
+    parser.add_argument("--no-resume", action="store_true", help="re-run files that are already done")
+    args = parser.parse_args()
+
+    results = run_staged(
+        args.source,
+        concurrency=_parse_concurrency(args.concurrency),
+        queue_size=args.queue_size,
+        model=args.model,
+        requests_per_second=args.rps or None,
+        burst=args.burst,
+        resume=not args.no_resume,
+    )
+    for r in results:
+        print(f"{r['status']:>8}  {r['path']}  {r.get('stage_seconds', '')}"
+              + (f"  ({r['error']})" if "error" in r else ""))
+    return 1 if any(r["status"] == "error" for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
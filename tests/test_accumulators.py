@@ -0,0 +1,112 @@
+# tests/test_accumulators.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda_core.profile.accumulators import CategoricalAccumulator, NumericAccumulator, TableAccumulator
+
+
+def _numeric_series(rows: int = 20_000, seed: int = 0) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    values = rng.lognormal(3.0, 1.0, rows)
+    values[rng.random(rows) < 0.05] = np.nan
+    return pd.Series(values)
+
+
+def _chunks(series: pd.Series, size: int) -> list[pd.Series]:
+    return [series.iloc[i:i + size] for i in range(0, len(series), size)]
+
+
+def test_chunked_welford_matches_pandas():
+    series = _numeric_series()
+    acc = NumericAccumulator("x", "float64")
+    for chunk in _chunks(series, 3_001):
+        acc.update(chunk)
+    report = acc.finalize()
+
+    assert report["count"] == series.count()
+    assert report["missing"] == series.isna().sum()
+    assert report["mean"] == pytest.approx(series.mean(), rel=1e-12)
+    assert report["std"] == pytest.approx(series.std(), rel=1e-12)
+    assert report["min"] == series.min()
+    assert report["max"] == series.max()
+
+
+def test_merge_equals_single_pass():
+    series = _numeric_series()
+    single = NumericAccumulator("x", "float64")
+    single.update(series)
+
+    # Chan's formula: merging accumulators over disjoint, uneven parts gives the single-pass result
+    merged = NumericAccumulator("x", "float64")
+    for part in (series.iloc[:7], series.iloc[7:12_345], series.iloc[12_345:]):
+        acc = NumericAccumulator("x", "float64")
+        for chunk in _chunks(part, 1_000):
+            acc.update(chunk)
+        merged.merge(acc)
+
+    assert merged.count == single.count
+    assert merged.missing == single.missing
+    assert merged.mean == pytest.approx(single.mean, rel=1e-12)
+    assert merged.m2 == pytest.approx(single.m2, rel=1e-10)
+    assert (merged.min, merged.max) == (single.min, single.max)
+
+
+def test_merge_with_empty_accumulator():
+    series = _numeric_series(1_000)
+    acc = NumericAccumulator("x", "float64")
+    acc.update(series)
+    before = acc.finalize()
+
+    acc.merge(NumericAccumulator("x", "float64"))
+    empty = NumericAccumulator("x", "float64")
+    empty.merge(acc)
+
+    assert acc.finalize() == before
+    assert empty.finalize()["mean"] == before["mean"]
+
+
+def test_exact_quantiles_for_small_columns():
+    series = _numeric_series(150)
+    acc = NumericAccumulator("x", "float64")
+    acc.update(series)
+    report = acc.finalize()
+
+    assert not report["approximate"]
+    assert report["p25"] == pytest.approx(series.quantile(0.25))
+    assert report["median"] == pytest.approx(series.median())
+    assert report["p75"] == pytest.approx(series.quantile(0.75))
+
+
+def test_categorical_counts_match_value_counts():
+    rng = np.random.default_rng(1)
+    series = pd.Series(rng.choice(["a", "b", "c", "d", None], 5_000, p=[0.4, 0.3, 0.15, 0.1, 0.05]))
+    acc = CategoricalAccumulator("c", "object", top_k=3)
+    for chunk in _chunks(series, 700):
+        acc.update(chunk)
+    report = acc.finalize()
+
+    expected = series.value_counts()
+    assert report["count"] == series.count()
+    assert report["missing"] == series.isna().sum()
+    assert report["unique"] == series.nunique()
+    assert [v["value"] for v in report["top_k_values"]] == list(expected.index[:3])
+    assert [v["count"] for v in report["top_k_values"]] == list(expected.iloc[:3])
+
+
+def test_table_accumulator_merge():
+    df = pd.DataFrame({"num": _numeric_series(4_000), "cat": ["x", "y", "y", "z"] * 1_000})
+    left, right = TableAccumulator(), TableAccumulator()
+    left.update(df.iloc[:1_500])
+    right.update(df.iloc[1_500:])
+    left.merge(right)
+
+    single = TableAccumulator()
+    single.update(df)
+    merged_reports = {r["column"]: r for r in left.finalize()}
+    single_reports = {r["column"]: r for r in single.finalize()}
+
+    assert left.row_count == len(df)
+    assert merged_reports["cat"]["top_k_values"] == single_reports["cat"]["top_k_values"]
+    assert merged_reports["num"]["mean"] == pytest.approx(single_reports["num"]["mean"], rel=1e-12)
+    assert merged_reports["num"]["missing"] == single_reports["num"]["missing"]
@@ -0,0 +1,75 @@
+# tests/test_annotate_profile.py
+import pytest
+
+from ai.generate_ai_insight import annotate_profile
+from ai.models.fake_server import FakeLLMServer, register_fake_backend
+from ai.models.ollama_client import ERROR_RESPONSE
+
+
+@pytest.fixture(autouse=True)
+def no_llm_cache(monkeypatch):
+    monkeypatch.setenv("LLM_CACHE", "off")
+
+
+def _profiles(n: int) -> list[dict]:
+    return [{"column": f"col_{i}", "dtype": "float64", "count": 10, "mean": float(i)} for i in range(n)]
+
+
+def test_skip_annotated_only_retries_unusable_insights():
+    profiles = _profiles(5)
+    profiles[0]["ai_insight"] = "Looks fine."
+    profiles[1]["ai_insight"] = "[Error] timed out"
+    profiles[2]["ai_insight"] = ERROR_RESPONSE
+    profiles[3]["ai_insight"] = "   "
+
+    with FakeLLMServer(latency=0, tokens_per_sec=0) as server:
+        register_fake_backend(server, "fake_test")
+        annotate_profile(profiles, model="fake_test", requests_per_second=None, skip_annotated=True)
+        stats = server.stats()
+
+    assert stats["requests"] == 4
+    assert profiles[0]["ai_insight"] == "Looks fine."
+    assert all(p["ai_insight"] and not p["ai_insight"].startswith("[") for p in profiles[1:])
+
+
+def test_failed_columns_are_retried_on_the_next_run():
+    profiles = _profiles(3)
+    with FakeLLMServer(latency=0, tokens_per_sec=0, fail_first=1) as server:
+        register_fake_backend(server, "fake_test")
+        annotate_profile(profiles, model="fake_test", requests_per_second=None)
+        assert [p["ai_insight"] for p in profiles] == [ERROR_RESPONSE] * 3
+
+        annotate_profile(profiles, model="fake_test", requests_per_second=None, skip_annotated=True)
+        assert server.stats()["requests"] == 6
+        annotate_profile(profiles, model="fake_test", requests_per_second=None, skip_annotated=True)
+        assert server.stats()["requests"] == 6
+
+    assert all(p["ai_insight"] != ERROR_RESPONSE for p in profiles)
+
+
+def test_unparseable_batch_falls_back_to_single_columns():
+    profiles = _profiles(4)
+    with FakeLLMServer(latency=0, tokens_per_sec=0) as server:
+        register_fake_backend(server, "fake_test")
+        annotate_profile(profiles, model="fake_test", max_workers=2, requests_per_second=None, batch_size=2)
+        stats = server.stats()
+
+    # Two batch prompts (answered with plain text, not JSON), then one request per column
+    assert stats["requests"] == 2 + 4
+    assert [p["column"] for p in profiles] == [f"col_{i}" for i in range(4)]
+    assert all(p["ai_insight"] for p in profiles)
+
+
+def test_explicit_cache_is_used_instead_of_the_default(tmp_path):
+    from ai.llm_cache import LLMCache
+
+    cache = LLMCache(path=str(tmp_path / "llm_cache.sqlite"))
+    with FakeLLMServer(latency=0, tokens_per_sec=0) as server:
+        register_fake_backend(server, "fake_test")
+        annotate_profile(_profiles(3), model="fake_test", requests_per_second=None, cache=cache)
+        annotate_profile(_profiles(3), model="fake_test", requests_per_second=None, cache=cache)
+        stats = server.stats()
+
+    # LLM_CACHE=off only disables the default cache; the second run is served from this one
+    assert stats["requests"] == 3
+    assert cache.stats()["entries"] == 3
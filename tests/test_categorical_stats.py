@@ -0,0 +1,55 @@
+# tests/test_categorical_stats.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda_core.profile.categorical_stats import categorical_stats, string_value_counts
+
+
+def _exact_entropy(series: pd.Series) -> float:
+    probs = series.astype(str).value_counts(normalize=True)
+    return float(-(probs * np.log2(probs)).sum())
+
+
+def test_matches_value_counts():
+    rng = np.random.default_rng(0)
+    series = pd.Series(rng.choice(["a", "b", "c", "d", "e", "f", None], 10_000))
+    stats = categorical_stats(series, top_k=3)
+
+    expected = series.value_counts()
+    assert stats["count"] == series.count()
+    assert stats["missing"] == series.isna().sum()
+    assert stats["unique"] == series.nunique()
+    assert stats["mode"] == expected.index[0]
+    assert [(v["value"], v["count"]) for v in stats["top_k_values"]] == list(expected.iloc[:3].items())
+    assert stats["entropy"] == pytest.approx(_exact_entropy(series.dropna()))
+
+
+def test_ties_keep_first_seen_order():
+    stats = categorical_stats(pd.Series(["b", "a", "c", "a", "b", "c"]), top_k=2)
+    assert [v["value"] for v in stats["top_k_values"]] == ["b", "a"]
+
+
+def test_values_with_the_same_string_form_are_merged():
+    series = pd.Series([1, "1", "1", 2, None, "b"], dtype=object)
+    stats = categorical_stats(series)
+
+    assert stats["unique"] == 3
+    assert stats["mode"] == "1"
+    assert stats["top_k_values"][0] == {"value": "1", "count": 3, "pct": 0.6}
+    assert string_value_counts(series).to_dict() == {"1": 3, "2": 1, "b": 1}
+
+
+def test_categorical_dtype_skips_unused_categories():
+    series = pd.Series(pd.Categorical(["x", "y", "x"], categories=["x", "y", "z"]))
+    stats = categorical_stats(series)
+    assert stats["unique"] == 2
+    assert [v["value"] for v in stats["top_k_values"]] == ["x", "y"]
+
+
+def test_all_missing():
+    stats = categorical_stats(pd.Series([None, None], dtype=object))
+    assert (stats["count"], stats["missing"], stats["unique"]) == (0, 2, 0)
+    assert stats["mode"] is None
+    assert stats["top_k_values"] == []
+    assert stats["entropy"] == 0.0
@@ -0,0 +1,40 @@
+# tests/test_column_report.py
+import numpy as np
+import pandas as pd
+import pytest
+
+import eda_core.plots.plot_utils as plot_utils
+from eda_core.profile.column_report import column_report
+from eda_core.utils.persist_metadata import serialize_profile
+
+
+@pytest.fixture
+def overview_calls(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls = []
+    monkeypatch.setattr(plot_utils, "plot_small_multiples",
+                        lambda histograms, source_filename, **kw: calls.append([h[0] for h in histograms]) or [])
+    return calls
+
+
+def _frame(seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "a": rng.normal(size=200),
+        "b": rng.integers(0, 10, 200),
+        "c": rng.lognormal(size=200),
+        "label": rng.choice(["x", "y"], 200),
+    })
+
+
+@pytest.mark.parametrize("plots", ["lazy", "eager"])
+def test_incremental_overview_covers_every_numeric_column(overview_calls, plots):
+    df = _frame()
+    reports = column_report(df, "sample.xlsx", incremental=True, plots=plots, overview=True)
+    serialize_profile(reports, "sample.xlsx")
+
+    df["b"] = df["b"] + 1
+    column_report(df, "sample.xlsx", incremental=True, plots=plots, overview=True)
+
+    # Second run re-profiles only "b", but the overview still shows the whole table
+    assert overview_calls == [["a", "b", "c"], ["a", "b", "c"]]
@@ -0,0 +1,66 @@
+# tests/test_fake_server.py
+import pytest
+
+import ai.models.openai_client as openai_client
+from ai.llm_cache import LLMCache
+from ai.llm_client import query_model
+from ai.models.fake_server import FakeLLMServer, register_fake_backend
+from ai.models.ollama_client import ERROR_RESPONSE
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LLMCache(path=str(tmp_path / "llm_cache.sqlite"))
+
+
+def test_responses_are_deterministic():
+    with FakeLLMServer(latency=0, tokens_per_sec=0, tokens=5) as server:
+        register_fake_backend(server, "fake_test")
+        first = query_model("describe x", model="fake_test", cache=False)
+        second = query_model("describe x", model="fake_test", cache=False)
+
+    assert first == second == server.response_for("describe x")
+    assert len(first.split()) == 5
+
+
+def test_ollama_error_is_reported_and_not_cached(cache):
+    with FakeLLMServer(latency=0, tokens_per_sec=0, fail_first=1) as server:
+        register_fake_backend(server, "fake_test")
+        failed = query_model("describe x", model="fake_test", cache=cache)
+        answered = query_model("describe x", model="fake_test", cache=cache)
+        cached = query_model("describe x", model="fake_test", cache=cache)
+        stats = server.stats()
+
+    assert failed == ERROR_RESPONSE
+    assert answered == cached == server.response_for("describe x")
+    # The fallback text was not cached, so the second call reached the server; the third did not
+    assert (stats["requests"], stats["errors"]) == (2, 1)
+
+
+@pytest.mark.parametrize("fail_first, succeeds", [(2, True), (3, False)])
+def test_openai_backend_retries(monkeypatch, fail_first, succeeds):
+    pytest.importorskip("openai")
+    monkeypatch.setattr(openai_client.time, "sleep", lambda seconds: None)
+    with FakeLLMServer(latency=0, tokens_per_sec=0, fail_first=fail_first, error_status=503) as server:
+        register_fake_backend(server, "fake_openai", api="openai")
+        response = query_model("describe x", model="fake_openai", cache=False)
+        stats = server.stats()
+
+    # max_retries=3 attempts per prompt
+    assert stats["requests"] == 3
+    assert (response == openai_client.ERROR_RESPONSE) != succeeds
+
+
+def test_stats_track_concurrency():
+    from concurrent.futures import ThreadPoolExecutor
+
+    with FakeLLMServer(latency=0.2, tokens_per_sec=0) as server:
+        register_fake_backend(server, "fake_test", max_connections=4)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda i: query_model(f"prompt {i}", model="fake_test", cache=False), range(8)))
+        stats = server.stats()
+
+    assert stats["requests"] == 8
+    assert 1 < stats["peak_in_flight"] <= 4
+    # Pooled keep-alive connections are reused across requests
+    assert stats["connections"] <= 4
@@ -0,0 +1,101 @@
+# tests/test_llm_cache.py
+import pytest
+
+import ai.llm_cache as llm_cache
+from ai.llm_cache import LLMCache, make_cache_key
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(llm_cache.time, "time", clock)
+    return clock
+
+
+def _cache(tmp_path, **kwargs) -> LLMCache:
+    return LLMCache(path=str(tmp_path / "llm_cache.sqlite"), **kwargs)
+
+
+def test_key_ignores_whitespace_but_not_model():
+    key = make_cache_key("ollama", "llama3", "Describe  column\n x")
+    assert key == make_cache_key("ollama", "llama3", "Describe column x")
+    assert key != make_cache_key("ollama", "mistral", "Describe column x")
+    assert key != make_cache_key("openai", "llama3", "Describe column x")
+
+
+def test_hit_and_miss_counters(tmp_path, clock):
+    cache = _cache(tmp_path)
+    assert cache.get("k") is None
+    cache.set("k", "insight")
+    assert cache.get("k") == "insight"
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    assert stats["bytes"] == len("insight")
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    cache = _cache(tmp_path, ttl_seconds=60)
+    cache.set("k", "insight")
+
+    clock.now += 59
+    assert cache.get("k") == "insight"
+    clock.now += 2
+    assert cache.get("k") is None
+    # The expired row is removed, not just skipped
+    assert cache.stats()["entries"] == 0
+
+
+def test_no_ttl_never_expires(tmp_path, clock):
+    cache = _cache(tmp_path, ttl_seconds=None)
+    cache.set("k", "insight")
+    clock.now += 10 * 365 * 24 * 3600
+    assert cache.get("k") == "insight"
+
+
+def test_evicts_least_recently_used_by_entries(tmp_path, clock):
+    cache = _cache(tmp_path, max_entries=2)
+    cache.set("a", "1")
+    clock.now += 1
+    cache.set("b", "2")
+    clock.now += 1
+    assert cache.get("a") == "1"  # "b" is now the least recently used
+    clock.now += 1
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+    assert cache.evictions == 1
+
+
+def test_evicts_by_total_bytes(tmp_path, clock):
+    cache = _cache(tmp_path, max_bytes=10)
+    for i, key in enumerate("abc"):
+        clock.now += 1
+        cache.set(key, str(i) * 4)
+
+    stats = cache.stats()
+    assert stats["bytes"] <= 10
+    assert stats["entries"] == 2
+    assert cache.get("a") is None
+
+
+def test_clear(tmp_path, clock):
+    cache = _cache(tmp_path)
+    cache.set("k", "insight")
+    cache.clear()
+    assert cache.get("k") is None
+
+
+def test_default_cache_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("LLM_CACHE", "off")
+    assert llm_cache.get_default_cache() is None
@@ -0,0 +1,41 @@
+# tests/test_profile_numeric_table.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda_core.profile.profile_numeric import numeric_block_columns, profile_numeric_table
+
+
+def _frame(rows: int = 1_000, cols: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({f"c{i}": rng.lognormal(i % 3, 1, rows) for i in range(cols)})
+    df.iloc[::13, 2] = np.nan
+    df["label"] = "x"
+    return df
+
+
+def test_block_columns_follow_row_count():
+    budget = 256 * 1024 * 1024
+    assert numeric_block_columns(2_000_000, budget) == 16
+    assert numeric_block_columns(10_000, budget) == 3355
+    assert numeric_block_columns(100_000_000, budget) == 1
+    assert numeric_block_columns(0, budget) == budget // 8
+
+
+@pytest.mark.parametrize("block_bytes", [8 * 1_000, 8 * 1_000 * 3, 256 * 1024 * 1024])
+def test_results_do_not_depend_on_block_size(block_bytes):
+    df = _frame()
+    stats = profile_numeric_table(df, block_bytes=block_bytes)
+
+    assert list(stats) == [f"c{i}" for i in range(7)]
+    for col, s in stats.items():
+        series = df[col]
+        assert s["count"] == series.count()
+        assert s["missing"] == series.isna().sum()
+        assert s["mean"] == pytest.approx(series.mean())
+        assert s["std"] == pytest.approx(series.std())
+        assert [s["min"], s["p25"], s["median"], s["p75"], s["max"]] == pytest.approx(
+            [series.min(), *series.quantile([0.25, 0.5, 0.75]), series.max()])
+        iqr = s["p75"] - s["p25"]
+        outliers = ((series < s["p25"] - 1.5 * iqr) | (series > s["p75"] + 1.5 * iqr)).sum()
+        assert s["outlier_count"] == outliers
@@ -0,0 +1,94 @@
+# tests/test_prompt_budget.py
+import csv
+import io
+import json
+
+from ai.prompt_budget import (
+    PROMPT_FIELDS, anomaly_flags, build_map_prompts, build_reduce_prompt, build_table_prompt,
+    encode_profiles, estimate_tokens, split_profiles,
+)
+
+SUMMARY = {"row_count": 1000, "column_count": 300, "missing_pct": 0.02, "column_types": {"numeric": 300}}
+
+
+def _profile(i: int, anomalous: bool = False) -> dict:
+    return {
+        "column": f"col_{i}",
+        "dtype": "float64",
+        "count": 1000,
+        "missing": 900 if anomalous else 0,
+        "missing_pct": 0.9 if anomalous else 0.0,
+        "high_missing": anomalous,
+        "unique": 1000,
+        "mean": 10.123456789,
+        "std": 2.5,
+        "min": 0.0,
+        "median": 10.0,
+        "max": 20.0,
+        "outlier_count": 0,
+        "plot_spec": {"bins": list(range(50))},
+        "plot_path": f"outputs/plots/col_{i}.png",
+    }
+
+
+def _csv_rows(prompt: str) -> list[dict]:
+    table = prompt.split("COLUMN PROFILES (CSV):\n", 1)[1].split("\n\n", 1)[0]
+    return list(csv.DictReader(io.StringIO(table)))
+
+
+def test_encoding_is_compact_and_leaves_out_bulk_fields():
+    profiles = [_profile(i) for i in range(20)]
+    encoded = encode_profiles(profiles)
+
+    rows = list(csv.reader(io.StringIO(encoded)))
+    assert rows[0] == PROMPT_FIELDS
+    assert len(rows) == 21
+    assert "plot" not in encoded
+    assert rows[1][PROMPT_FIELDS.index("mean")] == "10.12"
+    assert estimate_tokens(encoded) * 5 < estimate_tokens(json.dumps(profiles, indent=2))
+
+
+def test_anomaly_flags():
+    assert anomaly_flags({"error": "boom", "missing_pct": 1.0}) == ["error"]
+    assert "high_missing" in anomaly_flags(_profile(0, anomalous=True))
+    assert anomaly_flags({"count": 10, "unique": 1}) == ["constant"]
+
+
+def test_small_table_is_not_truncated():
+    profiles = [_profile(i) for i in range(5)]
+    prompt = build_table_prompt(SUMMARY, profiles, token_budget=6000)
+    assert [r["column"] for r in _csv_rows(prompt)] == [p["column"] for p in profiles]
+    assert "omitted" not in prompt
+
+
+def test_wide_table_fits_budget_and_keeps_anomalous_columns():
+    profiles = [_profile(i, anomalous=i % 50 == 7) for i in range(300)]
+    budget = 1500
+    prompt = build_table_prompt(SUMMARY, profiles, token_budget=budget)
+
+    assert estimate_tokens(prompt) <= budget
+    kept = [r["column"] for r in _csv_rows(prompt)]
+    assert 0 < len(kept) < len(profiles)
+    assert {f"col_{i}" for i in range(7, 300, 50)} <= set(kept)
+    # Kept columns stay in their original order
+    assert kept == sorted(kept, key=lambda name: int(name.split("_")[1]))
+    assert f"NOTE: {len(profiles) - len(kept)} of {len(profiles)} columns omitted" in prompt
+
+
+def test_map_prompts_cover_every_column_within_budget():
+    profiles = [_profile(i) for i in range(300)]
+    budget = 1500
+    groups = split_profiles(profiles, token_budget=budget)
+    prompts = build_map_prompts(profiles, token_budget=budget)
+
+    assert len(prompts) == len(groups) > 1
+    assert [p for group in groups for p in group] == profiles
+    assert all(estimate_tokens(prompt) <= budget for prompt in prompts)
+    assert f"part 1 of {len(groups)}" in prompts[0]
+
+
+def test_reduce_prompt_lists_each_group():
+    prompt = build_reduce_prompt(SUMMARY, ["first findings", "second findings"], tone="executive")
+    assert "Tone: executive" in prompt
+    assert "FINDINGS FOR GROUP 2:\nsecond findings" in prompt
+    assert "rows=1000" in prompt
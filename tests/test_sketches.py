@@ -0,0 +1,165 @@
+# tests/test_sketches.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda_core.profile.accumulators import CategoricalAccumulator
+from eda_core.profile.sketches import HyperLogLog, KLLSketch, SpaceSaving
+
+QS = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+
+
+def _rank_error(values: np.ndarray, estimate: float, q: float) -> float:
+    """Distance between q and the true rank range of `estimate` in `values`."""
+    lo = np.searchsorted(values, estimate, side="left") / len(values)
+    hi = np.searchsorted(values, estimate, side="right") / len(values)
+    return max(lo - q, q - hi, 0.0)
+
+
+@pytest.mark.parametrize("dist", ["normal", "lognormal", "integers"])
+def test_kll_quantiles_within_rank_bound(dist):
+    rng = np.random.default_rng(7)
+    n = 200_000
+    values = {
+        "normal": lambda: rng.normal(0, 1, n),
+        "lognormal": lambda: rng.lognormal(3, 1.5, n),
+        "integers": lambda: rng.integers(0, 50, n).astype(float),
+    }[dist]()
+    sketch = KLLSketch(k=200)
+    for chunk in np.array_split(values, 37):
+        sketch.update(chunk)
+
+    assert not sketch.is_exact
+    assert len(sketch) == n
+    ordered = np.sort(values)
+    for q, estimate in zip(QS, sketch.quantiles(QS)):
+        assert _rank_error(ordered, estimate, q) <= sketch.epsilon
+
+
+def test_kll_is_exact_for_small_inputs():
+    values = pd.Series(np.random.default_rng(1).normal(size=150))
+    sketch = KLLSketch(k=200)
+    sketch.update(values.to_numpy())
+
+    assert sketch.is_exact
+    assert sketch.quantiles(QS) == pytest.approx([values.quantile(q) for q in QS])
+
+
+def test_kll_ignores_nan():
+    sketch = KLLSketch(k=8)
+    sketch.update([1.0, np.nan, 3.0])
+    assert len(sketch) == 2
+    assert sketch.quantile(0.5) == 2.0
+
+
+def test_kll_merge_keeps_accuracy():
+    rng = np.random.default_rng(3)
+    parts = [rng.normal(i, 1, 50_000) for i in range(4)]
+    merged = KLLSketch(k=200, seed=0)
+    for i, part in enumerate(parts):
+        sketch = KLLSketch(k=200, seed=i + 1)
+        sketch.update(part)
+        merged.merge(sketch)
+
+    values = np.sort(np.concatenate(parts))
+    assert len(merged) == len(values)
+    for q, estimate in zip(QS, merged.quantiles(QS)):
+        assert _rank_error(values, estimate, q) <= merged.epsilon
+
+
+def test_kll_memory_is_bounded():
+    sketch = KLLSketch(k=200)
+    sketch.update(np.arange(1_000_000, dtype=float))
+    assert sum(len(level) for level in sketch.levels) < 3 * 200 + 2 * len(sketch.levels)
+
+
+def test_kll_fraction_outside():
+    values = np.random.default_rng(5).uniform(0, 1, 100_000)
+    sketch = KLLSketch(k=200)
+    sketch.update(values)
+    expected = np.mean((values < 0.1) | (values > 0.8))
+    assert sketch.fraction_outside(0.1, 0.8) == pytest.approx(expected, abs=2 * sketch.epsilon)
+
+
+def test_kll_from_error():
+    sketch = KLLSketch.from_error(0.01)
+    assert sketch.epsilon <= 0.01
+    with pytest.raises(ValueError):
+        KLLSketch(k=4)
+
+
+def _split(series: pd.Series, parts: int) -> list[pd.Series]:
+    size = -(-len(series) // parts)
+    return [series.iloc[i:i + size] for i in range(0, len(series), size)]
+
+
+def _zipf_series(n: int, seed: int = 0) -> pd.Series:
+    ranks = np.random.default_rng(seed).zipf(1.3, n)
+    return pd.Series(np.char.add("v", ranks.astype(str)).astype(object))
+
+
+@pytest.mark.parametrize("distinct", [100, 5_000, 200_000])
+def test_hll_estimate_within_error(distinct):
+    hll = HyperLogLog(p=14)
+    values = pd.Series([f"id_{i}" for i in range(distinct)] * 2)
+    for chunk in _split(values, 5):
+        hll.update(chunk)
+    # 1.04 / sqrt(2^14) = 0.8% standard error; allow four of them
+    assert hll.estimate() == pytest.approx(distinct, rel=4 * 1.04 / np.sqrt(hll.m))
+
+
+def test_hll_merge_is_union():
+    left, right, both = HyperLogLog(), HyperLogLog(), HyperLogLog()
+    a = pd.Series(np.arange(0, 60_000))
+    b = pd.Series(np.arange(40_000, 100_000))
+    left.update(a)
+    right.update(b)
+    both.update(pd.concat([a, b]))
+    left.merge(right)
+
+    assert np.array_equal(left.registers, both.registers)
+    with pytest.raises(ValueError):
+        left.merge(HyperLogLog(p=10))
+
+
+def test_space_saving_top_k_matches_value_counts():
+    series = _zipf_series(200_000)
+    exact = series.value_counts()
+    summary = SpaceSaving(capacity=500)
+    for chunk in _split(series, 20):
+        summary.update_counts(chunk.value_counts())
+
+    top = summary.top(10)
+    assert [v for v, _, _ in top] == list(exact.index[:10])
+    for value, count, error in top:
+        # count is an upper bound and count - error a lower bound
+        assert count - error <= exact[value] <= count
+
+
+def test_space_saving_keeps_every_heavy_hitter_after_merge():
+    series = _zipf_series(100_000, seed=1)
+    exact = series.value_counts()
+    merged = SpaceSaving(capacity=200)
+    for part in _split(series, 4):
+        summary = SpaceSaving(capacity=200)
+        summary.update_counts(part.value_counts())
+        merged.merge(summary)
+
+    heavy = exact[exact > len(series) / merged.capacity]
+    assert set(heavy.index) <= set(merged.counts.index)
+    for value in heavy.index:
+        assert merged.counts[value] - merged.errors[value] <= exact[value] <= merged.counts[value]
+
+
+def test_sketched_categorical_accumulator():
+    series = pd.concat([_zipf_series(50_000, seed=2), pd.Series([f"id_{i}" for i in range(20_000)])])
+    acc = CategoricalAccumulator("c", "object", top_k=5, exact_threshold=1_000)
+    for chunk in _split(series, 10):
+        acc.update(chunk)
+    report = acc.finalize()
+
+    exact = series.value_counts()
+    assert report["approximate"]
+    assert report["count"] == len(series)
+    assert report["unique"] == pytest.approx(series.nunique(), rel=0.05)
+    assert [v["value"] for v in report["top_k_values"]] == list(exact.index[:5])